@@ -9,3 +9,4 @@ class AuthConfig:
     bot_username: str
     auth_url: str
     bot_token: str
+    user_cache_ttl: timedelta = timedelta(seconds=60)
@@ -9,13 +9,16 @@ from common.config.models.main import Config
 @dataclass
 class ApiConfig(Config):
     auth: AuthConfig
+    # сколько байт ответов по завершённым играм держать в памяти
+    response_cache_bytes: int = 64 * 2**20
 
     @classmethod
-    def from_base(cls, base: Config, auth: AuthConfig):
+    def from_base(cls, base: Config, auth: AuthConfig, response_cache_bytes: int = 64 * 2**20):
         return cls(
             paths=base.paths,
             db=base.db,
             redis=base.redis,
             auth=auth,
             file_storage_config=base.file_storage_config,
+            response_cache_bytes=response_cache_bytes,
         )
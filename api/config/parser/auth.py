@@ -10,4 +10,5 @@ def load_auth(dct: dict) -> AuthConfig:
         bot_token=dct["bot-token"],
         bot_username=dct["bot-username"],
         auth_url=dct["auth-url"],
+        user_cache_ttl=timedelta(seconds=dct.get("user-cache-seconds", 60)),
     )
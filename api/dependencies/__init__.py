@@ -4,10 +4,12 @@ from sqlalchemy.orm import sessionmaker
 
 from api.config.models.main import ApiConfig
 from api.dependencies.auth import get_current_user, AuthProvider
+from api.dependencies.cache import response_cache_provider, ResponseCache
 from api.dependencies.db import DbProvider, dao_provider
-from api.dependencies.game import active_game_provider, db_game_provider
-from api.dependencies.player import player_provider, db_player_provider
-from api.dependencies.team import team_provider, db_team_provider
+from api.dependencies.game import active_game_provider
+from api.dependencies.identity import IdentityProvider
+from api.dependencies.player import player_provider
+from api.dependencies.team import team_provider
 
 
 def setup(app: FastAPI, pool: sessionmaker, redis: Redis, config: ApiConfig):
@@ -18,7 +20,10 @@ def setup(app: FastAPI, pool: sessionmaker, redis: Redis, config: ApiConfig):
 
     app.dependency_overrides[get_current_user] = auth_provider.get_current_user
     app.dependency_overrides[dao_provider] = db_provider.dao
+    response_cache = ResponseCache(config.response_cache_bytes)
+    app.dependency_overrides[response_cache_provider] = lambda: response_cache
     app.dependency_overrides[AuthProvider] = lambda: auth_provider
-    app.dependency_overrides[player_provider] = db_player_provider
-    app.dependency_overrides[team_provider] = db_team_provider
-    app.dependency_overrides[active_game_provider] = db_game_provider
+    identity_provider = IdentityProvider(config.auth.user_cache_ttl)
+    app.dependency_overrides[player_provider] = identity_provider.player
+    app.dependency_overrides[team_provider] = identity_provider.team
+    app.dependency_overrides[active_game_provider] = identity_provider.active_game
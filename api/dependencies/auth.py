@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import hmac
 import logging
@@ -11,10 +12,12 @@ from starlette import status
 from starlette.responses import HTMLResponse
 
 from api.config.models.auth import AuthConfig
+from api.dependencies.cache import TtlCache
 from api.dependencies.db import dao_provider
 from api.models.auth import UserTgAuth, Token
 from infrastructure.db.dao.holder import HolderDao
 from shvatka.models import dto
+from shvatka.services.player import upsert_player
 from shvatka.services.user import upsert_user
 from shvatka.utils.datetime_utils import tz_utc
 from shvatka.utils.exceptions import NoUsernameFound
@@ -52,6 +55,8 @@ class AuthProvider:
         self.secret_key = config.secret_key
         self.algorythm = "HS256"
         self.access_token_expire = config.token_expire
+        # пользователи, уже проверенные по токену, по id из токена
+        self.user_cache: TtlCache[int, dto.User] = TtlCache(config.user_cache_ttl)
         self.router = APIRouter()
         self.setup_auth_routes()
 
@@ -61,6 +66,13 @@ class AuthProvider:
     def get_password_hash(self, password: str) -> str:
         return self.pwd_context.hash(password)
 
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        # bcrypt занимает ~100мс CPU, в event loop это блокирует все остальные запросы
+        return await asyncio.to_thread(self.verify_password, plain_password, hashed_password)
+
+    async def get_password_hash_async(self, password: str) -> str:
+        return await asyncio.to_thread(self.get_password_hash, password)
+
     async def authenticate_user(self, username: str, password: str, dao: HolderDao) -> dto.User:
         http_status_401 = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -71,7 +83,7 @@ class AuthProvider:
             user = await dao.user.get_by_username_with_password(username)
         except NoUsernameFound:
             raise http_status_401
-        if not self.verify_password(password, user.hashed_password or ""):
+        if not await self.verify_password_async(password, user.hashed_password or ""):
             raise http_status_401
         return user.without_password()
 
@@ -84,7 +96,8 @@ class AuthProvider:
 
     def create_user_token(self, user: dto.User) -> Token:
         return self.create_access_token(
-            data={"sub": user.username}, expires_delta=self.access_token_expire
+            data={"sub": user.username, "id": user.db_id, "tg_id": user.tg_id},
+            expires_delta=self.access_token_expire,
         )
 
     async def get_current_user(
@@ -104,10 +117,20 @@ class AuthProvider:
                 raise credentials_exception
         except JWTError:
             raise credentials_exception
+        db_id: int | None = payload.get("id")
+        tg_id: int | None = payload.get("tg_id")
+        if db_id is not None and (user := self.user_cache.get(db_id)) is not None:
+            if user.tg_id == tg_id:
+                return user
         try:
             user = await dao.user.get_by_username(username=username)
         except NoUsernameFound:
             raise credentials_exception
+        if db_id is not None and (user.db_id != db_id or user.tg_id != tg_id):
+            # username перешёл к другому пользователю
+            raise credentials_exception
+        if user.db_id is not None:
+            self.user_cache.set(user.db_id, user)
         return user
 
     async def login(
@@ -116,6 +139,8 @@ class AuthProvider:
         dao: HolderDao = Depends(dao_provider),
     ) -> Token:
         user = await self.authenticate_user(form_data.username, form_data.password, dao)
+        # игрок создаётся только при входе, запросы с токеном его уже не пишут
+        await upsert_player(user, dao.player)
         return self.create_user_token(user)
 
     async def tg_login_page(self):
@@ -130,8 +155,9 @@ class AuthProvider:
         dao: HolderDao = Depends(dao_provider),
     ) -> Token:
         check_tg_hash(user, self.config.bot_token)
-        await upsert_user(user.to_dto(), dao.user)
-        return self.create_user_token(user.to_dto())
+        saved_user = await upsert_user(user.to_dto(), dao.user)
+        await upsert_player(saved_user, dao.player)
+        return self.create_user_token(saved_user)
 
     def setup_auth_routes(self):
         self.router.add_api_route("/auth/token", self.login, methods=["POST"])
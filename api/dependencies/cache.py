@@ -0,0 +1,98 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def response_cache_provider() -> "ResponseCache":
+    raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+
+    def matches(self, if_none_match: str | None) -> bool:
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag in tags
+
+
+class ResponseCache:
+    """
+    Готовые ответы по неизменяемым ресурсам (завершённые игры) в памяти процесса.
+    Размер ограничен суммой длин тел, при переполнении выкидываются
+    давно не запрошенные
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._responses: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    def get(self, key: str) -> CachedResponse | None:
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+        return response
+
+    def put(self, key: str, body: bytes) -> CachedResponse:
+        response = CachedResponse(body=body, etag=make_etag(body))
+        if len(body) > self.max_bytes:
+            return response
+        if (old := self._responses.pop(key, None)) is not None:
+            self.size -= len(old.body)
+        self._responses[key] = response
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self._responses.popitem(last=False)
+            self.size -= len(evicted.body)
+        return response
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest() + '"'
+
+
+class TtlCache(Generic[K, V]):
+    """
+    Значения в памяти процесса на ttl, чтобы не ходить в БД на каждый запрос.
+    Изменения увидим не позже чем через ttl
+    """
+
+    def __init__(self, ttl: timedelta, max_size: int = 10_000):
+        self.ttl = ttl.total_seconds()
+        self.max_size = max_size
+        self._values: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        cached = self._values.get(key)
+        if cached is None:
+            return None
+        expire_at, value = cached
+        if expire_at < time.monotonic():
+            del self._values[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if self.ttl <= 0:
+            return
+        if len(self._values) >= self.max_size:
+            self._drop_expired()
+        if len(self._values) >= self.max_size:
+            # самый старый по времени добавления
+            del self._values[next(iter(self._values))]
+        self._values[key] = (time.monotonic() + self.ttl, value)
+
+    def _drop_expired(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, (expire_at, _) in self._values.items() if expire_at < now]:
+            del self._values[key]
@@ -2,7 +2,7 @@ from redis.asyncio.client import Redis
 from sqlalchemy.orm import sessionmaker
 
 from infrastructure.db.dao.holder import HolderDao
-from infrastructure.db.dao.memory.level_testing import LevelTestingData
+from infrastructure.db.faсtory import create_level_test_dao
 
 
 def dao_provider() -> HolderDao:
@@ -13,7 +13,7 @@ class DbProvider:
     def __init__(self, pool: sessionmaker, redis: Redis):
         self.pool = pool
         self.redis = redis
-        self.level_test = LevelTestingData()
+        self.level_test = create_level_test_dao(redis)
 
     async def dao(self):
         async with self.pool() as session:
@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from fastapi import HTTPException
+from fastapi.params import Depends
+from sqlalchemy.exc import NoResultFound
+from starlette import status
+
+from api.dependencies.auth import get_current_user
+from api.dependencies.cache import TtlCache
+from api.dependencies.db import dao_provider
+from api.dependencies.player import player_provider
+from infrastructure.db.dao.holder import HolderDao
+from shvatka.models import dto
+from shvatka.services.game import get_active
+from shvatka.services.player import get_player_by_user, get_my_team
+from shvatka.utils import exceptions
+
+
+class IdentityProvider:
+    """
+    Игрок, его команда и активная игра по id пользователя из токена на ttl,
+    чтобы авторизованные GET не ходили в БД.
+    Игрок создаётся только при входе (AuthProvider), здесь его только читаем.
+    Отсутствие команды или активной игры не кэшируем,
+    чтобы вступление в команду и новую игру видеть сразу
+    """
+
+    def __init__(self, ttl: timedelta):
+        self.players: TtlCache[int, dto.Player] = TtlCache(ttl)
+        self.teams: TtlCache[int, dto.Team] = TtlCache(ttl)
+        self.games: TtlCache[int, dto.Game] = TtlCache(ttl)
+
+    async def player(
+        self,
+        dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+        user: dto.User = Depends(get_current_user),  # type: ignore[assignment]
+    ) -> dto.Player:
+        assert user.db_id is not None
+        if (player := self.players.get(user.db_id)) is not None:
+            return player
+        try:
+            player = await get_player_by_user(user, dao.player)
+        except NoResultFound:
+            # токен выдан до того, как игрок создавался при входе
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Player not found, login again",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        self.players.set(user.db_id, player)
+        return player
+
+    async def team(
+        self,
+        dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+        player: dto.Player = Depends(player_provider),  # type: ignore[assignment]
+    ) -> dto.Team:
+        if (team := self.teams.get(player.id)) is not None:
+            return team
+        team = await get_my_team(player, dao.team_player)
+        if team is None:
+            raise exceptions.PlayerNotInTeam()
+        self.teams.set(player.id, team)
+        return team
+
+    async def active_game(
+        self,
+        player: dto.Player = Depends(player_provider),  # type: ignore[assignment]
+        dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+    ) -> dto.Game:
+        if (game := self.games.get(player.id)) is not None:
+            return game
+        game = await get_active(dao.active_game_router, player=player)
+        if game is not None:
+            self.games.set(player.id, game)
+        return game  # type: ignore[return-value]
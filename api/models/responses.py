@@ -3,6 +3,7 @@ from datetime import datetime
 
 from shvatka.models import dto
 from shvatka.models.dto import Player
+from shvatka.models.dto.scn.level import LevelScenario
 from shvatka.models.enums import GameStatus
 
 
@@ -23,3 +24,148 @@ class Game:
             status=core.status,
             start_at=core.start_at,
         )
+
+
+@dataclass
+class CompletedGame(Game):
+    number: int | None
+
+    @classmethod
+    def from_core(cls, core: dto.Game):
+        return cls(
+            id=core.id,
+            author=core.author,
+            name=core.name,
+            status=core.status,
+            start_at=core.start_at,
+            number=core.number,
+        )
+
+
+@dataclass
+class Level:
+    number_in_game: int | None
+    name_id: str
+    scenario: LevelScenario
+
+    @classmethod
+    def from_core(cls, core: dto.Level):
+        return cls(
+            number_in_game=core.number_in_game,
+            name_id=core.name_id,
+            scenario=core.scenario,
+        )
+
+
+@dataclass
+class FullGame(CompletedGame):
+    levels: list[Level]
+
+    @classmethod
+    def from_core(cls, core: dto.FullGame):
+        return cls(
+            id=core.id,
+            author=core.author,
+            name=core.name,
+            status=core.status,
+            start_at=core.start_at,
+            number=core.number,
+            levels=[Level.from_core(level) for level in core.levels],
+        )
+
+
+@dataclass
+class LevelTime:
+    level_number: int
+    start_at: datetime
+    is_finished: bool
+
+
+@dataclass
+class TeamResults:
+    team_id: int
+    team_name: str
+    level_times: list[LevelTime]
+
+    @classmethod
+    def from_core(cls, team: dto.Team, level_times: list[dto.LevelTimeOnGame]):
+        return cls(
+            team_id=team.id,
+            team_name=team.name,
+            level_times=[
+                LevelTime(
+                    level_number=lt.level_number, start_at=lt.start_at, is_finished=lt.is_finished
+                )
+                for lt in level_times
+            ],
+        )
+
+
+@dataclass
+class Key:
+    text: str
+    is_correct: bool
+    is_duplicate: bool
+    at: datetime
+    level_number: int
+    player_id: int
+
+
+@dataclass
+class TeamKeys:
+    team_id: int
+    team_name: str
+    keys: list[Key]
+
+    @classmethod
+    def from_core(cls, team: dto.Team, keys: list[dto.KeyTime]):
+        return cls(
+            team_id=team.id,
+            team_name=team.name,
+            keys=[
+                Key(
+                    text=key.text,
+                    is_correct=key.is_correct,
+                    is_duplicate=key.is_duplicate,
+                    at=key.at,
+                    level_number=key.level_number,
+                    player_id=key.player.id,
+                )
+                for key in keys
+            ],
+        )
+
+
+@dataclass
+class TeamRating:
+    team_id: int
+    team_name: str
+    rating: float
+    games_count: int
+
+    @classmethod
+    def from_core(cls, core: dto.TeamRating):
+        return cls(
+            team_id=core.team.id,
+            team_name=core.team.name,
+            rating=core.rating,
+            games_count=core.games_count,
+        )
+
+
+@dataclass
+class PlayerRating:
+    player_id: int
+    player_name: str
+    rating: float
+    games_count: int
+
+    @classmethod
+    def from_core(cls, core: dto.PlayerRating):
+        return cls(
+            player_id=core.player.id,
+            # без username и tg_id - рейтинг публичный
+            player_name=core.player.user.fullname,
+            rating=core.rating,
+            games_count=core.games_count,
+        )
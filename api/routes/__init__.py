@@ -1,9 +1,11 @@
 from fastapi import APIRouter
 
-from api.routes import user, game, team
+from api.routes import user, game, team, rating, archive
 
 
 def setup(router: APIRouter):
     user.setup(router)
     game.setup(router)
     team.setup(router)
+    rating.setup(router)
+    archive.setup(router)
@@ -0,0 +1,128 @@
+import json
+from typing import Any, Awaitable, Callable
+
+from fastapi import APIRouter, Request, HTTPException, Header
+from fastapi.encoders import jsonable_encoder
+from fastapi.params import Depends
+from starlette import status
+from starlette.responses import Response
+
+from api.dependencies import dao_provider, response_cache_provider, ResponseCache
+from api.models import responses
+from infrastructure.db.dao.holder import HolderDao
+from shvatka.services.game import get_completed_games, get_completed_game, get_game
+from shvatka.services.game_stat import get_completed_game_stat, get_completed_game_keys
+from shvatka.utils.exceptions import GameNotCompleted
+
+# завершённая игра больше не меняется, кешировать её можно сколько угодно
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+async def get_completed_games_list(
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> list[responses.CompletedGame]:
+    games = await get_completed_games(dao.game)
+    return [responses.CompletedGame.from_core(game) for game in games]
+
+
+async def get_completed_game_route(
+    id_: int,
+    request: Request,
+    if_none_match: str | None = Header(default=None),
+    cache: ResponseCache = Depends(response_cache_provider),  # type: ignore[assignment]
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> Response:
+    async def load() -> responses.FullGame:
+        return responses.FullGame.from_core(await get_completed_game(id_, dao.game))
+
+    return await cached_response(request, if_none_match, cache, load)
+
+
+async def get_completed_game_level(
+    id_: int,
+    number: int,
+    request: Request,
+    if_none_match: str | None = Header(default=None),
+    cache: ResponseCache = Depends(response_cache_provider),  # type: ignore[assignment]
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> Response:
+    async def load() -> responses.Level:
+        game = await get_completed_game(id_, dao.game)
+        for level in game.levels:
+            if level.number_in_game == number:
+                return responses.Level.from_core(level)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="no such level")
+
+    return await cached_response(request, if_none_match, cache, load)
+
+
+async def get_completed_game_results(
+    id_: int,
+    request: Request,
+    if_none_match: str | None = Header(default=None),
+    cache: ResponseCache = Depends(response_cache_provider),  # type: ignore[assignment]
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> Response:
+    async def load() -> list[responses.TeamResults]:
+        game = await get_game(id_, dao=dao.game)
+        stat = await get_completed_game_stat(game, dao.game_stat)
+        return [
+            responses.TeamResults.from_core(team, level_times)
+            for team, level_times in stat.level_times.items()
+        ]
+
+    return await cached_response(request, if_none_match, cache, load)
+
+
+async def get_completed_game_keys_route(
+    id_: int,
+    request: Request,
+    if_none_match: str | None = Header(default=None),
+    cache: ResponseCache = Depends(response_cache_provider),  # type: ignore[assignment]
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> Response:
+    async def load() -> list[responses.TeamKeys]:
+        game = await get_game(id_, dao=dao.game)
+        keys = await get_completed_game_keys(game, dao.typed_keys)
+        return [responses.TeamKeys.from_core(team, team_keys) for team, team_keys in keys.items()]
+
+    return await cached_response(request, if_none_match, cache, load)
+
+
+async def cached_response(
+    request: Request,
+    if_none_match: str | None,
+    cache: ResponseCache,
+    load: Callable[[], Awaitable[Any]],
+) -> Response:
+    """
+    Отдаёт ответ из кеша, в БД идёт только при первом запросе.
+    В кеш попадают только успешные ответы, то есть только завершённые игры
+    """
+    key = request.url.path
+    cached = cache.get(key)
+    if cached is None:
+        try:
+            result = await load()
+        except GameNotCompleted as e:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.notify_user)
+        body = json.dumps(jsonable_encoder(result), ensure_ascii=False).encode("utf-8")
+        cached = cache.put(key, body)
+    headers = {"ETag": cached.etag, "Cache-Control": IMMUTABLE}
+    if cached.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def setup(router: APIRouter):
+    router.add_api_route("/games/completed", get_completed_games_list, methods=["GET"])
+    router.add_api_route("/games/completed/{id_}", get_completed_game_route, methods=["GET"])
+    router.add_api_route(
+        "/games/completed/{id_}/levels/{number}", get_completed_game_level, methods=["GET"]
+    )
+    router.add_api_route(
+        "/games/completed/{id_}/results", get_completed_game_results, methods=["GET"]
+    )
+    router.add_api_route(
+        "/games/completed/{id_}/keys", get_completed_game_keys_route, methods=["GET"]
+    )
@@ -1,11 +1,24 @@
-from fastapi import APIRouter
+import json
+from datetime import datetime, timedelta
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Request, Header, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
 from fastapi.params import Depends
+from fastapi.responses import StreamingResponse
+from starlette import status
 
 from api.dependencies import dao_provider, player_provider, active_game_provider
 from api.models import responses
+from infrastructure.db.dao import GameEventsStream
 from infrastructure.db.dao.holder import HolderDao
 from shvatka.models import dto
-from shvatka.services.game import get_authors_games
+from shvatka.services.game import get_authors_games, get_game
+from shvatka.services.organizers import get_by_player, check_can_spy
+from shvatka.services.replay import get_standings_at, get_timeline
+from shvatka.utils.exceptions import GameNotCompleted
+
+EVENTS_BLOCK_MS = 15_000
 
 
 async def get_my_games_list(
@@ -21,6 +34,65 @@ async def get_active_game(
     return responses.Game.from_core(game)
 
 
+async def get_active_game_events(
+    request: Request,
+    last_event_id: str | None = Header(default=None),
+    player: dto.Player = Depends(player_provider),  # type: ignore[assignment]
+    game: dto.Game = Depends(active_game_provider),  # type: ignore[assignment]
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> StreamingResponse:
+    org = await get_by_player(game=game, player=player, dao=dao.organizer)
+    check_can_spy(org)
+    await dao.commit()  # события читаются только из redis, транзакцию держать незачем
+    return StreamingResponse(
+        stream_events(request, game, dao.game_events, last_event_id or "0"),
+        media_type="text/event-stream",
+    )
+
+
+async def stream_events(
+    request: Request, game: dto.Game, events: GameEventsStream, last_id: str
+) -> AsyncIterator[str]:
+    while not await request.is_disconnected():
+        batch = await events.read(game.id, last_id=last_id, block=EVENTS_BLOCK_MS)
+        if not batch:
+            yield ": keep-alive\n\n"
+            continue
+        for id_, event in batch:
+            last_id = id_
+            data = json.dumps(jsonable_encoder(event), ensure_ascii=False)
+            yield f"id: {id_}\nevent: {event.type.value}\ndata: {data}\n\n"
+
+
+async def get_game_standings(
+    id_: int,
+    at: datetime,
+    player: dto.Player = Depends(player_provider),  # type: ignore[assignment]
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> list[dto.TeamStanding]:
+    game = await get_game(id_, dao=dao.game)
+    try:
+        return await get_standings_at(game, at, dao.game_replay)
+    except GameNotCompleted as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.notify_user)
+
+
+async def get_game_timeline(
+    id_: int,
+    step_minutes: int = Query(default=15, ge=1),
+    player: dto.Player = Depends(player_provider),  # type: ignore[assignment]
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> list[dto.ReplayFrame]:
+    game = await get_game(id_, dao=dao.game)
+    try:
+        return await get_timeline(game, dao.game_replay, timedelta(minutes=step_minutes))
+    except GameNotCompleted as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.notify_user)
+
+
 def setup(router: APIRouter):
     router.add_api_route("/games/my", get_my_games_list, methods=["GET"])
     router.add_api_route("/games/active", get_active_game, methods=["GET"])
+    router.add_api_route("/games/active/events", get_active_game_events, methods=["GET"])
+    router.add_api_route("/games/{id_}/replay", get_game_standings, methods=["GET"])
+    router.add_api_route("/games/{id_}/replay/timeline", get_game_timeline, methods=["GET"])
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Query
+
+from api.dependencies import dao_provider
+from api.models import responses
+from infrastructure.db.dao.holder import HolderDao
+from shvatka.services.rating import get_teams_leaderboard, get_players_leaderboard
+
+
+async def get_teams_rating(
+    limit: int = Query(default=20, ge=1, le=100),
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> list[responses.TeamRating]:
+    ratings = await get_teams_leaderboard(dao.rating, limit)
+    return [responses.TeamRating.from_core(rating) for rating in ratings]
+
+
+async def get_players_rating(
+    limit: int = Query(default=20, ge=1, le=100),
+    dao: HolderDao = Depends(dao_provider),  # type: ignore[assignment]
+) -> list[responses.PlayerRating]:
+    ratings = await get_players_leaderboard(dao.rating, limit)
+    return [responses.PlayerRating.from_core(rating) for rating in ratings]
+
+
+def setup(router: APIRouter):
+    router.add_api_route("/ratings/teams", get_teams_rating, methods=["GET"])
+    router.add_api_route("/ratings/players", get_players_rating, methods=["GET"])
@@ -27,7 +27,7 @@ async def set_password_route(
     user: dto.User = Depends(get_current_user),
     dao: HolderDao = Depends(dao_provider),
 ):
-    hashed_password = auth.get_password_hash(password)
+    hashed_password = await auth.get_password_hash_async(password)
     await set_password(user, hashed_password, dao.user)
     raise HTTPException(status_code=200)
 
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+
+@dataclass
+class GameArrays:
+    """
+    Всё, что нужно аналитике от одной завершённой игры.
+    Строки - команды (в порядке team_ids), столбцы - уровни.
+    """
+
+    game_id: int
+    team_ids: np.ndarray
+    # unix time начала уровня, nan - команда до уровня не дошла.
+    # последний столбец - время финиша
+    level_starts: np.ndarray
+    keys: np.ndarray
+    wrong_keys: np.ndarray
+    # (уровни, подсказки) минуты от начала уровня, nan - подсказки с таким номером нет
+    hint_times: np.ndarray
+
+    @property
+    def levels_count(self) -> int:
+        return self.hint_times.shape[0]
+
+
+def build_game_arrays(
+    game_id: int,
+    level_starts: Sequence[tuple[int, int, datetime]],
+    key_counts: Sequence[tuple[int, int, int, int]],
+    hint_times: Sequence[tuple[int, int]],
+) -> GameArrays:
+    """
+    :param level_starts: (team_id, level_number, start_at)
+    :param key_counts: (team_id, level_number, keys, wrong_keys)
+    :param hint_times: (level_number, time)
+    """
+    hint_levels = np.array([level for level, _ in hint_times], dtype=np.int64)
+    hint_minutes = np.array([time for _, time in hint_times], dtype=np.float64)
+    levels_count = int(hint_levels.max()) + 1 if len(hint_levels) else 0
+    hints = _pack_rows(hint_levels, hint_minutes, levels_count)
+
+    lt_teams = np.array([row[0] for row in level_starts], dtype=np.int64)
+    lt_levels = np.array([row[1] for row in level_starts], dtype=np.int64)
+    lt_at = np.array([row[2].timestamp() for row in level_starts], dtype=np.float64)
+    keys = np.array(key_counts, dtype=np.int64).reshape(-1, 4)
+
+    team_ids, inverse = np.unique(np.concatenate([lt_teams, keys[:, 0]]), return_inverse=True)
+    split = len(lt_teams)
+    lt_rows, key_rows = inverse[:split], inverse[split:]
+
+    starts = np.full((len(team_ids), levels_count + 1), np.nan)
+    in_game = lt_levels <= levels_count
+    starts[lt_rows[in_game], lt_levels[in_game]] = lt_at[in_game]
+
+    typed = np.zeros((len(team_ids), levels_count), dtype=np.int64)
+    wrong = np.zeros_like(typed)
+    in_game = keys[:, 1] < levels_count
+    np.add.at(typed, (key_rows[in_game], keys[in_game, 1]), keys[in_game, 2])
+    np.add.at(wrong, (key_rows[in_game], keys[in_game, 1]), keys[in_game, 3])
+    return GameArrays(
+        game_id=game_id,
+        team_ids=team_ids,
+        level_starts=starts,
+        keys=typed,
+        wrong_keys=wrong,
+        hint_times=hints,
+    )
+
+
+def _pack_rows(rows: np.ndarray, values: np.ndarray, rows_count: int) -> np.ndarray:
+    """раскладывает values по строкам rows в порядке появления, добивая nan"""
+    counts = np.bincount(rows, minlength=rows_count)
+    result = np.full((rows_count, counts.max(initial=0)), np.nan)
+    order = np.argsort(rows, kind="stable")
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    columns = np.arange(len(rows)) - np.repeat(offsets, counts)
+    result[rows[order], columns] = values[order]
+    return result
+
+
+class GameArraysCache:
+    """
+    Завершённая игра больше не меняется,
+    поэтому её массивы достаточно один раз достать из бд и сохранить в npz
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def get(self, game_id: int) -> GameArrays | None:
+        try:
+            with np.load(self._path(game_id)) as data:
+                return GameArrays(
+                    game_id=game_id,
+                    team_ids=data["team_ids"],
+                    level_starts=data["level_starts"],
+                    keys=data["keys"],
+                    wrong_keys=data["wrong_keys"],
+                    hint_times=data["hint_times"],
+                )
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+
+    def put(self, arrays: GameArrays) -> None:
+        path = self._path(arrays.game_id)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            np.savez(
+                f,
+                team_ids=arrays.team_ids,
+                level_starts=arrays.level_starts,
+                keys=arrays.keys,
+                wrong_keys=arrays.wrong_keys,
+                hint_times=arrays.hint_times,
+            )
+        tmp_path.replace(path)
+
+    def _path(self, game_id: int) -> Path:
+        return self.path / f"{game_id}.npz"
@@ -0,0 +1,157 @@
+"""
+Векторные расчёты по завершённым играм.
+Каждая функция работает над GameArrays одной игры или над списком таких игр,
+без циклов по командам и уровням.
+"""
+import warnings
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from infrastructure.analytics.arrays import GameArrays
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+@dataclass(frozen=True)
+class LevelSolveStat:
+    game_id: int
+    level_number: int
+    teams: int
+    solved: int
+    # секунды
+    mean: float
+    percentiles: tuple[float, ...]
+    wrong_keys_rate: float
+    # hints[i] - сколько команд решили уровень, увидев подсказку номер i (и не увидев i+1)
+    hints: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class TeamRank:
+    team_id: int
+    games: int
+    wins: int
+    mean_place: float
+    # средний нормированный результат: 1 - первое место, 0 - последнее
+    score: float
+    wrong_keys_rate: float
+
+
+def solve_times(game: GameArrays) -> np.ndarray:
+    """(команды, уровни) секунды на уровень, nan - уровень не решён"""
+    return np.diff(game.level_starts, axis=1)
+
+
+def hint_numbers(game: GameArrays) -> np.ndarray:
+    """(команды, уровни) номер последней подсказки, полученной до решения, -1 - не решён"""
+    solved_after = solve_times(game)[:, :, np.newaxis]
+    hint_seconds = game.hint_times[np.newaxis, :, :] * 60
+    # сравнения с nan ложны, поэтому нерешённые уровни и отсутствующие подсказки не считаются
+    return (solved_after >= hint_seconds).sum(axis=2) - 1
+
+
+def hint_dependency(game: GameArrays) -> np.ndarray:
+    """(уровни, подсказки) сколько команд решили уровень после каждой подсказки"""
+    hints_count = game.hint_times.shape[1]
+    numbers = hint_numbers(game)
+    levels = np.broadcast_to(np.arange(game.levels_count), numbers.shape)
+    solved = numbers >= 0
+    flat = levels[solved] * hints_count + numbers[solved]
+    return np.bincount(flat, minlength=game.levels_count * hints_count).reshape(
+        game.levels_count, hints_count
+    )
+
+
+def wrong_keys_rate(wrong: np.ndarray, typed: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(typed > 0, wrong / typed, 0.0)
+
+
+def level_stats(
+    game: GameArrays, percentiles: Sequence[float] = PERCENTILES
+) -> list[LevelSolveStat]:
+    times = solve_times(game)
+    solved = np.count_nonzero(~np.isnan(times), axis=0)
+    with warnings.catch_warnings():
+        # уровни, которые никто не решил, дают nan и предупреждение
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        means = np.nanmean(times, axis=0)
+        distribution = np.nanpercentile(times, percentiles, axis=0)
+    teams = np.count_nonzero(~np.isnan(game.level_starts[:, :-1]), axis=0)
+    rates = wrong_keys_rate(game.wrong_keys.sum(axis=0), game.keys.sum(axis=0))
+    hints = hint_dependency(game)
+    return [
+        LevelSolveStat(
+            game_id=game.game_id,
+            level_number=level_number,
+            teams=int(teams[level_number]),
+            solved=int(solved[level_number]),
+            mean=float(means[level_number]),
+            percentiles=tuple(distribution[:, level_number].tolist()),
+            wrong_keys_rate=float(rates[level_number]),
+            hints=tuple(hints[level_number].tolist()),
+        )
+        for level_number in range(game.levels_count)
+    ]
+
+
+def places(game: GameArrays) -> np.ndarray:
+    """
+    места команд (с 1) в порядке team_ids:
+    сначала по количеству пройденных уровней, затем по времени прохождения последнего
+    """
+    reached = ~np.isnan(game.level_starts)
+    progress = reached.shape[1] - 1 - np.argmax(reached[:, ::-1], axis=1)
+    at = game.level_starts[np.arange(len(progress)), progress]
+    progress = np.where(reached.any(axis=1), progress, -1)
+    order = np.lexsort((at, -progress))
+    result = np.empty_like(order)
+    result[order] = np.arange(1, len(order) + 1)
+    return result
+
+
+def team_rankings(games: Sequence[GameArrays]) -> list[TeamRank]:
+    if not games:
+        return []
+    team_ids = np.concatenate([game.team_ids for game in games])
+    game_places = np.concatenate([places(game) for game in games])
+    teams_in_game = np.concatenate(
+        [np.full(len(game.team_ids), len(game.team_ids)) for game in games]
+    )
+    typed = np.concatenate([game.keys.sum(axis=1) for game in games])
+    wrong = np.concatenate([game.wrong_keys.sum(axis=1) for game in games])
+
+    scores = np.where(
+        teams_in_game > 1,
+        1 - (game_places - 1) / np.maximum(teams_in_game - 1, 1),
+        1.0,
+    )
+    ids, inverse = np.unique(team_ids, return_inverse=True)
+    played = np.bincount(inverse)
+    wins = np.bincount(inverse, weights=game_places == 1).astype(np.int64)
+    mean_place = np.bincount(inverse, weights=game_places) / played
+    mean_score = np.bincount(inverse, weights=scores) / played
+    rates = wrong_keys_rate(
+        np.bincount(inverse, weights=wrong), np.bincount(inverse, weights=typed)
+    )
+
+    order = np.lexsort((mean_place, -played, -mean_score))
+    return [
+        TeamRank(
+            team_id=int(ids[i]),
+            games=int(played[i]),
+            wins=int(wins[i]),
+            mean_place=float(mean_place[i]),
+            score=float(mean_score[i]),
+            wrong_keys_rate=float(rates[i]),
+        )
+        for i in order
+    ]
+
+
+def hint_dependency_total(games: Sequence[GameArrays]) -> np.ndarray:
+    """по всему архиву: сколько решений уровней случилось после подсказки номер i"""
+    numbers = np.concatenate([hint_numbers(game).ravel() for game in games] or [np.empty(0, int)])
+    return np.bincount(numbers[numbers >= 0])
@@ -0,0 +1,175 @@
+"""
+Аналитика по завершённым играм сезона для обратной связи авторам:
+распределение времени решения уровней, после какой подсказки решали,
+доля неверных ключей и рейтинг команд.
+Массивы каждой игры кэшируются в npz, поэтому повторный запуск не ходит в бд за старыми играми.
+
+python -m infrastructure.analytics.report --since 2022-09-01 --until 2023-07-01
+"""
+import argparse
+import asyncio
+import csv
+import logging
+import math
+from datetime import date, datetime
+from pathlib import Path
+from typing import Sequence
+
+from sqlalchemy.orm import close_all_sessions
+
+from common.config.models.paths import Paths
+from common.config.parser.logging_config import setup_logging
+from common.config.parser.paths import common_get_paths
+from infrastructure.analytics import engine
+from infrastructure.analytics.arrays import GameArrays, GameArraysCache, build_game_arrays
+from infrastructure.db.dao.holder import HolderDao
+from infrastructure.db.faсtory import create_pool, create_redis, create_level_test_dao
+from shvatka.models import dto
+from shvatka.utils.datetime_utils import tz_game
+from tgbot.config.parser.main import load_config
+
+logger = logging.getLogger(__name__)
+
+
+async def load_game_arrays(dao: HolderDao, game: dto.Game, cache: GameArraysCache) -> GameArrays:
+    if (arrays := cache.get(game.id)) is not None:
+        return arrays
+    arrays = build_game_arrays(
+        game_id=game.id,
+        level_starts=await dao.level_time.get_game_level_starts(game),
+        key_counts=await dao.key_time.get_game_key_counts(game),
+        hint_times=await dao.level.get_game_hint_times(game),
+    )
+    cache.put(arrays)
+    return arrays
+
+
+async def load_season(
+    dao: HolderDao, since: datetime, until: datetime, cache: GameArraysCache
+) -> tuple[list[dto.Game], list[GameArrays]]:
+    games = [
+        game
+        for game in await dao.game.get_completed_games()
+        if game.start_at is not None and since <= game.start_at < until
+    ]
+    return games, [await load_game_arrays(dao, game, cache) for game in games]
+
+
+def seconds_cell(value: float) -> int | str:
+    """уровень, который никто не решил, даёт nan - пишем пустую ячейку"""
+    return "" if math.isnan(value) else round(value)
+
+
+def write_levels(games: Sequence[dto.Game], arrays: Sequence[GameArrays], path: Path) -> None:
+    names = {game.id: game.name for game in games}
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            (
+                "game_id",
+                "game_name",
+                "level_number",
+                "teams",
+                "solved",
+                "mean_seconds",
+                *(f"p{p}_seconds" for p in engine.PERCENTILES),
+                "wrong_keys_rate",
+                "solved_after_hint",
+            )
+        )
+        for game_arrays in arrays:
+            for stat in engine.level_stats(game_arrays):
+                writer.writerow(
+                    (
+                        stat.game_id,
+                        names[stat.game_id],
+                        stat.level_number + 1,
+                        stat.teams,
+                        stat.solved,
+                        seconds_cell(stat.mean),
+                        *(seconds_cell(p) for p in stat.percentiles),
+                        round(stat.wrong_keys_rate, 3),
+                        " ".join(map(str, stat.hints)),
+                    )
+                )
+
+
+def write_teams(ranks: Sequence[engine.TeamRank], names: dict[int, str], path: Path) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            (
+                "place",
+                "team_id",
+                "team_name",
+                "games",
+                "wins",
+                "mean_place",
+                "score",
+                "wrong_keys_rate",
+            )
+        )
+        for place, rank in enumerate(ranks, 1):
+            writer.writerow(
+                (
+                    place,
+                    rank.team_id,
+                    names.get(rank.team_id, ""),
+                    rank.games,
+                    rank.wins,
+                    round(rank.mean_place, 2),
+                    round(rank.score, 3),
+                    round(rank.wrong_keys_rate, 3),
+                )
+            )
+
+
+async def build_report(
+    dao: HolderDao, since: datetime, until: datetime, cache: GameArraysCache, path: Path
+) -> None:
+    games, arrays = await load_season(dao, since, until, cache)
+    logger.info("loaded %s completed games", len(games))
+    path.mkdir(parents=True, exist_ok=True)
+    suffix = f"{since:%Y%m%d}_{until:%Y%m%d}"
+    write_levels(games, arrays, path / f"levels_{suffix}.csv")
+    ranks = engine.team_rankings(arrays)
+    names = await dao.team.get_names(rank.team_id for rank in ranks)
+    write_teams(ranks, names, path / f"teams_{suffix}.csv")
+    logger.info("solved after hint number: %s", engine.hint_dependency_total(arrays).tolist())
+
+
+async def main(since: date, until: date, path: Path, cache_path: Path):
+    paths = get_paths()
+
+    setup_logging(paths)
+    config = load_config(paths)
+    pool = create_pool(config.db)
+    try:
+        async with (
+            pool() as session,
+            create_redis(config.redis) as redis,
+        ):
+            dao = HolderDao(session, redis, create_level_test_dao())
+            await build_report(
+                dao=dao,
+                since=datetime.combine(since, datetime.min.time(), tzinfo=tz_game),
+                until=datetime.combine(until, datetime.min.time(), tzinfo=tz_game),
+                cache=GameArraysCache(cache_path),
+                path=path,
+            )
+    finally:
+        close_all_sessions()
+
+
+def get_paths() -> Paths:
+    return common_get_paths("ANALYTICS_PATH")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--since", type=date.fromisoformat, required=True)
+    parser.add_argument("--until", type=date.fromisoformat, required=True)
+    parser.add_argument("--out", type=Path, default=Path("analytics"))
+    parser.add_argument("--cache", type=Path, default=Path("analytics") / "cache")
+    args = parser.parse_args()
+    asyncio.run(main(args.since, args.until, args.out, args.cache))
@@ -0,0 +1,133 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+from aiohttp import ClientSession, hdrs
+
+from infrastructure.crawler.rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    status: int
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+
+    def text(self, encoding: str = "cp1251") -> str:
+        return self.body.decode(encoding, errors="backslashreplace")
+
+
+class HttpCache:
+    """
+    On-disk cache of responses.
+    For every url stored two files: body and meta with ETag/Last-Modified for revalidation.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def get(self, url: str) -> CachedResponse | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            with meta_path.open("r", encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+        return CachedResponse(body=body, **meta)
+
+    def put(self, response: CachedResponse) -> None:
+        meta_path, body_path = self._paths(response.url)
+        meta = asdict(response)
+        meta.pop("body")
+        _atomic_write(body_path, response.body)
+        _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.path / f"{key}.json", self.path / f"{key}.body"
+
+
+class Fetcher:
+    def __init__(
+        self,
+        session: ClientSession,
+        cache: HttpCache,
+        limiter: HostRateLimiter,
+        concurrency: int,
+    ):
+        self.session = session
+        self.cache = cache
+        self.limiter = limiter
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def get(
+        self, url: str, *, revalidate: bool = True, allow_redirects: bool = True
+    ) -> CachedResponse:
+        """
+        :param revalidate: if False - cached response returned without request to server,
+        it's suitable for immutable content (e.g. images)
+        """
+        cached = self.cache.get(url)
+        if cached is not None and not revalidate:
+            return cached
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+        async with self.semaphore:
+            await self.limiter.wait(url)
+            async with self.session.get(
+                url, headers=headers, allow_redirects=allow_redirects
+            ) as resp:
+                if resp.status == 304 and cached is not None:
+                    logger.debug("url %s not modified, used cache", url)
+                    return cached
+                resp.raise_for_status()
+                response = CachedResponse(
+                    url=url,
+                    status=resp.status,
+                    content_type=resp.content_type,
+                    etag=resp.headers.get(hdrs.ETAG),
+                    last_modified=resp.headers.get(hdrs.LAST_MODIFIED),
+                    body=await resp.read(),
+                )
+        self.cache.put(response)
+        return response
+
+
+class Checkpoint:
+    """Stores ids of already processed items, so interrupted run can be continued"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                self.done: set[int] = set(json.load(f))
+        except FileNotFoundError:
+            self.done = set()
+
+    def is_done(self, id_: int) -> bool:
+        return id_ in self.done
+
+    def mark_done(self, id_: int) -> None:
+        self.done.add(id_)
+        _atomic_write(self.path, json.dumps(sorted(self.done)).encode("utf-8"))
+
+
+def _atomic_write(path: Path, content: bytes) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
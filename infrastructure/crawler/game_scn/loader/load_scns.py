@@ -1,12 +1,19 @@
+import argparse
 import asyncio
+import hashlib
 import json
 import logging
+import time
+from io import BytesIO
 from pathlib import Path
+from typing import Callable
 from zipfile import Path as ZipPath
 
 from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
 from dataclass_factory import Factory
-from sqlalchemy.orm import close_all_sessions
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import close_all_sessions, sessionmaker
 from typing.io import BinaryIO
 
 from common.config.models.paths import Paths
@@ -16,10 +23,12 @@ from common.factory import create_dataclass_factory
 from infrastructure.clients.factory import create_file_storage
 from infrastructure.clients.file_gateway import BotFileGateway
 from infrastructure.crawler.models.stat import GameStat
+from infrastructure.crawler.rate_limiter import TokenBucket
 from infrastructure.db.dao.holder import HolderDao
 from infrastructure.db.faсtory import create_pool, create_level_test_dao, create_redis
-from shvatka.interfaces.clients.file_storage import FileGateway
+from shvatka.interfaces.clients.file_storage import FileGateway, FileStorage
 from shvatka.models import dto, enums
+from shvatka.models.dto import scn
 from shvatka.services.game import upsert_game
 from shvatka.services.scenario.scn_zip import unpack_scn
 from shvatka.utils import exceptions
@@ -30,7 +39,48 @@ from tgbot.views.hint_factory.hint_parser import HintParser
 logger = logging.getLogger(__name__)
 
 
-async def main(path: Path):
+LOAD_WORKERS = 4
+# все файлы перезаливаются в один чат (log_chat), лимиты телеграма на чат:
+# около сообщения в секунду в личке и 20 сообщений в минуту в группе
+TG_PRIVATE_CHAT_RATE = 1.0
+TG_GROUP_CHAT_RATE = 20 / 60
+TG_UPLOAD_BURST = 3
+UPLOAD_RETRIES = 3
+
+
+def get_upload_rate(chat_id: int) -> float:
+    return TG_GROUP_CHAT_RATE if chat_id < 0 else TG_PRIVATE_CHAT_RATE
+
+
+class RateLimitedFileGateway(BotFileGateway):
+    """
+    Перезаливка файлов в телеграм общая для всех воркеров
+    (все файлы отправляются в один чат), поэтому ограничивается общим лимитером.
+    Если лимит всё же превышен, ждём сколько просит телеграм и повторяем
+    """
+
+    def __init__(
+        self, file_storage: FileStorage, bot: Bot, hint_parser: HintParser, limiter: TokenBucket
+    ):
+        super().__init__(file_storage=file_storage, bot=bot, hint_parser=hint_parser)
+        self.limiter = limiter
+
+    async def renew_file_id(
+        self, author: dto.Player, content: BinaryIO, file_meta: scn.UploadedFileMeta
+    ) -> scn.FileMeta:
+        for _ in range(UPLOAD_RETRIES):
+            await self.limiter.wait()
+            try:
+                return await super().renew_file_id(author, content, file_meta)
+            except TelegramRetryAfter as e:
+                logger.warning("upload rate limit exceeded, retry after %s s", e.retry_after)
+                await asyncio.sleep(e.retry_after)
+                content.seek(0)
+        await self.limiter.wait()
+        return await super().renew_file_id(author, content, file_meta)
+
+
+async def main(path: Path, upload_rate: float | None = None):
     paths = get_paths()
 
     setup_logging(paths)
@@ -41,94 +91,166 @@ async def main(path: Path):
     Bot.set_current(bot)
     pool = create_pool(config.db)
     level_test_dao = create_level_test_dao()
+    upload_limiter = TokenBucket(
+        rate=upload_rate or get_upload_rate(config.bot.log_chat), burst=TG_UPLOAD_BURST
+    )
     try:
-        async with (
-            pool() as session,
-            create_redis(config.redis) as redis,
-        ):
-            dao = HolderDao(session, redis, level_test_dao)
-            file_gateway = BotFileGateway(
-                bot=bot,
-                file_storage=file_storage,
-                hint_parser=HintParser(
-                    dao=dao.file_info,
-                    file_storage=file_storage,
-                    bot=bot,
-                ),
-            )
-            tech_player = await dao.player.upsert_player(
-                await dao.user.upsert_user(
-                    dto.User(
-                        tg_id=config.bot.log_chat,
-                        first_name="SYSTEM",
-                        last_name="PARSED UPLOADER",
-                        is_bot=True,
-                    )
+        async with create_redis(config.redis) as redis:
+            async with pool() as session:
+                dao = HolderDao(session, redis, level_test_dao)
+                tech_player, bot_player = await create_system_players(
+                    dao, config.bot.log_chat, bot.id
                 )
-            )
-            await dao.player.promote(tech_player, tech_player)
-            tech_player.can_be_author = True
-            bot_player = await dao.player.upsert_player(
-                await dao.user.upsert_user(
-                    dto.User(
-                        tg_id=bot.id,
-                        first_name="SYSTEM",
-                        last_name="PARSER",
-                        is_bot=True,
-                    )
+
+            def create_dao(session: AsyncSession) -> HolderDao:
+                return HolderDao(session, redis, level_test_dao)
+
+            def create_file_gateway(dao: HolderDao) -> FileGateway:
+                return RateLimitedFileGateway(
+                    bot=bot,
+                    file_storage=file_storage,
+                    hint_parser=HintParser(
+                        dao=dao.file_info,
+                        file_storage=file_storage,
+                        bot=bot,
+                    ),
+                    limiter=upload_limiter,
                 )
-            )
-            await dao.player.promote(bot_player, bot_player)
-            bot_player.can_be_author = True
-            await dao.commit()
+
             await load_scns(
                 tech_player=tech_player,
                 bot_player=bot_player,
-                dao=dao,
-                file_gateway=file_gateway,
+                pool=pool,
+                create_dao=create_dao,
+                create_file_gateway=create_file_gateway,
                 dcf=dcf,
                 path=path,
             )
+            logger.info("waited for upload rate limit %.1f s", upload_limiter.waited)
     finally:
         await bot.session.close()
         close_all_sessions()
 
 
+async def create_system_players(
+    dao: HolderDao, tech_tg_id: int, bot_tg_id: int
+) -> tuple[dto.Player, dto.Player]:
+    tech_player = await dao.player.upsert_player(
+        await dao.user.upsert_user(
+            dto.User(
+                tg_id=tech_tg_id,
+                first_name="SYSTEM",
+                last_name="PARSED UPLOADER",
+                is_bot=True,
+            )
+        )
+    )
+    await dao.player.promote(tech_player, tech_player)
+    tech_player.can_be_author = True
+    bot_player = await dao.player.upsert_player(
+        await dao.user.upsert_user(
+            dto.User(
+                tg_id=bot_tg_id,
+                first_name="SYSTEM",
+                last_name="PARSER",
+                is_bot=True,
+            )
+        )
+    )
+    await dao.player.promote(bot_player, bot_player)
+    bot_player.can_be_author = True
+    await dao.commit()
+    return tech_player, bot_player
+
+
 async def load_scns(
     tech_player: dto.Player,
     bot_player: dto.Player,
-    dao: HolderDao,
-    file_gateway: FileGateway,
+    pool: sessionmaker,
+    create_dao: Callable[[AsyncSession], HolderDao],
+    create_file_gateway: Callable[[HolderDao], FileGateway],
     dcf: Factory,
     path: Path,
+    workers: int = LOAD_WORKERS,
 ):
-    for file in path.glob("*.zip"):
-        logger.info("loading game from file %s", file.name)
-        try:
-            with file.open("rb") as game_zip_scn:
-                game = await load_scn(
-                    player=tech_player,
+    files: asyncio.Queue[Path] = asyncio.Queue()
+    for file in sorted(path.glob("*.zip")):
+        files.put_nowait(file)
+    total = files.qsize()
+    started_at = time.monotonic()
+
+    async def worker():
+        async with pool() as session:
+            dao = create_dao(session)
+            file_gateway = create_file_gateway(dao)
+            while True:
+                try:
+                    file = files.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await load_file(
+                    file=file,
+                    tech_player=tech_player,
+                    bot_player=bot_player,
                     dao=dao,
                     file_gateway=file_gateway,
                     dcf=dcf,
-                    zip_scn=game_zip_scn,
                 )
-                if not game:
-                    continue
-                await dao.game.set_completed(game)
-                game.status = enums.GameStatus.complete
-                results = load_results(game_zip_scn, dcf)
-            await dao.game.set_start_at(game, results.start_at)
-            game.start_at = results.start_at
-            await dao.game.set_number(game, results.id)
-            game.number = results.id
-            await transfer_ownership(game, bot_player, dao)
-            await dao.commit()
-
-        except exceptions.CantEditGame:
-            logger.info("game from file %s already loaded", file.name)
-        else:
-            logger.info("successfully loaded game %s with number %s", game.id, game.number)
+
+    await asyncio.gather(*(worker() for _ in range(min(workers, total))))
+    logger.info("%s files processed in %.1f s", total, time.monotonic() - started_at)
+
+
+async def load_file(
+    file: Path,
+    tech_player: dto.Player,
+    bot_player: dto.Player,
+    dao: HolderDao,
+    file_gateway: FileGateway,
+    dcf: Factory,
+):
+    started_at = time.monotonic()
+    content = await asyncio.to_thread(file.read_bytes)
+    checksum = hashlib.sha256(content).hexdigest()
+    if await dao.imported_scenario.is_imported(checksum):
+        logger.info("file %s already loaded (checksum %s), skipped", file.name, checksum)
+        return
+    logger.info("loading game from file %s", file.name)
+    try:
+        game_zip_scn = BytesIO(content)
+        game = await load_scn(
+            player=tech_player,
+            dao=dao,
+            file_gateway=file_gateway,
+            dcf=dcf,
+            zip_scn=game_zip_scn,
+        )
+        if not game:
+            return
+        await dao.game.set_completed(game)
+        game.status = enums.GameStatus.complete
+        results = load_results(game_zip_scn, dcf)
+        await dao.game.set_start_at(game, results.start_at)
+        game.start_at = results.start_at
+        await dao.game.set_number(game, results.id)
+        game.number = results.id
+        await transfer_ownership(game, bot_player, dao)
+        await dao.imported_scenario.save(checksum, game)
+        await dao.commit()
+    except exceptions.CantEditGame:
+        await dao.session.rollback()
+        logger.info("game from file %s already loaded", file.name)
+    except Exception as e:
+        await dao.session.rollback()
+        logger.exception("can't load game from file %s", file.name, exc_info=e)
+    else:
+        logger.info(
+            "successfully loaded game %s with number %s from file %s in %.1f s",
+            game.id,
+            game.number,
+            file.name,
+            time.monotonic() - started_at,
+        )
 
 
 async def transfer_ownership(game: dto.FullGame, bot_player: dto.Player, dao: HolderDao):
@@ -159,8 +281,8 @@ async def load_scn(
     zip_scn: BinaryIO,
 ) -> dto.FullGame | None:
     try:
-        with unpack_scn(ZipPath(zip_scn)).open() as scn:
-            game = await upsert_game(scn, player, dao.game_upserter, dcf, file_gateway)
+        with unpack_scn(ZipPath(zip_scn)).open() as parsed_scn:
+            game = await upsert_game(parsed_scn, player, dao.game_upserter, dcf, file_gateway)
     except exceptions.ScenarioNotCorrect as e:
         logger.error("game scenario from player %s has problems", player.id, exc_info=e)
         return
@@ -173,4 +295,12 @@ def get_paths() -> Paths:
 
 
 if __name__ == "__main__":
-    asyncio.run(main(Path(__name__).parent / "scn"))
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--upload-rate",
+        type=float,
+        default=None,
+        help="файлов в секунду, по умолчанию по типу чата log_chat",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(Path(__name__).parent / "scn", args.upload_rate))
@@ -1,7 +1,10 @@
 import asyncio
 import json
 import logging
+import os
+import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor, Executor
 from datetime import datetime, timedelta
 from io import BytesIO
 from pathlib import Path
@@ -20,8 +23,11 @@ from lxml.etree import _Element
 
 from infrastructure.crawler.auth import get_auth_cookie
 from infrastructure.crawler.constants import GAME_URL_TEMPLATE
+from infrastructure.crawler.fetcher import Fetcher, HttpCache, Checkpoint
 from infrastructure.crawler.game_scn.parser.resourses import load_error_img
+from infrastructure.crawler.models.parsed_game import ParsedGamePage
 from infrastructure.crawler.models.stat import LevelTime, Key, GameStat
+from infrastructure.crawler.rate_limiter import HostRateLimiter
 from shvatka.models import enums
 from shvatka.models.dto import scn
 from shvatka.services.scenario.scn_zip import pack_scn
@@ -30,36 +36,116 @@ from shvatka.utils.datetime_utils import tz_local, tz_utc
 logger = logging.getLogger(__name__)
 EVENING_TIME = datetime.strptime("20:00:00", "%H:%M:%S").time()
 PARSER_ERROR_IMG = load_error_img()
+GAMES_CONCURRENCY = 8
+REQUESTS_CONCURRENCY = 16
+HOST_MIN_INTERVAL = 0.2
+CACHE_DIR_NAME = ".http-cache"
+CHECKPOINT_FILE_NAME = "checkpoint.json"
 
 
 class ContentDownloadError(IOError):
     pass
 
 
-async def get_all_games(games_ids: list[int]) -> list[scn.ParsedCompletedGameScenario]:
-    games = []
-    async with ClientSession(cookies=await get_auth_cookie()) as session:
-        for game_id in reversed(games_ids):
-            await asyncio.sleep(1)
-            html_text = await download(game_id, session)
-            try:
-                games.append(await GameParser(html_text, session=session).build())
-            except (ValueError, AttributeError) as e:
-                logger.error("can't parse game %s", game_id, exc_info=e)
-    return games
+async def save_all_scns_to_files(game_ids: list[int], path: Path):
+    """
+    Скачивает, парсит и сохраняет в zip игры с форума.
+    Игры обрабатываются конкурентно, ответы сервера кешируются на диске,
+    а уже сохранённые игры отмечаются в чекпоинте и при повторном запуске пропускаются.
+    Разбор html (CPU-bound) выполняется в пуле процессов.
+    """
+    path.mkdir(exist_ok=True)
+    checkpoint = Checkpoint(path / CHECKPOINT_FILE_NAME)
+    dcf = Factory(default_schema=Schema(name_style=NameStyle.kebab))
+    games_semaphore = asyncio.Semaphore(GAMES_CONCURRENCY)
+    with ProcessPoolExecutor() as executor:
+        async with ClientSession(cookies=await get_auth_cookie()) as session:
+            fetcher = Fetcher(
+                session=session,
+                cache=HttpCache(path / CACHE_DIR_NAME),
+                limiter=HostRateLimiter(HOST_MIN_INTERVAL),
+                concurrency=REQUESTS_CONCURRENCY,
+            )
+
+            async def crawl_game(game_id: int):
+                async with games_semaphore:
+                    started = time.monotonic()
+                    game = await get_game(game_id, fetcher, executor)
+                    if game is None:
+                        return
+                    save_scn_to_file(game, path, dcf)
+                    checkpoint.mark_done(game_id)
+                    logger.info("game %s saved in %.2fs", game_id, time.monotonic() - started)
+
+            await asyncio.gather(
+                *[crawl_game(game_id) for game_id in game_ids if not checkpoint.is_done(game_id)]
+            )
+
+
+async def get_game(
+    game_id: int, fetcher: Fetcher, executor: Executor
+) -> scn.ParsedCompletedGameScenario | None:
+    try:
+        html_text = await download(game_id, fetcher)
+    except (
+        ClientConnectorError,
+        ClientResponseError,
+        ServerDisconnectedError,
+        ClientOSError,
+    ) as e:
+        logger.error("can't download game %s", game_id, exc_info=e)
+        return None
+    try:
+        page = await asyncio.get_running_loop().run_in_executor(executor, parse_game, html_text)
+    except (ValueError, AttributeError) as e:
+        logger.error("can't parse game %s", game_id, exc_info=e)
+        return None
+    return page.to_scenario(await download_images(page, fetcher))
+
+
+async def download(game_id: int, fetcher: Fetcher) -> str:
+    response = await fetcher.get(GAME_URL_TEMPLATE.format(game_id=game_id), allow_redirects=False)
+    return response.text(encoding="cp1251")
+
 
+def parse_game(html_str: str) -> ParsedGamePage:
+    """Pure parsing without any IO, suitable for running in another process"""
+    return GameParser(html_str).build()
 
-async def download(game_id: int, session: ClientSession) -> str:
-    async with session.get(
-        GAME_URL_TEMPLATE.format(game_id=game_id), allow_redirects=False
-    ) as resp:
-        return await resp.text(encoding="cp1251", errors="backslashreplace")
+
+async def download_images(page: ParsedGamePage, fetcher: Fetcher) -> dict[str, BinaryIO]:
+    async def download_image(guid: str, url: str) -> tuple[str, BinaryIO]:
+        try:
+            return guid, await download_content(url, fetcher)
+        except ContentDownloadError:
+            page.mark_not_downloaded(guid)
+            return guid, BytesIO(PARSER_ERROR_IMG)
+
+    return dict(
+        await asyncio.gather(*[download_image(guid, url) for guid, url in page.images.items()])
+    )
+
+
+async def download_content(url: str, fetcher: Fetcher) -> BinaryIO:
+    try:
+        resp = await fetcher.get(url.strip(), revalidate=False)
+        if not resp.content_type.startswith("image"):
+            raise ValueError(f"response contains no image, content-type is {resp.content_type}")
+        return BytesIO(resp.body)
+    except (
+        ClientConnectorError,
+        ClientResponseError,
+        ServerDisconnectedError,
+        ClientOSError,
+        ValueError,
+    ) as e:
+        logger.error("couldnt load content for url %s", url, exc_info=e)
+        raise ContentDownloadError()
 
 
 class GameParser:
-    def __init__(self, html_str: str, *, session: ClientSession):
+    def __init__(self, html_str: str):
         self.html = etree.HTML(html_str, base_url="shvatka.ru")
-        self.session = session
         self.id: int = 0
         self.name: str = ""
         self.start_at: datetime | None = None
@@ -70,7 +156,7 @@ class GameParser:
         self.level_number = 0
         self.keys: set[str] = set()
         self.time: int = 0
-        self.files: dict[str, BinaryIO] = {}
+        self.images: dict[str, str] = {}
         self.files_meta: list[scn.FileMetaLightweight] = []
 
     def parse_game_head(self):
@@ -80,7 +166,7 @@ class GameParser:
         started_at_text = self.html.xpath("//div[@class='maintitle']/b/span[@id='dt']")[0].text
         self.start_at = datetime.strptime(started_at_text, "%d.%m.%y в %H:%M")
 
-    async def parse_scenario(self):
+    def parse_scenario(self):
         (scn_element,) = self.html.xpath(
             "//div[@id='sc']//div[@class='borderwrap']//tr[@class='ipbtable']/td"
         )
@@ -114,17 +200,8 @@ class GameParser:
                 for img in img_tags:
                     self.build_current_hint()
                     guid = str(uuid.uuid4())
-                    try:
-                        self.files[guid] = await self.download_content(img.get("src"))
-                        self.hints.append(scn.PhotoHint(file_guid=guid))
-                    except ContentDownloadError:
-                        self.files[guid] = BytesIO(PARSER_ERROR_IMG)
-                        self.hints.append(
-                            scn.PhotoHint(
-                                file_guid=guid,
-                                caption=f"не удалось скачать контент по ссылке {img.get('src')}",
-                            )
-                        )
+                    self.images[guid] = img.get("src")
+                    self.hints.append(scn.PhotoHint(file_guid=guid))
                     self.files_meta.append(
                         scn.FileMetaLightweight(
                             guid=guid,
@@ -202,25 +279,6 @@ class GameParser:
             log_keys[team_name] = keys
         return log_keys
 
-    async def download_content(self, url: str) -> BinaryIO:
-        try:
-            async with self.session.get(url.strip()) as resp:
-                resp.raise_for_status()
-                if not resp.content_type.startswith("image"):
-                    raise ValueError(
-                        f"response contains no image, content-type is {resp.content_type}"
-                    )
-                return BytesIO(await resp.content.read())
-        except (
-            ClientConnectorError,
-            ClientResponseError,
-            ServerDisconnectedError,
-            ClientOSError,
-            ValueError,
-        ) as e:
-            logger.error("couldnt load content for url %s", url, exc_info=e)
-            raise ContentDownloadError()
-
     def build_current_hint(self):
         parts = list(filter(lambda p: p, map(lambda p: p.strip(), self.current_hint_parts)))
         self.current_hint_parts = []
@@ -254,16 +312,16 @@ class GameParser:
         self.time = 0
         self.level_number = 0
 
-    async def build(self) -> scn.ParsedCompletedGameScenario:
+    def build(self) -> ParsedGamePage:
         self.parse_game_head()
-        await self.parse_scenario()
-        game = scn.ParsedCompletedGameScenario(
+        self.parse_scenario()
+        return ParsedGamePage(
             id=self.id,
             name=self.name,
             start_at=self.start_at,
             levels=self.levels,
-            files_contents=self.files,
-            files=self.files_meta,
+            files_meta=self.files_meta,
+            images=self.images,
             stat=GameStat(
                 results=self.parse_results(),
                 keys=self.parse_keys(),
@@ -271,26 +329,18 @@ class GameParser:
                 start_at=self.start_at,
             ),
         )
-        return game
 
 
-async def save_all_scns_to_files(game_ids: list[int]):
-    games = await get_all_games(game_ids)
-    dcf = Factory(default_schema=Schema(name_style=NameStyle.kebab))
-    path = Path() / "scn"
-    path.mkdir(exist_ok=True)
-    for game in games:
-        dct = dcf.dump(game, scn.ParsedGameScenario)
-        stat = BytesIO(
-            json.dumps(dcf.dump(game.stat), ensure_ascii=False, indent=2).encode("utf-8")
-        )
-        stat.seek(0)
-        scenario = scn.RawGameScenario(
-            scn=dct, files={**game.files_contents, "results.json": stat}
-        )
-        packed_scenario = pack_scn(scenario)
-        with open(path / f"{game.id}.zip", "wb") as f:
-            f.write(packed_scenario.read())
+def save_scn_to_file(game: scn.ParsedCompletedGameScenario, path: Path, dcf: Factory):
+    dct = dcf.dump(game, scn.ParsedGameScenario)
+    stat = BytesIO(json.dumps(dcf.dump(game.stat), ensure_ascii=False, indent=2).encode("utf-8"))
+    stat.seek(0)
+    scenario = scn.RawGameScenario(scn=dct, files={**game.files_contents, "results.json": stat})
+    packed_scenario = pack_scn(scenario)
+    tmp_path = path / f"{game.id}.zip.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(packed_scenario.read())
+    os.replace(tmp_path, path / f"{game.id}.zip")
 
 
 def get_parseable_games_ids():
@@ -307,4 +357,4 @@ def get_parseable_games_ids():
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
-    asyncio.run(save_all_scns_to_files(get_parseable_games_ids()))
+    asyncio.run(save_all_scns_to_files(list(reversed(get_parseable_games_ids())), Path() / "scn"))
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import BinaryIO
+
+from infrastructure.crawler.models.stat import GameStat
+from shvatka.models.dto import scn
+
+
+@dataclass
+class ParsedGamePage:
+    """
+    Результат разбора html страницы игры. Не содержит файлов,
+    только ссылки на картинки, которые надо скачать отдельно.
+    """
+
+    id: int
+    name: str
+    start_at: datetime
+    levels: list[scn.LevelScenario]
+    files_meta: list[scn.FileMetaLightweight]
+    images: dict[str, str]
+    "guid -> url"
+    stat: GameStat
+
+    def mark_not_downloaded(self, guid: str) -> None:
+        for level in self.levels:
+            for time_hint in level.time_hints:
+                for hint in time_hint.hint:
+                    if isinstance(hint, scn.PhotoHint) and hint.file_guid == guid:
+                        hint.caption = f"не удалось скачать контент по ссылке {self.images[guid]}"
+
+    def to_scenario(self, files_contents: dict[str, BinaryIO]) -> scn.ParsedCompletedGameScenario:
+        return scn.ParsedCompletedGameScenario(
+            id=self.id,
+            name=self.name,
+            start_at=self.start_at,
+            levels=self.levels,
+            files_contents=files_contents,
+            files=self.files_meta,
+            stat=self.stat,
+        )
@@ -0,0 +1,59 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+
+class RateLimiter:
+    """Не чаще одного прохода в min_interval секунд"""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.lock = asyncio.Lock()
+        self.last_pass = 0.0
+
+    async def wait(self) -> None:
+        async with self.lock:
+            delay = self.last_pass + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.last_pass = time.monotonic()
+
+
+class TokenBucket:
+    """
+    В среднем не больше rate проходов в секунду, подряд без ожидания - до burst.
+    waited - сколько всего секунд проходы простояли в ожидании
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.waited = 0.0
+
+    async def wait(self) -> None:
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens < 1:
+                delay = (1 - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                self.waited += delay
+                self.tokens = 1.0
+                self.updated_at = time.monotonic()
+            self.tokens -= 1
+
+
+class HostRateLimiter:
+    """Не чаще одного запроса в min_interval секунд на каждый хост"""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.limiters: dict[str, RateLimiter] = {}
+
+    async def wait(self, url: str) -> None:
+        host = urlsplit(url).netloc
+        await self.limiters.setdefault(host, RateLimiter(self.min_interval)).wait()
@@ -3,14 +3,23 @@ from .rdb import (
     ChatDao,  # noqa: F401
     FileInfoDao,  # noqa: F401
     GameDao,  # noqa: F401
+    GameTeamStatDao,  # noqa: F401
     LevelDao,  # noqa: F401
     LevelTimeDao,  # noqa: F401
     KeyTimeDao,  # noqa: F401
     OrganizerDao,  # noqa: F401
     PlayerDao,  # noqa: F401
+    RatingDao,  # noqa: F401
     TeamPlayerDao,  # noqa: F401
     TeamDao,  # noqa: F401
     UserDao,  # noqa: F401
     WaiverDao,  # noqa: F401
 )
-from .redis import PollDao, SecureInvite  # noqa: F401
+from .redis import (
+    PollDao,  # noqa: F401
+    SecureInvite,  # noqa: F401
+    GameEventsStream,  # noqa: F401
+    LiveSpyMessages,  # noqa: F401
+    GameReplayStorage,  # noqa: F401
+    HintLedger,  # noqa: F401
+)
@@ -1,7 +1,13 @@
 from dataclasses import dataclass
 
-from infrastructure.db.dao import LevelTimeDao, LevelDao, OrganizerDao
-from shvatka.interfaces.dal.level_times import GameStatDao
+from infrastructure.db.dao import (
+    LevelTimeDao,
+    LevelDao,
+    OrganizerDao,
+    GameTeamStatDao,
+    HintLedger,
+)
+from shvatka.interfaces.dal.level_times import GameStatDao, HintsCatchUpDao
 from shvatka.models import dto
 
 
@@ -10,6 +16,7 @@ class GameStatImpl(GameStatDao):
     level_times: LevelTimeDao
     level: LevelDao
     organizer: OrganizerDao
+    game_team_stat: GameTeamStatDao
 
     async def get_game_level_times(self, game: dto.Game) -> list[dto.LevelTime]:
         return await self.level_times.get_game_level_times(game)
@@ -17,6 +24,9 @@ class GameStatImpl(GameStatDao):
     async def get_max_level_number(self, game: dto.Game) -> int:
         return await self.level.get_max_level_number(game)
 
+    async def get_game_progress(self, game: dto.Game) -> list[dto.TeamProgress]:
+        return await self.game_team_stat.get_game_progress(game)
+
     async def get_by_player(self, game: dto.Game, player: dto.Player) -> dto.SecondaryOrganizer:
         return await self.organizer.get_by_player(game=game, player=player)
 
@@ -24,3 +34,34 @@ class GameStatImpl(GameStatDao):
         self, game: dto.Game, player: dto.Player
     ) -> dto.SecondaryOrganizer | None:
         return await self.organizer.get_by_player_or_none(game=game, player=player)
+
+
+@dataclass
+class HintSenderImpl(HintsCatchUpDao):
+    level_times: LevelTimeDao
+    hint_ledger: HintLedger
+
+    async def is_team_on_level(self, team: dto.Team, level: dto.Level) -> bool:
+        return await self.level_times.is_team_on_level(team, level)
+
+    async def get_game_level_times(self, game: dto.Game) -> list[dto.LevelTime]:
+        return await self.level_times.get_game_level_times(game)
+
+    async def mark_hint_sent(self, team: dto.Team, level: dto.Level, hint_number: int) -> bool:
+        assert level.game_id is not None
+        assert level.number_in_game is not None
+        return await self.hint_ledger.mark_sent(
+            level.game_id, team.id, level.number_in_game, hint_number
+        )
+
+    async def unmark_hint_sent(self, team: dto.Team, level: dto.Level, hint_number: int) -> None:
+        assert level.game_id is not None
+        assert level.number_in_game is not None
+        await self.hint_ledger.unmark_sent(
+            level.game_id, team.id, level.number_in_game, hint_number
+        )
+
+    async def get_sent_hints(self, team: dto.Team, level: dto.Level) -> set[int]:
+        assert level.game_id is not None
+        assert level.number_in_game is not None
+        return await self.hint_ledger.get_sent(level.game_id, team.id, level.number_in_game)
@@ -1,9 +1,26 @@
 from dataclasses import dataclass
-
-from infrastructure.db.dao import GameDao, LevelDao, FileInfoDao
-from shvatka.interfaces.dal.game import GameUpserter, GameCreator, GamePackager
+from typing import Iterable, Sequence
+
+from infrastructure.db.dao import (
+    GameDao,
+    LevelDao,
+    FileInfoDao,
+    RatingDao,
+    WaiverDao,
+    TeamPlayerDao,
+    PollDao,
+)
+from shvatka.interfaces.dal.game import (
+    GameUpserter,
+    GameCreator,
+    GamePackager,
+    GameCompleter,
+    ActiveGameRouter,
+    TeamGameBinder,
+)
 from shvatka.models import dto
 from shvatka.models.dto import scn
+from .replay import GameReplayImpl
 
 
 @dataclass
@@ -67,6 +84,7 @@ class GameCreatorImpl(GameCreator):
 @dataclass
 class GamePackagerImpl(GamePackager):
     game: GameDao
+    level: LevelDao
     file_info: FileInfoDao
 
     async def get_full(self, id_: int) -> dto.FullGame:
@@ -74,3 +92,81 @@ class GamePackagerImpl(GamePackager):
 
     async def get_by_guid(self, guid: str) -> scn.VerifiableFileMeta:
         return await self.file_info.get_by_guid(guid)
+
+    async def get_guids(self, game: dto.Game) -> list[str]:
+        return await self.level.get_guids(game)
+
+
+@dataclass
+class GameCompleterImpl(GameReplayImpl, GameCompleter):
+    game: GameDao
+    rating: RatingDao
+
+    async def get_max_number(self) -> int:
+        return await self.game.get_max_number()
+
+    async def set_number(self, game: dto.Game, number: int) -> None:
+        await self.game.set_number(game, number)
+
+    async def set_completed(self, game: dto.Game) -> None:
+        await self.game.set_completed(game)
+
+    async def is_rated(self, game: dto.Game) -> bool:
+        return await self.rating.is_rated(game)
+
+    async def get_game_results(self, game: dto.Game) -> list[dto.TeamResult]:
+        return await self.rating.get_game_results(game)
+
+    async def get_game_players(self, game: dto.Game) -> list[tuple[int, int]]:
+        return await self.rating.get_game_players(game)
+
+    async def get_team_ratings(self, ids: Iterable[int]) -> dict[int, float]:
+        return await self.rating.get_team_ratings(ids)
+
+    async def get_player_ratings(self, ids: Iterable[int]) -> dict[int, float]:
+        return await self.rating.get_player_ratings(ids)
+
+    async def save_rating_changes(self, changes: Sequence[dto.RatingChange]) -> None:
+        await self.rating.save_rating_changes(changes)
+
+    async def commit(self) -> None:
+        await self.game.commit()
+
+
+@dataclass
+class ActiveGameRouterImpl(ActiveGameRouter):
+    game: GameDao
+    waiver: WaiverDao
+    team_player: TeamPlayerDao
+    poll: PollDao
+
+    async def get_active_games(self) -> list[dto.Game]:
+        return await self.game.get_active_games()
+
+    async def get_team(self, player: dto.Player) -> dto.Team | None:
+        return await self.team_player.get_team(player)
+
+    async def get_team_game_ids(self, team: dto.Team, game_ids: Sequence[int]) -> set[int]:
+        return await self.waiver.get_team_game_ids(team, game_ids)
+
+    async def get_bound_game_id(self, team: dto.Team) -> int | None:
+        return await self.poll.get_team_game_id(team.id)
+
+    async def get_org_game_ids(self, player: dto.Player, game_ids: Sequence[int]) -> set[int]:
+        return await self.game.get_org_game_ids(player, game_ids)
+
+
+@dataclass
+class TeamGameBinderImpl(TeamGameBinder):
+    game: GameDao
+    waiver: WaiverDao
+    poll: PollDao
+
+    async def get_active_games(self) -> list[dto.Game]:
+        return await self.game.get_active_games()
+
+    async def get_team_game_ids(self, team: dto.Team, game_ids: Sequence[int]) -> set[int]:
+        return await self.waiver.get_team_game_ids(team, game_ids)
+
+    async def bind_team(self, game: dto.Game, team: dto.Team) -> None:
+        await self.poll.bind_team(game_id=game.id, team_id=team.id)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Iterable
 
 from infrastructure.db.dao import (
@@ -9,10 +10,13 @@ from infrastructure.db.dao import (
     LevelTimeDao,
     LevelDao,
     KeyTimeDao,
+    GameTeamStatDao,
 )
+from infrastructure.db.dao.redis.orgs_cache import OrgsCache
 from shvatka.interfaces.dal.game_play import GamePreparer, GamePlayerDao
 from shvatka.interfaces.dal.level_times import GameStarter
 from shvatka.models import dto
+from shvatka.utils.datetime_utils import tz_utc
 
 
 @dataclass
@@ -21,8 +25,8 @@ class GamePreparerImpl(GamePreparer):
     waiver: WaiverDao
     org: OrganizerDao
 
-    async def delete_poll_data(self) -> None:
-        return await self.poll.delete_all()
+    async def delete_poll_data(self, game: dto.Game) -> None:
+        return await self.poll.delete_game(game.id)
 
     async def get_agree_teams(self, game: dto.Game) -> Iterable[dto.Team]:
         return await self.waiver.get_played_teams(game)
@@ -42,6 +46,7 @@ class GameStarterImpl(GameStarter):
     waiver: WaiverDao
     level_times: LevelTimeDao
     level: LevelDao
+    game_team_stat: GameTeamStatDao
 
     async def set_game_started(self, game: dto.Game) -> None:
         return await self.game.set_started(game)
@@ -50,8 +55,12 @@ class GameStarterImpl(GameStarter):
         return await self.waiver.get_played_teams(game)
 
     async def set_teams_to_first_level(self, game: dto.Game, teams: Iterable[dto.Team]) -> None:
-        for team in teams:
-            await self.level_times.set_to_level(team=team, game=game, level_number=0)
+        teams = list(teams)
+        start_at = datetime.now(tz=tz_utc)
+        await self.level_times.set_teams_to_level(
+            teams=teams, game=game, level_number=0, start_at=start_at
+        )
+        await self.game_team_stat.set_teams_to_first_level(game, teams, start_at)
 
     async def commit(self) -> None:
         await self.game.commit()
@@ -65,6 +74,8 @@ class GamePlayerDaoImpl(GamePlayerDao):
     waiver: WaiverDao
     game: GameDao
     organizer: OrganizerDao
+    game_team_stat: GameTeamStatDao
+    orgs_cache: OrgsCache
 
     async def is_team_finished(self, team: dto.Team, game: dto.FullGame) -> bool:
         level_number = await self.level_time.get_current_level(team, game)
@@ -79,47 +90,62 @@ class GamePlayerDaoImpl(GamePlayerDao):
                 return False
         return True
 
-    async def is_key_duplicate(self, level: dto.Level, team: dto.Team, key: str) -> bool:
-        return await self.key_time.is_duplicate(level, team, key)
+    async def is_key_duplicate(
+        self, level_number: int, game: dto.Game, team: dto.Team, key: str
+    ) -> bool:
+        return await self.key_time.is_duplicate(level_number, game, team, key)
 
     async def get_current_level(self, team: dto.Team, game: dto.Game) -> dto.Level:
         return await self.level.get_by_number(
             game=game, level_number=await self.level_time.get_current_level(team=team, game=game)
         )
 
+    async def get_current_level_number(self, team: dto.Team, game: dto.Game) -> int:
+        return await self.level_time.get_current_level(team=team, game=game)
+
+    async def get_level_keys(self, game: dto.Game, level_number: int) -> set[str]:
+        return await self.level.get_keys(game=game, level_number=level_number)
+
     async def get_correct_typed_keys(
         self,
-        level: dto.Level,
+        level_number: int,
         game: dto.Game,
         team: dto.Team,
     ) -> set[str]:
-        return await self.key_time.get_correct_typed_keys(level, game, team)
+        return await self.key_time.get_correct_typed_keys(level_number, game, team)
 
     async def save_key(
         self,
         key: str,
         team: dto.Team,
-        level: dto.Level,
+        level_number: int,
         game: dto.Game,
         player: dto.Player,
         is_correct: bool,
         is_duplicate: bool,
     ) -> dto.KeyTime:
-        return await self.key_time.save_key(
+        saved = await self.key_time.save_key(
             key=key,
             team=team,
-            level=level,
+            level_number=level_number,
             game=game,
             player=player,
             is_correct=is_correct,
             is_duplicate=is_duplicate,
         )
+        await self.game_team_stat.add_key(team=team, game=game, is_correct=is_correct)
+        return saved
 
-    async def level_up(self, team: dto.Team, level: dto.Level, game: dto.Game) -> None:
+    async def level_up(self, team: dto.Team, level_number: int, game: dto.Game) -> None:
+        start_at = datetime.now(tz=tz_utc)
         await self.level_time.set_to_level(
             team=team,
             game=game,
-            level_number=level.number_in_game + 1,
+            level_number=level_number + 1,
+            start_at=start_at,
+        )
+        await self.game_team_stat.set_to_level(
+            team=team, game=game, level_number=level_number + 1, start_at=start_at
         )
 
     async def finish(self, game: dto.Game) -> None:
@@ -131,7 +157,11 @@ class GamePlayerDaoImpl(GamePlayerDao):
     async def get_orgs(
         self, game: dto.Game, with_deleted: bool = False
     ) -> list[dto.SecondaryOrganizer]:
-        return await self.organizer.get_orgs(game)
+        version = await self.orgs_cache.get_version(game)
+        if (orgs := self.orgs_cache.get(game, version)) is None:
+            orgs = await self.organizer.get_orgs(game)
+            self.orgs_cache.set(game, version, orgs)
+        return orgs
 
     async def commit(self) -> None:
         await self.key_time.commit()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import AsyncIterator
 
 from infrastructure.db.dao import KeyTimeDao, OrganizerDao
 from shvatka.interfaces.dal.key_log import TypedKeyGetter
@@ -10,8 +11,8 @@ class TypedKeyGetterImpl(TypedKeyGetter):
     key_time: KeyTimeDao
     organizer: OrganizerDao
 
-    async def get_typed_keys(self, game: dto.Game) -> list[dto.KeyTime]:
-        return await self.key_time.get_typed_keys(game=game)
+    def iter_typed_keys(self, game: dto.Game) -> AsyncIterator[dto.KeyTime]:
+        return self.key_time.iter_typed_keys(game=game)
 
     async def get_by_player(self, game: dto.Game, player: dto.Player) -> dto.SecondaryOrganizer:
         return await self.organizer.get_by_player(game=game, player=player)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import timedelta, datetime
 
 from infrastructure.db.dao import GameDao
-from infrastructure.db.dao.memory.level_testing import LevelTestingData
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
 from shvatka.interfaces.dal.level_testing import LevelTestingDao
 from shvatka.models import dto
 
@@ -10,7 +10,7 @@ from shvatka.models import dto
 @dataclass
 class LevelTestComplex(LevelTestingDao):
     game: GameDao
-    level_testing: LevelTestingData
+    level_testing: LevelTestStorage
 
     async def save_started_level_test(self, suite: dto.LevelTestSuite, now: datetime):
         return await self.level_testing.save_started_level_test(suite, now)
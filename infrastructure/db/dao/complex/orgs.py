@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from infrastructure.db.dao import GameDao, OrganizerDao, SecureInvite
+from infrastructure.db.dao.redis.orgs_cache import OrgsCache
 from shvatka.interfaces.dal.organizer import OrgAdder
 from shvatka.models import dto
 
@@ -10,12 +11,19 @@ class OrgAdderImpl(OrgAdder):
     game: GameDao
     organizer: OrganizerDao
     secure_invite: SecureInvite
+    orgs_cache: OrgsCache
+    changed_games: list[dto.Game] = field(default_factory=list)
 
     async def add_new_org(self, game: dto.Game, player: dto.Player) -> dto.SecondaryOrganizer:
-        return await self.organizer.add_new(game, player)
+        org = await self.organizer.add_new(game, player)
+        # сбрасывать кэш до коммита нельзя: параллельное чтение вернёт в него старый список
+        self.changed_games.append(game)
+        return org
 
     async def commit(self) -> None:
         await self.game.commit()
+        while self.changed_games:
+            await self.orgs_cache.invalidate(self.changed_games.pop())
 
     async def get_invite(self, token: str) -> dict:
         return await self.secure_invite.get_invite(token)
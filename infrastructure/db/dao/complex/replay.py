@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Sequence, Iterable
+
+from infrastructure.db.dao import LevelTimeDao, KeyTimeDao, TeamDao, LevelDao, GameReplayStorage
+from shvatka.interfaces.dal.replay import GameReplayGetter
+from shvatka.models import dto
+
+
+@dataclass
+class GameReplayImpl(GameReplayGetter):
+    level_time: LevelTimeDao
+    key_time: KeyTimeDao
+    team: TeamDao
+    level: LevelDao
+    replay: GameReplayStorage
+
+    async def get_game_level_starts(self, game: dto.Game) -> Sequence[tuple[int, int, datetime]]:
+        return await self.level_time.get_game_level_starts(game)
+
+    async def get_game_key_times(self, game: dto.Game) -> Sequence[tuple[int, datetime, bool]]:
+        return await self.key_time.get_game_key_times(game)
+
+    async def get_team_names(self, ids: Iterable[int]) -> dict[int, str]:
+        return await self.team.get_names(ids)
+
+    async def get_max_level_number(self, game: dto.Game) -> int:
+        return await self.level.get_max_level_number(game)
+
+    async def get_replay(self, game_id: int) -> dto.GameReplay | None:
+        return await self.replay.get_replay(game_id)
+
+    async def save_replay(self, replay: dto.GameReplay) -> None:
+        await self.replay.save_replay(replay)
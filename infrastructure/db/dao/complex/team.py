@@ -39,8 +39,8 @@ class TeamLeaverImpl(TeamLeaver):
     waiver: WaiverDao
     poll: PollDao
 
-    async def del_player_vote(self, team_id: int, player_id: int) -> None:
-        return await self.poll.del_player_vote(team_id, player_id)
+    async def del_player_vote(self, game_id: int, team_id: int, player_id: int) -> None:
+        return await self.poll.del_player_vote(game_id, team_id, player_id)
 
     async def get_team(self, player: dto.Player) -> dto.Team:
         return await self.team_player.get_team(player)
@@ -48,8 +48,8 @@ class TeamLeaverImpl(TeamLeaver):
     async def leave_team(self, player: dto.Player) -> None:
         return await self.team_player.leave_team(player)
 
-    async def get_active_game(self) -> dto.Game | None:
-        return await self.game.get_active_game()
+    async def get_active_games(self) -> list[dto.Game]:
+        return await self.game.get_active_games()
 
     async def delete(self, waiver: dto.Waiver) -> None:
         return await self.waiver.delete(waiver)
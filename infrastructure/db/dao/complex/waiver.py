@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from infrastructure.db.dao import PollDao, WaiverDao, PlayerDao, TeamPlayerDao
 from shvatka.interfaces.dal.waiver import WaiverVoteAdder, WaiverVoteGetter, WaiverApprover
@@ -21,8 +21,10 @@ class WaiverVoteAdderImpl(WaiverVoteAdder):
     ) -> bool:
         return await self.waiver.is_excluded(game, player, team)
 
-    async def add_player_vote(self, team_id: int, player_id: int, vote_var: str) -> None:
-        return await self.poll.add_player_vote(team_id, player_id, vote_var)
+    async def add_player_vote(
+        self, game_id: int, team_id: int, player_id: int, vote_var: str
+    ) -> None:
+        return await self.poll.add_player_vote(game_id, team_id, player_id, vote_var)
 
     async def get_team_player(self, player: dto.Player) -> dto.TeamPlayer:
         return await self.team_player.get_team_player(player)
@@ -33,8 +35,8 @@ class WaiverVoteGetterImpl(WaiverVoteGetter):
     poll: PollDao
     player: PlayerDao
 
-    async def get_dict_player_vote(self, team_id: int) -> dict[int, Played]:
-        return await self.poll.get_dict_player_vote(team_id)
+    async def get_dict_player_vote(self, game_id: int, team_id: int) -> dict[int, Played]:
+        return await self.poll.get_dict_player_vote(game_id, team_id)
 
     async def get_by_ids_with_user_and_pit(self, ids: Iterable[int]) -> list[dto.VotedPlayer]:
         return await self.player.get_by_ids_with_user_and_pit(ids)
@@ -48,6 +50,9 @@ class WaiverApproverImpl(WaiverApprover, WaiverVoteGetterImpl):
     async def upsert(self, waiver: dto.Waiver) -> None:
         return await self.waiver.upsert(waiver)
 
+    async def upsert_many(self, waivers: Sequence[dto.Waiver]) -> None:
+        return await self.waiver.upsert_many(waivers)
+
     async def commit(self):
         return await self.waiver.commit()
 
@@ -57,5 +62,5 @@ class WaiverApproverImpl(WaiverApprover, WaiverVoteGetterImpl):
     async def get_players(self, team: dto.Team) -> list[dto.FullTeamPlayer]:
         return await self.team_player.get_players(team)
 
-    async def del_player_vote(self, team_id: int, player_id: int) -> None:
-        return await self.poll.del_player_vote(team_id, player_id)
+    async def del_player_vote(self, game_id: int, team_id: int, player_id: int) -> None:
+        return await self.poll.del_player_vote(game_id, team_id, player_id)
@@ -1,26 +1,43 @@
 from redis.asyncio.client import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from shvatka.interfaces.dal.game import GameUpserter, GameCreator, GamePackager
+from shvatka.interfaces.dal.game import (
+    GameUpserter,
+    GameCreator,
+    GamePackager,
+    GameCompleter,
+    ActiveGameRouter,
+    TeamGameBinder,
+)
 from shvatka.interfaces.dal.game_play import GamePreparer, GamePlayerDao
 from shvatka.interfaces.dal.key_log import TypedKeyGetter
 from shvatka.interfaces.dal.level_testing import LevelTestingDao
-from shvatka.interfaces.dal.level_times import GameStarter, GameStatDao
+from shvatka.interfaces.dal.level_times import GameStarter, GameStatDao, HintsCatchUpDao
 from shvatka.interfaces.dal.organizer import OrgAdder
 from shvatka.interfaces.dal.player import TeamLeaver, PlayerPromoter
+from shvatka.interfaces.dal.replay import GameReplayGetter
 from shvatka.interfaces.dal.team import TeamCreator
 from shvatka.interfaces.dal.waiver import WaiverVoteAdder, WaiverVoteGetter, WaiverApprover
 from .complex import WaiverVoteAdderImpl, WaiverVoteGetterImpl
-from .complex.Level_times import GameStatImpl
-from .complex.game import GameUpserterImpl, GameCreatorImpl, GamePackagerImpl
+from .complex.Level_times import GameStatImpl, HintSenderImpl
+from .complex.game import (
+    GameUpserterImpl,
+    GameCreatorImpl,
+    GamePackagerImpl,
+    GameCompleterImpl,
+    ActiveGameRouterImpl,
+    TeamGameBinderImpl,
+)
 from .complex.game_play import GamePreparerImpl, GameStarterImpl, GamePlayerDaoImpl
 from .complex.key_log import TypedKeyGetterImpl
 from .complex.level_testing import LevelTestComplex
 from .complex.orgs import OrgAdderImpl
 from .complex.player import PlayerPromoterImpl
+from .complex.replay import GameReplayImpl
 from .complex.team import TeamCreatorImpl, TeamLeaverImpl
 from .complex.waiver import WaiverApproverImpl
-from .memory.level_testing import LevelTestingData
+from .redis.level_testing import LevelTestStorage
+from .redis.orgs_cache import OrgsCache
 from .rdb import (
     ChatDao,
     UserDao,
@@ -35,13 +52,29 @@ from .rdb import (
     TeamDao,
     WaiverDao,
     ForumUserDAO,
+    ImportedScenarioDao,
+    GameTeamStatDao,
+    RatingDao,
 )
 from .rdb.achievement import AchievementDAO
-from .redis import PollDao, SecureInvite
+from .redis import (
+    PollDao,
+    SecureInvite,
+    GameEventsStream,
+    LiveSpyMessages,
+    GameReplayStorage,
+    HintLedger,
+)
 
 
 class HolderDao:
-    def __init__(self, session: AsyncSession, redis: Redis, level_test: LevelTestingData):
+    def __init__(
+        self,
+        session: AsyncSession,
+        redis: Redis,
+        level_test: LevelTestStorage,
+        orgs_cache: OrgsCache | None = None,
+    ):
         self.session = session
         self.user = UserDao(self.session)
         self.chat = ChatDao(self.session)
@@ -49,6 +82,7 @@ class HolderDao:
         self.game = GameDao(self.session)
         self.level = LevelDao(self.session)
         self.level_time = LevelTimeDao(self.session)
+        self.game_team_stat = GameTeamStatDao(self.session)
         self.key_time = KeyTimeDao(self.session)
         self.organizer = OrganizerDao(self.session)
         self.player = PlayerDao(self.session)
@@ -57,9 +91,16 @@ class HolderDao:
         self.waiver = WaiverDao(self.session)
         self.achievement = AchievementDAO(self.session)
         self.forum_user = ForumUserDAO(self.session)
+        self.imported_scenario = ImportedScenarioDao(self.session)
+        self.rating = RatingDao(self.session)
         self.poll = PollDao(redis=redis)
         self.secure_invite = SecureInvite(redis=redis)
+        self.game_events = GameEventsStream(redis=redis)
+        self.live_spy = LiveSpyMessages(redis=redis)
+        self.replay = GameReplayStorage(redis=redis)
+        self.hint_ledger = HintLedger(redis=redis)
         self.level_test = level_test
+        self.orgs_cache = orgs_cache or OrgsCache(redis=redis)
 
     async def commit(self):
         await self.session.commit()
@@ -80,6 +121,16 @@ class HolderDao:
             poll=self.poll, player=self.player, waiver=self.waiver, team_player=self.team_player
         )
 
+    @property
+    def active_game_router(self) -> ActiveGameRouter:
+        return ActiveGameRouterImpl(
+            game=self.game, waiver=self.waiver, team_player=self.team_player, poll=self.poll
+        )
+
+    @property
+    def team_game_binder(self) -> TeamGameBinder:
+        return TeamGameBinderImpl(game=self.game, waiver=self.waiver, poll=self.poll)
+
     @property
     def game_upserter(self) -> GameUpserter:
         return GameUpserterImpl(game=self.game, level=self.level, file_info=self.file_info)
@@ -90,7 +141,33 @@ class HolderDao:
 
     @property
     def game_packager(self) -> GamePackager:
-        return GamePackagerImpl(game=self.game, file_info=self.file_info)
+        return GamePackagerImpl(game=self.game, level=self.level, file_info=self.file_info)
+
+    @property
+    def game_completer(self) -> GameCompleter:
+        return GameCompleterImpl(
+            level_time=self.level_time,
+            key_time=self.key_time,
+            team=self.team,
+            level=self.level,
+            replay=self.replay,
+            game=self.game,
+            rating=self.rating,
+        )
+
+    @property
+    def game_replay(self) -> GameReplayGetter:
+        return GameReplayImpl(
+            level_time=self.level_time,
+            key_time=self.key_time,
+            team=self.team,
+            level=self.level,
+            replay=self.replay,
+        )
+
+    @property
+    def hint_sender(self) -> HintsCatchUpDao:
+        return HintSenderImpl(level_times=self.level_time, hint_ledger=self.hint_ledger)
 
     @property
     def team_creator(self) -> TeamCreator:
@@ -119,6 +196,7 @@ class HolderDao:
             waiver=self.waiver,
             level_times=self.level_time,
             level=self.level,
+            game_team_stat=self.game_team_stat,
         )
 
     @property
@@ -130,12 +208,17 @@ class HolderDao:
             waiver=self.waiver,
             game=self.game,
             organizer=self.organizer,
+            game_team_stat=self.game_team_stat,
+            orgs_cache=self.orgs_cache,
         )
 
     @property
     def org_adder(self) -> OrgAdder:
         return OrgAdderImpl(
-            game=self.game, organizer=self.organizer, secure_invite=self.secure_invite
+            game=self.game,
+            organizer=self.organizer,
+            secure_invite=self.secure_invite,
+            orgs_cache=self.orgs_cache,
         )
 
     @property
@@ -149,7 +232,10 @@ class HolderDao:
     @property
     def game_stat(self) -> GameStatDao:
         return GameStatImpl(
-            level_times=self.level_time, level=self.level, organizer=self.organizer
+            level_times=self.level_time,
+            level=self.level,
+            organizer=self.organizer,
+            game_team_stat=self.game_team_stat,
         )
 
     @property
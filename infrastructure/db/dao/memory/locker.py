@@ -1,4 +1,5 @@
 import asyncio
+from typing import Iterable
 
 from shvatka.models import dto
 from shvatka.utils.key_checker_lock import KeyCheckerLock, KeyCheckerFactory
@@ -19,10 +20,10 @@ class MemoryLockFactory(KeyCheckerFactory):
     def __init__(self):
         self.team_locks: dict[int, MemoryLock] = {}
         self.player_locks: dict[int:MemoryLock] = {}
-        self.global_lock = MemoryLock()
+        self.game_locks: dict[int, MemoryLock] = {}
 
-    def lock_globally(self) -> KeyCheckerLock:
-        return self.global_lock
+    def lock_game(self, game: dto.Game) -> KeyCheckerLock:
+        return self.game_locks.setdefault(game.id, MemoryLock())
 
     def lock_team(self, team: dto.Team) -> KeyCheckerLock:
         return self.team_locks.setdefault(team.id, MemoryLock())
@@ -30,6 +31,7 @@ class MemoryLockFactory(KeyCheckerFactory):
     def lock_player(self, player: dto.Player) -> KeyCheckerLock:
         return self.player_locks.setdefault(player.id, MemoryLock())
 
-    def clear(self):
-        self.team_locks.clear()
-        self.player_locks.clear()
+    def clear(self, game: dto.Game, teams: Iterable[dto.Team]):
+        for team in teams:
+            self.team_locks.pop(team.id, None)
+        self.game_locks.pop(game.id, None)
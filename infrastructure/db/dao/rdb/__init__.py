@@ -3,11 +3,14 @@ from .chat import ChatDao  # noqa: F401
 from .file_info import FileInfoDao  # noqa: F401
 from .forum_user import ForumUserDAO  # noqa: F401
 from .game import GameDao  # noqa: F401
+from .game_team_stat import GameTeamStatDao  # noqa: F401
+from .imported_scenario import ImportedScenarioDao  # noqa: F401
 from .level import LevelDao  # noqa: F401
 from .level_times import LevelTimeDao  # noqa: F401
 from .log_keys import KeyTimeDao  # noqa: F401
 from .organizer import OrganizerDao  # noqa: F401
 from .player import PlayerDao  # noqa: F401
+from .rating import RatingDao  # noqa: F401
 from .team import TeamDao  # noqa: F401
 from .team_player import TeamPlayerDao  # noqa: F401
 from .user import UserDao  # noqa: F401
@@ -108,17 +108,32 @@ class GameDao(BaseDAO[models.Game]):
         )
         game.status = status
 
-    async def get_active_game(self) -> dto.Game | None:
+    async def get_active_games(self) -> list[dto.Game]:
         result = await self.session.scalars(
             select(models.Game)
             .where(models.Game.status.in_(ACTIVE_STATUSES))
             .options(joinedload(models.Game.author).joinedload(models.Player.user))
+            .order_by(models.Game.id)
         )
-        try:
-            game: models.Game = result.one()
-        except NoResultFound:
-            return None
-        return game.to_dto(game.author.to_dto_user_prefetched())
+        games: Sequence[models.Game] = result.all()
+        return [game.to_dto(game.author.to_dto_user_prefetched()) for game in games]
+
+    async def get_org_game_ids(self, player: dto.Player, game_ids: Sequence[int]) -> set[int]:
+        """из переданных игр - те, которые игрок организует (автором или вторичным оргом)"""
+        result = await self.session.scalars(
+            select(models.Game.id)
+            .outerjoin(
+                models.Organizer,
+                (models.Organizer.game_id == models.Game.id)
+                & (models.Organizer.player_id == player.id)
+                & models.Organizer.deleted.is_(False),
+            )
+            .where(
+                models.Game.id.in_(game_ids),
+                (models.Game.author_id == player.id) | models.Organizer.id.is_not(None),
+            )
+        )
+        return set(result.all())
 
     async def create_game(self, author: dto.Player, name: str) -> dto.Game:
         game_db = models.Game(
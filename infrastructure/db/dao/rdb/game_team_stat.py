@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from infrastructure.db import models
+from shvatka.models import dto
+from .base import BaseDAO
+
+
+class GameTeamStatDao(BaseDAO[models.GameTeamStat]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(models.GameTeamStat, session)
+
+    async def set_teams_to_first_level(
+        self, game: dto.Game, teams: Iterable[dto.Team], start_at: datetime
+    ) -> None:
+        values = [
+            dict(game_id=game.id, team_id=team.id, level_number=0, level_started_at=start_at)
+            for team in teams
+        ]
+        if not values:
+            return
+        await self.session.execute(
+            insert(models.GameTeamStat).values(values).on_conflict_do_nothing()
+        )
+
+    async def set_to_level(
+        self, team: dto.Team, game: dto.Game, level_number: int, start_at: datetime
+    ) -> None:
+        await self.session.execute(
+            update(models.GameTeamStat)
+            .where(
+                models.GameTeamStat.game_id == game.id,
+                models.GameTeamStat.team_id == team.id,
+            )
+            .values(level_number=level_number, level_started_at=start_at)
+        )
+
+    async def add_key(self, team: dto.Team, game: dto.Game, is_correct: bool) -> None:
+        await self.session.execute(
+            update(models.GameTeamStat)
+            .where(
+                models.GameTeamStat.game_id == game.id,
+                models.GameTeamStat.team_id == team.id,
+            )
+            .values(
+                keys_typed=models.GameTeamStat.keys_typed + 1,
+                wrong_keys=models.GameTeamStat.wrong_keys + int(not is_correct),
+            )
+        )
+
+    async def get_game_progress(self, game: dto.Game) -> list[dto.TeamProgress]:
+        max_level_number = (
+            select(func.coalesce(func.max(models.Level.number_in_game), -1))
+            .where(models.Level.game_id == game.id)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            select(models.GameTeamStat, max_level_number)
+            .where(models.GameTeamStat.game_id == game.id)
+            .options(
+                joinedload(models.GameTeamStat.team)
+                .joinedload(models.Team.captain)
+                .joinedload(models.Player.user),
+                joinedload(models.GameTeamStat.team).joinedload(models.Team.chat),
+            )
+            .order_by(models.GameTeamStat.team_id)
+        )
+        return [
+            stat.to_dto(
+                game=game,
+                team=stat.team.to_dto(stat.team.chat.to_dto()),
+                max_level_number=max_level_number,
+            )
+            for stat, max_level_number in result.all()
+        ]
@@ -0,0 +1,24 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.db import models
+from shvatka.models import dto
+from .base import BaseDAO
+
+
+class ImportedScenarioDao(BaseDAO[models.ImportedScenario]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(models.ImportedScenario, session)
+
+    async def is_imported(self, checksum: str) -> bool:
+        result = await self.session.scalars(
+            select(models.ImportedScenario.checksum).where(
+                models.ImportedScenario.checksum == checksum
+            )
+        )
+        return result.first() is not None
+
+    async def save(self, checksum: str, game: dto.Game) -> None:
+        imported = models.ImportedScenario(checksum=checksum, game_id=game.id)
+        self._save(imported)
+        await self._flush(imported)
@@ -1,7 +1,8 @@
 from typing import Sequence
 
-from sqlalchemy import select
-from sqlalchemy import update
+from sqlalchemy import select, Integer, ColumnElement
+from sqlalchemy import update, func, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
@@ -9,6 +10,7 @@ from sqlalchemy.orm import joinedload
 from infrastructure.db import models
 from shvatka.models import dto
 from shvatka.models.dto.scn.level import LevelScenario
+from shvatka.models.enums.hint_type import HintType
 from shvatka.services.game import check_game_editable
 from shvatka.services.level import check_can_link_to_game
 from .base import BaseDAO
@@ -99,16 +101,12 @@ class LevelDao(BaseDAO[models.Level]):
         return level
 
     async def get_max_level_number(self, game: dto.Game) -> int:
-        result = await self.session.execute(
-            select(models.Level)
-            .where(models.Level.game_id == game.id)
-            .order_by(models.Level.number_in_game.desc())  # noqa
-            .limit(1)
+        result = await self.session.scalar(
+            select(func.max(models.Level.number_in_game)).where(models.Level.game_id == game.id)
         )
-        max_level: models.Level | None = result.scalar_one_or_none()
-        if max_level:
-            return max_level.number_in_game
-        return -1
+        if result is None:
+            return -1
+        return result
 
     async def get_by_number(self, game: dto.Game, level_number: int) -> dto.Level:
         result = await self.session.execute(
@@ -128,3 +126,75 @@ class LevelDao(BaseDAO[models.Level]):
             .where(models.Level.id == level.db_id)
             .values(author_id=new_author.id)
         )
+
+    async def get_keys(self, game: dto.Game, level_number: int) -> set[str]:
+        """read only keys of level without loading hints"""
+        result = await self.session.scalars(
+            select(_scenario()["keys"]).where(
+                models.Level.game_id == game.id,
+                models.Level.number_in_game == level_number,
+            )
+        )
+        return set(result.one())
+
+    async def get_hint_times(self, game: dto.Game, level_number: int) -> list[int]:
+        """read only hint times of level without loading hints"""
+        result = await self.session.scalars(
+            select(_time_hints()["time"].astext.cast(Integer)).where(
+                models.Level.game_id == game.id,
+                models.Level.number_in_game == level_number,
+            )
+        )
+        return list(result.all())
+
+    async def get_game_hint_times(self, game: dto.Game) -> Sequence[tuple[int, int]]:
+        """(level_number, time) всех подсказок игры без загрузки самих подсказок"""
+        result = await self.session.execute(
+            select(
+                models.Level.number_in_game,
+                _time_hints()["time"].astext.cast(Integer),
+            ).where(models.Level.game_id == game.id)
+        )
+        return result.tuples().all()
+
+    async def get_hints_count(self, game: dto.Game, level_number: int) -> int:
+        result = await self.session.scalars(
+            select(func.jsonb_array_length(_time_hints()["hint"])).where(
+                models.Level.game_id == game.id,
+                models.Level.number_in_game == level_number,
+            )
+        )
+        return sum(result.all())
+
+    async def get_guids(self, game: dto.Game) -> list[str]:
+        hint_part = func.jsonb_array_elements(_time_hints()["hint"], type_=JSONB)
+        parts = (
+            select(models.Level.number_in_game, hint_part.label("part"))
+            .where(models.Level.game_id == game.id)
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(
+                parts.c.part["file_guid"].astext,
+                parts.c.part["thumb_guid"].astext,
+            )
+            .where(
+                parts.c.part.has_key("file_guid"),
+                parts.c.part["type"].astext != HintType.sticker.name,
+            )
+            .order_by(parts.c.number_in_game)
+        )
+        guids = []
+        for file_guid, thumb_guid in result.all():
+            guids.append(file_guid)
+            if thumb_guid:
+                guids.append(thumb_guid)
+        return guids
+
+
+def _scenario() -> ColumnElement:
+    return type_coerce(models.Level.scenario, JSONB)
+
+
+def _time_hints() -> ColumnElement:
+    return func.jsonb_array_elements(_scenario()["time_hints"], type_=JSONB)
@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import AsyncIterator, Sequence, Any, Iterable
 
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -10,19 +11,52 @@ from shvatka.utils.datetime_utils import tz_utc
 from .base import BaseDAO
 
 
+EXPORT_COLUMNS = (
+    "game_id",
+    "game_number",
+    "game_name",
+    "team_id",
+    "team_name",
+    "level_number",
+    "start_at",
+)
+
+
 class LevelTimeDao(BaseDAO[models.LevelTime]):
     def __init__(self, session: AsyncSession):
         super().__init__(models.LevelTime, session)
 
-    async def set_to_level(self, team: dto.Team, game: dto.Game, level_number: int):
+    async def set_to_level(
+        self,
+        team: dto.Team,
+        game: dto.Game,
+        level_number: int,
+        start_at: datetime | None = None,
+    ):
         level_time = models.LevelTime(
             game_id=game.id,
             team_id=team.id,
             level_number=level_number,
-            start_at=datetime.now(tz=tz_utc),
+            start_at=start_at or datetime.now(tz=tz_utc),
         )
         self._save(level_time)
 
+    async def set_teams_to_level(
+        self,
+        teams: Iterable[dto.Team],
+        game: dto.Game,
+        level_number: int,
+        start_at: datetime,
+    ) -> None:
+        """все команды одним INSERT"""
+        values = [
+            dict(game_id=game.id, team_id=team.id, level_number=level_number, start_at=start_at)
+            for team in teams
+        ]
+        if not values:
+            return
+        await self.session.execute(insert(models.LevelTime).values(values))
+
     async def is_team_on_level(self, team: dto.Team, level: dto.Level) -> bool:
         return (
             await self._get_current(team.id, level.game_id)
@@ -69,3 +103,41 @@ class LevelTimeDao(BaseDAO[models.LevelTime]):
             )
             for lt in result.all()
         ]
+
+    async def get_game_level_starts(self, game: dto.Game) -> Sequence[tuple[int, int, datetime]]:
+        """(team_id, level_number, start_at) без загрузки команд"""
+        result = await self.session.execute(
+            select(
+                models.LevelTime.team_id,
+                models.LevelTime.level_number,
+                models.LevelTime.start_at,
+            ).where(models.LevelTime.game_id == game.id)
+        )
+        return result.tuples().all()
+
+    async def iter_for_export(
+        self, since: datetime, until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Any]]:
+        """строки в порядке EXPORT_COLUMNS для игр, начатых в [since, until)"""
+        result = await self.session.stream(
+            select(
+                models.Game.id,
+                models.Game.number,
+                models.Game.name,
+                models.Team.id,
+                models.Team.name,
+                models.LevelTime.level_number,
+                models.LevelTime.start_at,
+            )
+            .join(models.Game, models.LevelTime.game_id == models.Game.id)
+            .join(models.Team, models.LevelTime.team_id == models.Team.id)
+            .where(models.Game.start_at >= since, models.Game.start_at < until)
+            .order_by(
+                models.Game.start_at,
+                models.LevelTime.team_id,
+                models.LevelTime.level_number,
+            )
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
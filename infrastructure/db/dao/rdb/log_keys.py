@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Sequence
+from typing import Sequence, AsyncIterator, Any
 
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -11,31 +11,49 @@ from shvatka.utils.datetime_utils import tz_utc
 from .base import BaseDAO
 
 
+EXPORT_COLUMNS = (
+    "game_id",
+    "game_number",
+    "game_name",
+    "team_id",
+    "team_name",
+    "player_id",
+    "username",
+    "level_number",
+    "key_text",
+    "is_correct",
+    "is_duplicate",
+    "enter_time",
+)
+
+
 class KeyTimeDao(BaseDAO[models.KeyTime]):
     def __init__(self, session: AsyncSession):
         super().__init__(models.KeyTime, session)
 
     async def get_correct_typed_keys(
         self,
-        level: dto.Level,
+        level_number: int,
         game: dto.Game,
         team: dto.Team,
     ) -> set[str]:
         result = await self.session.scalars(
             select(models.KeyTime).where(
                 models.KeyTime.game_id == game.id,
-                models.KeyTime.level_number == level.number_in_game,
+                models.KeyTime.level_number == level_number,
                 models.KeyTime.team_id == team.id,
                 models.KeyTime.is_correct.is_(True),  # noqa
             )
         )
         return {key.key_text for key in result.all()}
 
-    async def is_duplicate(self, level: dto.Level, team: dto.Team, key: str) -> bool:
+    async def is_duplicate(
+        self, level_number: int, game: dto.Game, team: dto.Team, key: str
+    ) -> bool:
         result = await self.session.execute(
             select(self.model.id).where(
-                models.KeyTime.game_id == level.game_id,
-                models.KeyTime.level_number == level.number_in_game,
+                models.KeyTime.game_id == game.id,
+                models.KeyTime.level_number == level_number,
                 models.KeyTime.team_id == team.id,
                 models.KeyTime.key_text == key,
             )
@@ -46,7 +64,7 @@ class KeyTimeDao(BaseDAO[models.KeyTime]):
         self,
         key: str,
         team: dto.Team,
-        level: dto.Level,
+        level_number: int,
         game: dto.Game,
         player: dto.Player,
         is_correct: bool,
@@ -55,7 +73,7 @@ class KeyTimeDao(BaseDAO[models.KeyTime]):
         key_time = models.KeyTime(
             key_text=key,
             team_id=team.id,
-            level_number=level.number_in_game,
+            level_number=level_number,
             game_id=game.id,
             player_id=player.id,
             is_correct=is_correct,
@@ -66,21 +84,125 @@ class KeyTimeDao(BaseDAO[models.KeyTime]):
         await self._flush(key_time)  # TODO If remove tests are failed. Why?
         return key_time.to_dto(player, team)
 
-    async def get_typed_keys(self, game: dto.Game) -> list[dto.KeyTime]:
-        result = await self.session.scalars(
-            select(models.KeyTime)
+    async def iter_typed_keys(
+        self, game: dto.Game, batch_size: int = 1000
+    ) -> AsyncIterator[dto.KeyTime]:
+        """
+        Команды и игроки загружаются один раз и переиспользуются всеми ключами,
+        сами ключи читаются из бд порциями без построения orm-объектов
+        """
+        teams = await self._get_game_teams(game)
+        players = await self._get_game_players(game)
+        result = await self.session.stream(
+            select(
+                models.KeyTime.key_text,
+                models.KeyTime.is_correct,
+                models.KeyTime.is_duplicate,
+                models.KeyTime.enter_time,
+                models.KeyTime.level_number,
+                models.KeyTime.player_id,
+                models.KeyTime.team_id,
+            )
             .where(models.KeyTime.game_id == game.id)
+            .order_by(models.KeyTime.enter_time)
+            .execution_options(yield_per=batch_size)
+        )
+        async for text, is_correct, is_duplicate, at, level_number, player_id, team_id in result:
+            yield dto.KeyTime(
+                text=text,
+                is_correct=is_correct,
+                is_duplicate=is_duplicate,
+                at=at,
+                level_number=level_number,
+                player=players[player_id],
+                team=teams[team_id],
+            )
+
+    async def _get_game_teams(self, game: dto.Game) -> dict[int, dto.Team]:
+        result = await self.session.scalars(
+            select(models.Team)
+            .where(
+                models.Team.id.in_(
+                    select(models.KeyTime.team_id).where(models.KeyTime.game_id == game.id)
+                )
+            )
             .options(
-                joinedload(models.KeyTime.team).joinedload(models.Team.chat),
-                joinedload(models.KeyTime.player).joinedload(models.Player.user),
+                joinedload(models.Team.chat),
+                joinedload(models.Team.captain).joinedload(models.Player.user),
+            )
+        )
+        return {team.id: team.to_dto(team.chat.to_dto()) for team in result.all()}
+
+    async def _get_game_players(self, game: dto.Game) -> dict[int, dto.Player]:
+        result = await self.session.scalars(
+            select(models.Player)
+            .where(
+                models.Player.id.in_(
+                    select(models.KeyTime.player_id).where(models.KeyTime.game_id == game.id)
+                )
+            )
+            .options(joinedload(models.Player.user))
+        )
+        return {player.id: player.to_dto_user_prefetched() for player in result.all()}
+
+    async def get_game_key_counts(self, game: dto.Game) -> Sequence[tuple[int, int, int, int]]:
+        """(team_id, level_number, keys, wrong_keys), дубликаты не считаются"""
+        result = await self.session.execute(
+            select(
+                models.KeyTime.team_id,
+                models.KeyTime.level_number,
+                func.count(),
+                func.count().filter(models.KeyTime.is_correct.is_(False)),
+            )
+            .where(
+                models.KeyTime.game_id == game.id,
+                models.KeyTime.is_duplicate.is_(False),
+            )
+            .group_by(models.KeyTime.team_id, models.KeyTime.level_number)
+        )
+        return result.tuples().all()
+
+    async def get_game_key_times(self, game: dto.Game) -> Sequence[tuple[int, datetime, bool]]:
+        """(team_id, enter_time, is_correct) в порядке ввода, без дубликатов"""
+        result = await self.session.execute(
+            select(
+                models.KeyTime.team_id,
+                models.KeyTime.enter_time,
+                models.KeyTime.is_correct,
+            )
+            .where(
+                models.KeyTime.game_id == game.id,
+                models.KeyTime.is_duplicate.is_(False),
             )
             .order_by(models.KeyTime.enter_time)
         )
-        keys: Sequence[models.KeyTime] = result.all()
-        return [
-            key.to_dto(
-                player=key.player.to_dto_user_prefetched(),
-                team=key.team.to_dto(key.team.chat.to_dto()),
+        return result.tuples().all()
+
+    async def iter_for_export(
+        self, since: datetime, until: datetime, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Any]]:
+        """строки в порядке EXPORT_COLUMNS для игр, начатых в [since, until)"""
+        result = await self.session.stream(
+            select(
+                models.Game.id,
+                models.Game.number,
+                models.Game.name,
+                models.Team.id,
+                models.Team.name,
+                models.KeyTime.player_id,
+                models.User.username,
+                models.KeyTime.level_number,
+                models.KeyTime.key_text,
+                models.KeyTime.is_correct,
+                models.KeyTime.is_duplicate,
+                models.KeyTime.enter_time,
             )
-            for key in keys
-        ]
+            .join(models.Game, models.KeyTime.game_id == models.Game.id)
+            .join(models.Team, models.KeyTime.team_id == models.Team.id)
+            .outerjoin(models.User, models.KeyTime.player_id == models.User.player_id)
+            .where(models.Game.start_at >= since, models.Game.start_at < until)
+            .order_by(models.Game.start_at, models.KeyTime.enter_time)
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
@@ -0,0 +1,207 @@
+from typing import Iterable, Sequence
+
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from infrastructure.db import models
+from shvatka.models import dto
+from shvatka.models.enums import GameStatus
+from shvatka.models.enums.played import Played
+from .base import BaseDAO
+
+
+class RatingDao(BaseDAO[models.Rating]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(models.Rating, session)
+
+    async def is_rated(self, game: dto.Game) -> bool:
+        result = await self.session.scalar(
+            select(models.RatingSnapshot.id)
+            .where(models.RatingSnapshot.game_id == game.id)
+            .limit(1)
+        )
+        return result is not None
+
+    async def get_game_results(self, game: dto.Game) -> list[dto.TeamResult]:
+        result = await self.session.execute(
+            _final_levels().where(models.LevelTime.game_id == game.id)
+        )
+        return [
+            dto.TeamResult(team_id=team_id, level_number=level_number, at=at)
+            for _, team_id, level_number, at in result.all()
+        ]
+
+    async def get_game_players(self, game: dto.Game) -> list[tuple[int, int]]:
+        result = await self.session.execute(
+            select(models.Waiver.player_id, models.Waiver.team_id).where(
+                models.Waiver.game_id == game.id,
+                models.Waiver.played == Played.yes,
+            )
+        )
+        return list(result.tuples().all())
+
+    async def get_team_ratings(self, ids: Iterable[int]) -> dict[int, float]:
+        result = await self.session.execute(
+            select(models.Rating.team_id, models.Rating.rating).where(
+                models.Rating.team_id.in_(list(ids))
+            )
+        )
+        return dict(result.tuples().all())
+
+    async def get_player_ratings(self, ids: Iterable[int]) -> dict[int, float]:
+        result = await self.session.execute(
+            select(models.Rating.player_id, models.Rating.rating).where(
+                models.Rating.player_id.in_(list(ids))
+            )
+        )
+        return dict(result.tuples().all())
+
+    async def save_rating_changes(self, changes: Sequence[dto.RatingChange]) -> None:
+        if not changes:
+            return
+        await self._insert_snapshots(changes)
+        for column in ("team_id", "player_id"):
+            values = [
+                {
+                    column: getattr(change, column),
+                    "rating": change.rating_after,
+                    "games_count": 1,
+                    "last_game_id": change.game_id,
+                }
+                for change in changes
+                if getattr(change, column) is not None
+            ]
+            if not values:
+                continue
+            stmt = insert(models.Rating).values(values)
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[column],
+                    set_={
+                        "rating": stmt.excluded.rating,
+                        "games_count": models.Rating.games_count + 1,
+                        "last_game_id": stmt.excluded.last_game_id,
+                    },
+                )
+            )
+
+    async def get_all_results(self) -> list[tuple[int, list[dto.TeamResult]]]:
+        result = await self.session.execute(
+            _final_levels()
+            .join(models.Game, models.LevelTime.game_id == models.Game.id)
+            .where(models.Game.status == GameStatus.complete)
+            .add_columns(models.Game.start_at)
+        )
+        games: dict[int, list[dto.TeamResult]] = {}
+        starts = {}
+        for game_id, team_id, level_number, at, game_start_at in result.all():
+            games.setdefault(game_id, []).append(
+                dto.TeamResult(team_id=team_id, level_number=level_number, at=at)
+            )
+            starts[game_id] = game_start_at
+        return sorted(games.items(), key=lambda item: (starts[item[0]], item[0]))
+
+    async def get_all_players(self) -> dict[int, list[tuple[int, int]]]:
+        result = await self.session.execute(
+            select(models.Waiver.game_id, models.Waiver.player_id, models.Waiver.team_id).where(
+                models.Waiver.played == Played.yes
+            )
+        )
+        players: dict[int, list[tuple[int, int]]] = {}
+        for game_id, player_id, team_id in result.all():
+            players.setdefault(game_id, []).append((player_id, team_id))
+        return players
+
+    async def delete_ratings(self) -> None:
+        await self.session.execute(delete(models.RatingSnapshot))
+        await self.session.execute(delete(models.Rating))
+
+    async def save_rebuilt(self, changes: Sequence[dto.RatingChange]) -> None:
+        if not changes:
+            return
+        await self._insert_snapshots(changes)
+        # текущий рейтинг - последний снимок по каждой команде/игроку
+        snapshots = models.RatingSnapshot
+        for column in (snapshots.team_id, snapshots.player_id):
+            last = (
+                select(
+                    column,
+                    snapshots.rating_after,
+                    func.count().over(partition_by=column),
+                    snapshots.game_id,
+                )
+                .distinct(column)
+                .where(column.isnot(None))
+                .order_by(column, snapshots.id.desc())
+            )
+            await self.session.execute(
+                insert(models.Rating).from_select(
+                    [column.key, "rating", "games_count", "last_game_id"], last
+                )
+            )
+
+    async def get_teams_leaderboard(self, limit: int) -> list[dto.TeamRating]:
+        result = await self.session.scalars(
+            select(models.Rating)
+            .where(models.Rating.team_id.isnot(None))
+            .order_by(models.Rating.rating.desc())
+            .limit(limit)
+            .options(
+                joinedload(models.Rating.team)
+                .joinedload(models.Team.captain)
+                .joinedload(models.Player.user),
+                joinedload(models.Rating.team).joinedload(models.Team.chat),
+            )
+        )
+        return [
+            rating.to_team_dto(rating.team.to_dto(rating.team.chat.to_dto()))
+            for rating in result.all()
+        ]
+
+    async def get_players_leaderboard(self, limit: int) -> list[dto.PlayerRating]:
+        result = await self.session.scalars(
+            select(models.Rating)
+            .where(models.Rating.player_id.isnot(None))
+            .order_by(models.Rating.rating.desc())
+            .limit(limit)
+            .options(joinedload(models.Rating.player).joinedload(models.Player.user))
+        )
+        return [
+            rating.to_player_dto(rating.player.to_dto_user_prefetched()) for rating in result.all()
+        ]
+
+    async def _insert_snapshots(self, changes: Sequence[dto.RatingChange]) -> None:
+        await self.session.execute(
+            insert(models.RatingSnapshot),
+            [
+                {
+                    "game_id": change.game_id,
+                    "team_id": change.team_id,
+                    "player_id": change.player_id,
+                    "place": change.place,
+                    "rating_before": change.rating_before,
+                    "rating_after": change.rating_after,
+                }
+                for change in changes
+            ],
+        )
+
+
+def _final_levels():
+    """(game_id, team_id, level_number, start_at) последнего уровня каждой команды"""
+    return (
+        select(
+            models.LevelTime.game_id,
+            models.LevelTime.team_id,
+            models.LevelTime.level_number,
+            models.LevelTime.start_at,
+        )
+        .distinct(models.LevelTime.game_id, models.LevelTime.team_id)
+        .order_by(
+            models.LevelTime.game_id,
+            models.LevelTime.team_id,
+            models.LevelTime.level_number.desc(),  # noqa
+        )
+    )
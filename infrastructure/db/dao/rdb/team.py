@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from sqlalchemy import select
 from sqlalchemy import update
 from sqlalchemy.exc import NoResultFound, IntegrityError
@@ -75,6 +77,12 @@ class TeamDao(BaseDAO[models.Team]):
         team: models.Team = result.scalar_one()
         return team.to_dto(team.chat.to_dto())
 
+    async def get_names(self, ids: Iterable[int]) -> dict[int, str]:
+        result = await self.session.execute(
+            select(models.Team.id, models.Team.name).where(models.Team.id.in_(list(ids)))
+        )
+        return dict(result.tuples().all())
+
     async def rename_team(self, team: dto.Team, new_name: str) -> None:
         await self.session.execute(
             update(models.Team).where(models.Team.id == team.id).values(name=new_name)
@@ -1,6 +1,7 @@
 from typing import Iterable, Sequence
 
 from sqlalchemy import select, Row
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -26,17 +27,32 @@ class WaiverDao(BaseDAO[models.Waiver]):
         return waiver.played in (Played.revoked, Played.not_allowed)
 
     async def upsert(self, waiver: dto.Waiver):
-        if waiver_db := await self.get_or_none(waiver.game, waiver.player, waiver.team):
-            waiver_db.played = waiver.played
-        else:
-            waiver_db = models.Waiver(
-                player_id=waiver.player.id,
-                team_id=waiver.team.id,
-                game_id=waiver.game.id,
-                played=waiver.played,
+        await self.upsert_many([waiver])
+
+    async def upsert_many(self, waivers: Sequence[dto.Waiver]):
+        if not waivers:
+            return
+        stmt = insert(models.Waiver).values(
+            [
+                {
+                    "player_id": waiver.player.id,
+                    "team_id": waiver.team.id,
+                    "game_id": waiver.game.id,
+                    "played": waiver.played,
+                }
+                for waiver in waivers
+            ]
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    models.Waiver.game_id,
+                    models.Waiver.team_id,
+                    models.Waiver.player_id,
+                ],
+                set_={"played": stmt.excluded.played},
             )
-            self._save(waiver_db)
-        await self._flush(waiver_db)
+        )
 
     async def delete(self, waiver: dto.Waiver):
         if waiver_db := await self.get_or_none(waiver.game, waiver.player, waiver.team):
@@ -54,9 +70,23 @@ class WaiverDao(BaseDAO[models.Waiver]):
                 models.Waiver.player_id == player.id,
                 models.Waiver.game_id == game.id,
             )
+            # upsert_many пишет в обход сессии, загруженный ранее объект может быть устаревшим
+            .execution_options(populate_existing=True)
         )
         return result.scalars().one_or_none()
 
+    async def get_team_game_ids(self, team: dto.Team, game_ids: Sequence[int]) -> set[int]:
+        """из переданных игр - те, в которые команда подала вейверы"""
+        result = await self.session.scalars(
+            select(models.Waiver.game_id)
+            .distinct()
+            .where(
+                models.Waiver.team_id == team.id,
+                models.Waiver.game_id.in_(game_ids),
+            )
+        )
+        return set(result.all())
+
     async def get_played_teams(self, game: dto.Game) -> Iterable[dto.Team]:
         result = await self.session.execute(
             select(models.Waiver)
@@ -75,23 +105,35 @@ class WaiverDao(BaseDAO[models.Waiver]):
         teams: Iterable[models.Team] = map(lambda w: w.team, result.scalars().all())
         return [team.to_dto(team.chat.to_dto()) for team in teams]
 
-    async def get_played(self, game: dto.Game, team: dto.Team) -> Iterable[dto.VotedPlayer]:
+    async def get_all_played(self, game: dto.Game) -> dict[dto.Team, list[dto.VotedPlayer]]:
+        """все играющие игры по командам, одним запросом"""
         result = await self.session.execute(
             select(models.Waiver, models.TeamPlayer)
-            .options(joinedload(models.Waiver.player).joinedload(models.Player.user))
+            .options(
+                joinedload(models.Waiver.player).joinedload(models.Player.user),
+                joinedload(models.Waiver.team).joinedload(models.Team.chat),
+                joinedload(models.Waiver.team)
+                .joinedload(models.Team.captain)
+                .joinedload(models.Player.user),
+            )
             .join(models.TeamPlayer, models.Waiver.player_id == models.TeamPlayer.player_id)
             .where(
                 models.Waiver.game_id == game.id,
                 models.Waiver.played == Played.yes,
-                models.Waiver.team_id == team.id,
                 models.TeamPlayer.date_left.is_(None),
             )
+            .order_by(models.Waiver.team_id, models.Waiver.id)
         )
         waivers: Sequence[Row[models.Waiver, models.TeamPlayer]] = result.all()
-        return [
-            dto.VotedPlayer(
-                player=waiver.player.to_dto_user_prefetched(),
-                pit=team_player.to_dto(),
+        teams: dict[int, dto.Team] = {}
+        played: dict[dto.Team, list[dto.VotedPlayer]] = {}
+        for waiver, team_player in waivers:
+            if waiver.team_id not in teams:
+                teams[waiver.team_id] = waiver.team.to_dto(waiver.team.chat.to_dto())
+            played.setdefault(teams[waiver.team_id], []).append(
+                dto.VotedPlayer(
+                    player=waiver.player.to_dto_user_prefetched(),
+                    pit=team_player.to_dto(),
+                )
             )
-            for waiver, team_player in waivers
-        ]
+        return played
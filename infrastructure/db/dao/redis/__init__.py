@@ -1,2 +1,9 @@
+from .game_events import GameEventsStream  # noqa: F401
+from .hint_ledger import HintLedger  # noqa: F401
+from .level_testing import LevelTestingRedisData  # noqa: F401
+from .live_spy import LiveSpyMessages  # noqa: F401
+from .locker import RedisLockFactory  # noqa: F401
+from .orgs_cache import OrgsCache  # noqa: F401
 from .pool import PollDao  # noqa: F401
+from .replay import GameReplayStorage  # noqa: F401
 from .secure_invite import SecureInvite  # noqa: F401
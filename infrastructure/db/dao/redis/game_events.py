@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+from redis.asyncio.client import Redis
+
+from shvatka.models import dto
+from shvatka.models.enums import GameEventType
+from shvatka.views.game import GameEventPublisher
+
+STREAM_MAX_LEN = 10_000
+# лента живёт, пока по игре идут события, и недолго после финиша
+STREAM_TTL = timedelta(days=3)
+FINISHED_STREAM_TTL = timedelta(hours=1)
+
+
+class GameEventsStream(GameEventPublisher):
+    """Лента событий игры в Redis Stream, по стриму на игру"""
+
+    def __init__(self, redis: Redis, prefix: str = "game_events"):
+        self.prefix = prefix
+        self.redis = redis
+
+    async def publish(self, event: dto.GameEvent) -> None:
+        key = self._create_key(event.game_id)
+        if event.type == GameEventType.game_finished:
+            ttl = FINISHED_STREAM_TTL
+        else:
+            ttl = STREAM_TTL
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(key, _to_fields(event), maxlen=STREAM_MAX_LEN, approximate=True)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def read(
+        self, game_id: int, last_id: str = "0", block: int | None = None, count: int = 100
+    ) -> list[tuple[str, dto.GameEvent]]:
+        """
+        :param last_id: id последнего полученного события, "0" - с начала игры
+        :param block: сколько миллисекунд ждать новых событий, None - не ждать
+        """
+        response = await self.redis.xread(
+            {self._create_key(game_id): last_id}, count=count, block=block
+        )
+        if not response:
+            return []
+        _, entries = response[0]
+        return [(id_.decode(), _from_fields(fields)) for id_, fields in entries]
+
+    def _create_key(self, game_id: int) -> str:
+        return f"{self.prefix}:{game_id}"
+
+
+def _to_fields(event: dto.GameEvent) -> dict[str, str | int]:
+    fields: dict[str, str | int] = {
+        "type": event.type.value,
+        "game_id": event.game_id,
+        "team_id": event.team_id,
+        "team_name": event.team_name,
+        "level_number": event.level_number,
+        "at": event.at.isoformat(),
+    }
+    if event.key is not None:
+        fields["key"] = event.key
+    if event.hint_number is not None:
+        fields["hint_number"] = event.hint_number
+    return fields
+
+
+def _from_fields(raw: dict[bytes, bytes]) -> dto.GameEvent:
+    fields = {k.decode(): v.decode() for k, v in raw.items()}
+    return dto.GameEvent(
+        type=GameEventType(fields["type"]),
+        game_id=int(fields["game_id"]),
+        team_id=int(fields["team_id"]),
+        team_name=fields["team_name"],
+        level_number=int(fields["level_number"]),
+        at=datetime.fromisoformat(fields["at"]),
+        key=fields.get("key"),
+        hint_number=int(fields["hint_number"]) if "hint_number" in fields else None,
+    )
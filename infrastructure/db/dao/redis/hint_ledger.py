@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from redis.asyncio.client import Redis
+
+LEDGER_TTL = timedelta(days=3)
+
+
+class HintLedger:
+    """
+    Журнал отправленных подсказок: множество номеров подсказок на (игра, команда, уровень).
+    SADD атомарен, поэтому одну подсказку отметит отправленной только один отправитель
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "hint_ledger"):
+        self.prefix = prefix
+        self.redis = redis
+
+    async def mark_sent(
+        self, game_id: int, team_id: int, level_number: int, hint_number: int
+    ) -> bool:
+        """:return: False, если подсказка уже была отмечена"""
+        key = self._create_key(game_id, team_id, level_number)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(key, hint_number)
+            pipe.expire(key, LEDGER_TTL)
+            added, _ = await pipe.execute()
+        return bool(added)
+
+    async def unmark_sent(
+        self, game_id: int, team_id: int, level_number: int, hint_number: int
+    ) -> None:
+        await self.redis.srem(self._create_key(game_id, team_id, level_number), hint_number)
+
+    async def get_sent(self, game_id: int, team_id: int, level_number: int) -> set[int]:
+        members = await self.redis.smembers(self._create_key(game_id, team_id, level_number))
+        return {int(hint_number) for hint_number in members}
+
+    def _create_key(self, game_id: int, team_id: int, level_number: int) -> str:
+        return f"{self.prefix}:{game_id}:{team_id}:{level_number}"
@@ -0,0 +1,92 @@
+import json
+from datetime import datetime, timedelta
+
+from redis.asyncio.client import Redis
+
+from infrastructure.db.dao.memory.level_testing import SimpleKey, LevelTestingData
+from shvatka.interfaces.dal.level_testing import LevelTestProtocolDao
+from shvatka.models import dto
+from shvatka.utils.datetime_utils import tz_utc
+
+LEVEL_TEST_TTL = timedelta(days=1)
+
+
+class LevelTestingRedisData(LevelTestProtocolDao):
+    """
+    Протокол тестирования уровня в redis: подсказки тестеру шлёт лидер планировщика,
+    а ключи проверяет любой процесс, поэтому состояние должно быть общим
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "level_test"):
+        self.prefix = prefix
+        self.redis = redis
+
+    async def save_started_level_test(self, suite: dto.LevelTestSuite, now: datetime):
+        key = self._protocol_key(suite)
+        is_new = await self.redis.hsetnx(key, "start", now.isoformat())
+        assert is_new
+        await self.redis.expire(key, LEVEL_TEST_TTL)
+
+    async def is_still_testing(self, suite: dto.LevelTestSuite) -> bool:
+        start, stop = await self.redis.hmget(self._protocol_key(suite), "start", "stop")
+        return start is not None and stop is None
+
+    async def save_key(self, key: str, suite: dto.LevelTestSuite, is_correct: bool):
+        typed = {"text": key, "at": datetime.now(tz=tz_utc).isoformat(), "is_correct": is_correct}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(self._typed_key(suite), json.dumps(typed))
+            pipe.expire(self._typed_key(suite), LEVEL_TEST_TTL)
+            if is_correct:
+                pipe.sadd(self._correct_key(suite), key)
+                pipe.expire(self._correct_key(suite), LEVEL_TEST_TTL)
+            await pipe.execute()
+
+    async def get_correct_tested_keys(self, suite: dto.LevelTestSuite) -> set[str]:
+        return {key.decode() for key in await self.redis.smembers(self._correct_key(suite))}
+
+    async def complete_test(self, suite: dto.LevelTestSuite):
+        await self.redis.hset(
+            self._protocol_key(suite), "stop", datetime.now(tz=tz_utc).isoformat()
+        )
+
+    async def get_testing_result(self, suite: dto.LevelTestSuite) -> timedelta:
+        start, stop = await self.redis.hmget(self._protocol_key(suite), "start", "stop")
+        return datetime.fromisoformat(stop.decode()) - datetime.fromisoformat(start.decode())
+
+    async def get_all_typed(self, suite: dto.LevelTestSuite) -> list[SimpleKey]:
+        result = []
+        for raw in await self.redis.lrange(self._typed_key(suite), 0, -1):
+            typed = json.loads(raw)
+            result.append(
+                SimpleKey(
+                    text=typed["text"],
+                    at=datetime.fromisoformat(typed["at"]),
+                    is_correct=typed["is_correct"],
+                )
+            )
+        return result
+
+    async def cancel_test(self, suite: dto.LevelTestSuite):
+        await self.redis.delete(
+            self._protocol_key(suite), self._typed_key(suite), self._correct_key(suite)
+        )
+
+    async def delete_all(self):
+        async for key in self.redis.scan_iter(match=f"{self.prefix}:*"):
+            await self.redis.delete(key)
+
+    async def commit(self) -> None:
+        pass
+
+    def _protocol_key(self, suite: dto.LevelTestSuite) -> str:
+        return f"{self.prefix}:{suite.level.db_id}:{suite.tester.player.id}"
+
+    def _typed_key(self, suite: dto.LevelTestSuite) -> str:
+        return f"{self._protocol_key(suite)}:typed"
+
+    def _correct_key(self, suite: dto.LevelTestSuite) -> str:
+        return f"{self._protocol_key(suite)}:correct"
+
+
+# в памяти - для скриптов в одном процессе, в redis - для бота
+LevelTestStorage = LevelTestingData | LevelTestingRedisData
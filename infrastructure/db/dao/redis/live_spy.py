@@ -0,0 +1,35 @@
+from redis.asyncio.client import Redis
+
+
+class LiveSpyMessages:
+    """Сообщения оргов, которые обновляются по ленте событий игры"""
+
+    def __init__(self, redis: Redis, prefix: str = "live_spy"):
+        self.prefix = prefix
+        self.redis = redis
+
+    async def subscribe(self, game_id: int, chat_id: int, message_id: int) -> int | None:
+        """:return: id предыдущего сообщения в этом чате, если было"""
+        key = self._create_key(game_id)
+        old_message_id = await self.redis.hget(key, str(chat_id))
+        await self.redis.hset(key, str(chat_id), message_id)
+        await self.redis.sadd(self._games_key(), game_id)
+        return None if old_message_id is None else int(old_message_id)
+
+    async def get_games(self) -> set[int]:
+        return {int(game_id) for game_id in await self.redis.smembers(self._games_key())}
+
+    async def get_messages(self, game_id: int) -> dict[int, int]:
+        """:return: словарь chat_id: message_id"""
+        raw = await self.redis.hgetall(self._create_key(game_id))
+        return {int(chat_id): int(message_id) for chat_id, message_id in raw.items()}
+
+    async def unsubscribe_game(self, game_id: int) -> None:
+        await self.redis.srem(self._games_key(), game_id)
+        await self.redis.delete(self._create_key(game_id))
+
+    def _create_key(self, game_id: int) -> str:
+        return f"{self.prefix}:{game_id}"
+
+    def _games_key(self) -> str:
+        return f"{self.prefix}:games"
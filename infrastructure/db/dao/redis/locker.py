@@ -0,0 +1,64 @@
+import logging
+from typing import Iterable
+
+from redis.asyncio.client import Redis
+from redis.asyncio.lock import Lock
+from redis.exceptions import LockError
+
+from shvatka.models import dto
+from shvatka.utils.key_checker_lock import KeyCheckerLock, KeyCheckerFactory
+
+logger = logging.getLogger(__name__)
+
+# лок отпустится сам, если процесс, который его держит, упадёт
+LOCK_TTL = 60
+LOCK_POLL_INTERVAL = 0.01
+
+
+class RedisLock(KeyCheckerLock):
+    def __init__(self, lock: Lock):
+        self.lock = lock
+
+    async def acquire(self):
+        await self.lock.acquire()
+
+    async def release(self):
+        try:
+            await self.lock.release()
+        except LockError as e:
+            # держали дольше LOCK_TTL - лок уже мог забрать другой процесс
+            logger.error("lock %s expired before release", self.lock.name, exc_info=e)
+
+
+class RedisLockFactory(KeyCheckerFactory):
+    """
+    Локи проверки ключей в redis, общие для всех процессов и реплик бота.
+    Нужны, когда апдейты одной команды или игры могут попасть в разные процессы
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "key_lock"):
+        self.redis = redis
+        self.prefix = prefix
+
+    def lock_game(self, game: dto.Game) -> KeyCheckerLock:
+        return self._create_lock(f"game:{game.id}")
+
+    def lock_team(self, team: dto.Team) -> KeyCheckerLock:
+        return self._create_lock(f"team:{team.id}")
+
+    def lock_player(self, player: dto.Player) -> KeyCheckerLock:
+        return self._create_lock(f"player:{player.id}")
+
+    def clear(self, game: dto.Game, teams: Iterable[dto.Team]):
+        """ключи локов живут только пока лок взят, чистить нечего"""
+
+    def _create_lock(self, name: str) -> RedisLock:
+        # на каждый вход свой объект: токен владельца хранится в нём
+        return RedisLock(
+            self.redis.lock(
+                f"{self.prefix}:{name}",
+                timeout=LOCK_TTL,
+                sleep=LOCK_POLL_INTERVAL,
+                thread_local=False,
+            )
+        )
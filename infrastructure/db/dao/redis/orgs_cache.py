@@ -0,0 +1,50 @@
+import time
+
+from redis.asyncio.client import Redis
+
+from shvatka.models import dto
+
+ORGS_CACHE_TTL = 30.0
+VERSION_TTL = 24 * 60 * 60
+
+
+class OrgsCache:
+    """
+    Вторичные орги игры в памяти процесса: на каждый переход уровня
+    их читают заново, а меняются они редко.
+    Версия списка лежит в redis, поэтому invalidate в одном процессе
+    (вебхук-реплика, воркер) сбрасывает копии во всех остальных.
+    Версию надо читать до запроса в БД, а invalidate звать после коммита:
+    тогда список, прочитанный до коммита, сохранится со старой версией и не будет отдан
+    """
+
+    def __init__(self, redis: Redis, ttl: float = ORGS_CACHE_TTL, prefix: str = "orgs_version"):
+        self.redis = redis
+        self.ttl = ttl
+        self.prefix = prefix
+        self._orgs: dict[int, tuple[float, int, list[dto.SecondaryOrganizer]]] = {}
+
+    async def get_version(self, game: dto.Game) -> int:
+        return int(await self.redis.get(self._create_key(game)) or 0)
+
+    def get(self, game: dto.Game, version: int) -> list[dto.SecondaryOrganizer] | None:
+        cached = self._orgs.get(game.id)
+        if cached is None:
+            return None
+        expire_at, cached_version, orgs = cached
+        if expire_at < time.monotonic() or cached_version != version:
+            del self._orgs[game.id]
+            return None
+        return orgs
+
+    def set(self, game: dto.Game, version: int, orgs: list[dto.SecondaryOrganizer]) -> None:
+        self._orgs[game.id] = (time.monotonic() + self.ttl, version, orgs)
+
+    async def invalidate(self, game: dto.Game) -> None:
+        self._orgs.pop(game.id, None)
+        key = self._create_key(game)
+        await self.redis.incr(key)
+        await self.redis.expire(key, VERSION_TTL)
+
+    def _create_key(self, game: dto.Game) -> str:
+        return f"{self.prefix}:{game.id}"
@@ -8,74 +8,91 @@ logger = logging.getLogger(__name__)
 
 
 class PollDao:
-    def __init__(self, redis: Redis):
-        self.prefix = "poll"
-        self.msg_prefix = "msg_poll"
+    """
+    Голоса за вейверы - хэш на (игра, команда): player_id -> Played.name,
+    id сообщений с опросом - хэш на игру: chat_id -> message_id,
+    игра, за которую команда собирает вейверы - общий хэш team_id -> game_id.
+    Все ключи игры известны (множество команд игры), поэтому ни чтение,
+    ни удаление не требуют KEYS/SCAN по всей базе
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "waiver_poll"):
+        self.prefix = prefix
         self.redis = redis
 
-    async def add_player_vote(self, team_id: int, player_id: int, vote_var: str) -> None:
-        key = self._create_key(team_id=team_id, player_id=player_id)
-        await self.redis.set(key, vote_var)
-
-    async def del_player_vote(self, team_id: int, player_id: int) -> None:
-        key = self._create_key(team_id=team_id, player_id=player_id)
-        await self.redis.delete(key)
-
-    async def get_dict_player_vote(self, team_id: int) -> dict[int, Played]:
-        """
-
-        :param team_id:
-        :return: словарь в формате player_id:vote
-        """
-        return {
-            self.parse_player_id(key=key, team_id=team_id): Played[await self._get(key)]
-            for key in await self.get_list_of_keys_pool(team_id=team_id)
-        }
+    async def add_player_vote(
+        self, game_id: int, team_id: int, player_id: int, vote_var: str
+    ) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(self._votes_key(game_id, team_id), str(player_id), vote_var)
+            pipe.sadd(self._teams_key(game_id), team_id)
+            pipe.sadd(self._games_key(), game_id)
+            pipe.hset(self._team_games_key(), str(team_id), game_id)
+            await pipe.execute()
+
+    async def bind_team(self, game_id: int, team_id: int) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(self._teams_key(game_id), team_id)
+            pipe.sadd(self._games_key(), game_id)
+            pipe.hset(self._team_games_key(), str(team_id), game_id)
+            await pipe.execute()
+
+    async def get_team_game_id(self, team_id: int) -> int | None:
+        game_id = await self.redis.hget(self._team_games_key(), str(team_id))
+        return None if game_id is None else int(game_id)
+
+    async def del_player_vote(self, game_id: int, team_id: int, player_id: int) -> None:
+        await self.redis.hdel(self._votes_key(game_id, team_id), str(player_id))
+
+    async def get_dict_player_vote(self, game_id: int, team_id: int) -> dict[int, Played]:
+        """:return: словарь в формате player_id:vote"""
+        raw = await self.redis.hgetall(self._votes_key(game_id, team_id))
+        return {int(player_id): Played[vote.decode()] for player_id, vote in raw.items()}
 
     async def save_pool_msg_id(self, chat_id: int, game_id: int, msg_id: int) -> None:
-        key = self._create_msg_prefix(chat_id, game_id)
-        await self.redis.set(key, msg_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(self._msgs_key(game_id), str(chat_id), msg_id)
+            pipe.sadd(self._games_key(), game_id)
+            await pipe.execute()
 
     async def get_pool_msg_id(self, chat_id: int, game_id: int) -> int | None:
-        key = self._create_msg_prefix(chat_id, game_id)
-        msg_id = await self._get(key)
+        msg_id = await self.redis.hget(self._msgs_key(game_id), str(chat_id))
         return None if msg_id is None else int(msg_id)
 
-    def _create_key(self, team_id: int, player_id: int) -> str:
-        return f"{self.prefix}:{team_id}:{player_id}"
+    async def delete_game(self, game_id: int) -> None:
+        team_ids = [
+            int(team_id) for team_id in await self.redis.smembers(self._teams_key(game_id))
+        ]
+        keys = [self._votes_key(game_id, team_id) for team_id in team_ids]
+        keys.extend((self._teams_key(game_id), self._msgs_key(game_id)))
+        # UNLINK освобождает память в фоне и не блокирует redis на больших хэшах
+        await self.redis.unlink(*keys)
+        await self.redis.srem(self._games_key(), game_id)
+        if team_ids:
+            bound = await self.redis.hmget(self._team_games_key(), *map(str, team_ids))
+            # команда могла уже перейти к сборам на другую игру - её привязку не трогаем
+            unbind = [
+                str(t) for t, g in zip(team_ids, bound) if g is not None and int(g) == game_id
+            ]
+            if unbind:
+                await self.redis.hdel(self._team_games_key(), *unbind)
+        logger.info("poll data for game %s deleted", game_id)
 
-    def _create_msg_prefix(self, chat_id: int, game_id: int) -> str:
-        return f"{self.msg_prefix}:{chat_id}:{game_id}"
+    async def delete_all(self) -> None:
+        for game_id in await self.redis.smembers(self._games_key()):
+            await self.delete_game(int(game_id))
 
-    async def get_list_of_keys_pool(self, team_id: int) -> list[str]:
-        """
+    def _votes_key(self, game_id: int, team_id: int) -> str:
+        return f"{self.prefix}:{game_id}:{team_id}"
 
-        :param team_id:
-        :return: список ключей для команды team_id в формате prefix:team_id:player_id
-        """
-        rez = await self.redis.keys(f"{self.prefix}:{team_id}:*", encoding="utf-8")
-        return rez
+    def _teams_key(self, game_id: int) -> str:
+        return f"{self.prefix}:{game_id}:teams"
 
-    def parse_player_id(self, key: str, team_id: int) -> int:
-        """
+    def _msgs_key(self, game_id: int) -> str:
+        return f"{self.prefix}:{game_id}:msgs"
 
-        :param key: ключ в формате prefix:team_id:player_id
-        :param team_id:
-        :return: player_id
-        """
-        player_id = key[len(f"{self.prefix}:{team_id}:") :]
-        return int(player_id)
+    def _games_key(self) -> str:
+        return f"{self.prefix}:games"
 
-    async def delete_all(self) -> None:
-        keys: list = await self.redis.keys(f"{self.prefix}:*")
-        keys.extend(await self.redis.keys(f"{self.msg_prefix}:*"))
-        if len(keys) == 0:
-            return logger.warning("pool-keys to delete not found")
-        logger.warning("Next keys was deleted %s", ", ".join([key.decode() for key in keys]))
-        await self.redis.delete(*keys)
-
-    async def _get(self, key: str, encoding: str = "utf-8"):
-        value = await self.redis.get(key)
-        if value is None:
-            return None
-        return value.decode(encoding)
+    def _team_games_key(self) -> str:
+        return f"{self.prefix}:team_games"
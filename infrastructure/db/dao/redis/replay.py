@@ -0,0 +1,67 @@
+import json
+from datetime import datetime
+
+from redis.asyncio.client import Redis
+
+from shvatka.models import dto
+from shvatka.utils.datetime_utils import tz_utc
+
+
+class GameReplayStorage:
+    """
+    Индексы повтора завершённых игр.
+    Завершённая игра не меняется, поэтому ключи живут без ttl
+    """
+
+    def __init__(self, redis: Redis, prefix: str = "game_replay"):
+        self.prefix = prefix
+        self.redis = redis
+
+    async def get_replay(self, game_id: int) -> dto.GameReplay | None:
+        raw = await self.redis.get(self._create_key(game_id))
+        if raw is None:
+            return None
+        return _from_json(game_id, json.loads(raw))
+
+    async def save_replay(self, replay: dto.GameReplay) -> None:
+        await self.redis.set(self._create_key(replay.game_id), json.dumps(_to_json(replay)))
+
+    def _create_key(self, game_id: int) -> str:
+        return f"{self.prefix}:{game_id}"
+
+
+def _to_json(replay: dto.GameReplay) -> dict:
+    return {
+        "levels_count": replay.levels_count,
+        "teams": [
+            {
+                "id": team.team_id,
+                "name": team.team_name,
+                "levels": [at.timestamp() for at in team.level_starts],
+                "correct": [at.timestamp() for at in team.correct_keys],
+                "wrong": [at.timestamp() for at in team.wrong_keys],
+            }
+            for team in replay.teams
+        ],
+    }
+
+
+def _from_json(game_id: int, data: dict) -> dto.GameReplay:
+    return dto.GameReplay(
+        game_id=game_id,
+        levels_count=data["levels_count"],
+        teams=[
+            dto.TeamReplay(
+                team_id=team["id"],
+                team_name=team["name"],
+                level_starts=_to_datetimes(team["levels"]),
+                correct_keys=_to_datetimes(team["correct"]),
+                wrong_keys=_to_datetimes(team["wrong"]),
+            )
+            for team in data["teams"]
+        ],
+    )
+
+
+def _to_datetimes(timestamps: list[float]) -> list[datetime]:
+    return [datetime.fromtimestamp(ts, tz=tz_utc) for ts in timestamps]
@@ -8,6 +8,8 @@ from sqlalchemy.orm import sessionmaker
 from infrastructure.db.config.models.db import DBConfig, RedisConfig
 from infrastructure.db.dao.memory.level_testing import LevelTestingData
 from infrastructure.db.dao.memory.locker import MemoryLockFactory
+from infrastructure.db.dao.redis.level_testing import LevelTestingRedisData, LevelTestStorage
+from infrastructure.db.dao.redis.locker import RedisLockFactory
 from shvatka.utils.key_checker_lock import KeyCheckerFactory
 
 logger = logging.getLogger(__name__)
@@ -19,7 +21,13 @@ def create_pool(db_config: DBConfig) -> sessionmaker:
     return pool
 
 
-def create_lock_factory() -> KeyCheckerFactory:
+def create_lock_factory(redis: Redis | None = None) -> KeyCheckerFactory:
+    """
+    :param redis: если бот работает больше чем в одном процессе,
+    локи должны быть общими для всех, то есть в redis
+    """
+    if redis is not None:
+        return RedisLockFactory(redis=redis)
     return MemoryLockFactory()
 
 
@@ -28,6 +36,11 @@ def create_redis(config: RedisConfig) -> Redis:
     return Redis(host=config.url, port=config.port, db=config.db)
 
 
-def create_level_test_dao():
-    level_test_dao = LevelTestingData()
-    return level_test_dao
+def create_level_test_dao(redis: Redis | None = None) -> LevelTestStorage:
+    """
+    :param redis: у бота подсказки тестерам шлёт лидер планировщика,
+    а им может оказаться любой процесс - тогда тестирование хранится в redis
+    """
+    if redis is not None:
+        return LevelTestingRedisData(redis=redis)
+    return LevelTestingData()
@@ -0,0 +1,68 @@
+"""
+Перенос голосов за вейверы из старого формата (строка на игрока poll:{team}:{player},
+msg_poll:{chat}:{game}) в хэши PollDao. Старые голоса не знали игру,
+поэтому относятся к текущей активной игре. Запускать один раз при деплое.
+
+python -m infrastructure.db.migrate_poll_keys
+"""
+import asyncio
+import logging
+
+from redis.asyncio.client import Redis
+from sqlalchemy.orm import close_all_sessions
+
+from common.config.parser.logging_config import setup_logging
+from common.config.parser.paths import common_get_paths
+from infrastructure.db.dao import GameDao, PollDao
+from infrastructure.db.faсtory import create_pool, create_redis
+from tgbot.config.parser.main import load_config
+
+logger = logging.getLogger(__name__)
+
+OLD_VOTE_PREFIX = "poll"
+OLD_MSG_PREFIX = "msg_poll"
+
+
+async def migrate(redis: Redis, poll: PollDao, game_id: int | None) -> int:
+    migrated = []
+    # SCAN только здесь: разовый проход по старым ключам, в рабочем коде его нет
+    async for key in redis.scan_iter(match=f"{OLD_VOTE_PREFIX}:*", count=500):
+        _, team_id, player_id = key.decode().split(":")
+        vote = await redis.get(key)
+        if game_id is not None and vote is not None:
+            await poll.add_player_vote(game_id, int(team_id), int(player_id), vote.decode())
+        migrated.append(key)
+    async for key in redis.scan_iter(match=f"{OLD_MSG_PREFIX}:*", count=500):
+        _, chat_id, msg_game_id = key.decode().split(":")
+        msg_id = await redis.get(key)
+        if msg_id is not None:
+            await poll.save_pool_msg_id(int(chat_id), int(msg_game_id), int(msg_id))
+        migrated.append(key)
+    if migrated:
+        await redis.unlink(*migrated)
+    return len(migrated)
+
+
+async def main():
+    paths = common_get_paths("BOT_PATH")
+
+    setup_logging(paths)
+    config = load_config(paths)
+    pool = create_pool(config.db)
+    redis = create_redis(config.redis)
+    try:
+        async with pool() as session:
+            games = await GameDao(session).get_active_games()
+        # старые ключи не содержат игры - отнести их можно только к единственной активной
+        game = games[0] if len(games) == 1 else None
+        if game is None:
+            logger.warning("no single active game, old votes will be dropped")
+        count = await migrate(redis, PollDao(redis), game.id if game else None)
+        logger.info("%s old poll keys migrated", count)
+    finally:
+        close_all_sessions()
+        await redis.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+"""levels scenario to jsonb
+
+Revision ID: a3b7e0d5c1f2
+Revises: c076368bb3aa
+Create Date: 2023-02-12 14:35:18.104523
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "a3b7e0d5c1f2"
+down_revision = "c076368bb3aa"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        "levels",
+        "scenario",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="scenario::jsonb",
+    )
+
+
+def downgrade():
+    op.alter_column(
+        "levels",
+        "scenario",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="scenario::json",
+    )
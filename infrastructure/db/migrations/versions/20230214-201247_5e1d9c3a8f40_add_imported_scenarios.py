@@ -0,0 +1,37 @@
+"""add imported scenarios
+
+Revision ID: 5e1d9c3a8f40
+Revises: a3b7e0d5c1f2
+Create Date: 2023-02-14 20:12:47.381920
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e1d9c3a8f40"
+down_revision = "a3b7e0d5c1f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "imported_scenarios",
+        sa.Column("checksum", sa.Text(), nullable=False),
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "imported_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["game_id"], ["games.id"], name=op.f("imported_scenarios_game_id_fkey")
+        ),
+        sa.PrimaryKeyConstraint("checksum", name=op.f("pk__imported_scenarios")),
+    )
+
+
+def downgrade():
+    op.drop_table("imported_scenarios")
@@ -0,0 +1,64 @@
+"""add games teams stats
+
+Revision ID: 9b4c2f6e7d15
+Revises: 5e1d9c3a8f40
+Create Date: 2023-02-18 11:34:02.551873
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b4c2f6e7d15"
+down_revision = "5e1d9c3a8f40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "games_teams_stats",
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=False),
+        sa.Column("level_number", sa.Integer(), nullable=False),
+        sa.Column(
+            "level_started_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("keys_typed", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("wrong_keys", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(
+            ["game_id"], ["games.id"], name=op.f("games_teams_stats_game_id_fkey")
+        ),
+        sa.ForeignKeyConstraint(
+            ["team_id"], ["teams.id"], name=op.f("games_teams_stats_team_id_fkey")
+        ),
+        sa.PrimaryKeyConstraint("game_id", "team_id", name=op.f("pk__games_teams_stats")),
+    )
+    op.execute(
+        """
+        INSERT INTO games_teams_stats
+            (game_id, team_id, level_number, level_started_at, keys_typed, wrong_keys)
+        SELECT DISTINCT ON (lt.game_id, lt.team_id)
+            lt.game_id,
+            lt.team_id,
+            lt.level_number,
+            lt.start_at,
+            (
+                SELECT count(*) FROM log_keys lk
+                WHERE lk.game_id = lt.game_id AND lk.team_id = lt.team_id
+            ),
+            (
+                SELECT count(*) FROM log_keys lk
+                WHERE lk.game_id = lt.game_id AND lk.team_id = lt.team_id AND NOT lk.is_correct
+            )
+        FROM levels_times lt
+        ORDER BY lt.game_id, lt.team_id, lt.level_number DESC
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("games_teams_stats")
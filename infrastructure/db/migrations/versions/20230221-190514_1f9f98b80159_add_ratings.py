@@ -0,0 +1,86 @@
+"""add ratings
+
+Revision ID: 1f9f98b80159
+Revises: 9b4c2f6e7d15
+Create Date: 2023-02-21 19:05:14.204761
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1f9f98b80159"
+down_revision = "9b4c2f6e7d15"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "ratings",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=True),
+        sa.Column("player_id", sa.BigInteger(), nullable=True),
+        sa.Column("rating", sa.Float(), nullable=False),
+        sa.Column("games_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_game_id", sa.Integer(), nullable=False),
+        sa.CheckConstraint(
+            "(team_id IS NULL) <> (player_id IS NULL)",
+            name=op.f("ck__ratings__team_xor_player"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["last_game_id"], ["games.id"], name=op.f("ratings_last_game_id_fkey")
+        ),
+        sa.ForeignKeyConstraint(
+            ["player_id"], ["players.id"], name=op.f("ratings_player_id_fkey")
+        ),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"], name=op.f("ratings_team_id_fkey")),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__ratings")),
+        sa.UniqueConstraint("player_id", name=op.f("uq__ratings__player_id")),
+        sa.UniqueConstraint("team_id", name=op.f("uq__ratings__team_id")),
+    )
+    op.create_index(
+        "ix__ratings_players_rating",
+        "ratings",
+        ["rating"],
+        unique=False,
+        postgresql_where=sa.text("player_id IS NOT NULL"),
+    )
+    op.create_index(
+        "ix__ratings_teams_rating",
+        "ratings",
+        ["rating"],
+        unique=False,
+        postgresql_where=sa.text("team_id IS NOT NULL"),
+    )
+    op.create_table(
+        "ratings_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=True),
+        sa.Column("player_id", sa.BigInteger(), nullable=True),
+        sa.Column("place", sa.Integer(), nullable=False),
+        sa.Column("rating_before", sa.Float(), nullable=False),
+        sa.Column("rating_after", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["game_id"], ["games.id"], name=op.f("ratings_snapshots_game_id_fkey")
+        ),
+        sa.ForeignKeyConstraint(
+            ["player_id"], ["players.id"], name=op.f("ratings_snapshots_player_id_fkey")
+        ),
+        sa.ForeignKeyConstraint(
+            ["team_id"], ["teams.id"], name=op.f("ratings_snapshots_team_id_fkey")
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk__ratings_snapshots")),
+    )
+    op.create_index(
+        op.f("ix__ratings_snapshots_game_id"), "ratings_snapshots", ["game_id"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix__ratings_snapshots_game_id"), table_name="ratings_snapshots")
+    op.drop_table("ratings_snapshots")
+    op.drop_index("ix__ratings_teams_rating", table_name="ratings")
+    op.drop_index("ix__ratings_players_rating", table_name="ratings")
+    op.drop_table("ratings")
@@ -5,11 +5,14 @@ from .file_info import FileInfo  # noqa: F401
 from .forum_team import ForumTeam  # noqa: F401
 from .forum_user import ForumUser  # noqa: F401
 from .game import Game  # noqa: F401
+from .game_team_stat import GameTeamStat  # noqa: F401
+from .imported_scenario import ImportedScenario  # noqa: F401
 from .level import Level  # noqa: F401
 from .levels_times import LevelTime  # noqa: F401
 from .log_keys import KeyTime  # noqa: F401
 from .organizer import Organizer  # noqa: F401
 from .player import Player  # noqa: F401
+from .rating import Rating, RatingSnapshot  # noqa: F401
 from .team import Team  # noqa: F401
 from .team_player import TeamPlayer  # noqa: F401
 from .user import User  # noqa: F401
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlalchemy import Integer, ForeignKey, DateTime, func
+from sqlalchemy.orm import relationship, mapped_column
+
+from infrastructure.db.models import Base
+from shvatka.models import dto
+from shvatka.utils.datetime_utils import tz_utc
+
+
+class GameTeamStat(Base):
+    """
+    Текущее состояние команды на игре.
+    Обновляется в одной транзакции с levels_times и log_keys
+    """
+
+    __tablename__ = "games_teams_stats"
+    __mapper_args__ = {"eager_defaults": True}
+    game_id = mapped_column(ForeignKey("games.id"), primary_key=True)
+    team_id = mapped_column(ForeignKey("teams.id"), primary_key=True)
+    team = relationship("Team", foreign_keys=team_id)
+    level_number = mapped_column(Integer, nullable=False)
+    level_started_at = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(tz=tz_utc),
+        server_default=func.now(),
+        nullable=False,
+    )
+    keys_typed = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    wrong_keys = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return (
+            f"<GameTeamStat game_id={self.game_id} team_id={self.team_id} "
+            f"level_number={self.level_number} >"
+        )
+
+    def to_dto(self, game: dto.Game, team: dto.Team, max_level_number: int) -> dto.TeamProgress:
+        return dto.TeamProgress(
+            game=game,
+            team=team,
+            level_number=self.level_number,
+            start_at=self.level_started_at,
+            keys_typed=self.keys_typed,
+            wrong_keys=self.wrong_keys,
+            is_finished=self.level_number > max_level_number,
+        )
@@ -0,0 +1,21 @@
+from sqlalchemy import Text, ForeignKey, DateTime, func
+from sqlalchemy.orm import mapped_column
+
+from infrastructure.db.models.base import Base
+
+
+class ImportedScenario(Base):
+    """Загруженные из архивов сценарии, по контрольной сумме архива"""
+
+    __tablename__ = "imported_scenarios"
+    __mapper_args__ = {"eager_defaults": True}
+    checksum = mapped_column(Text, primary_key=True)
+    game_id = mapped_column(ForeignKey("games.id"), nullable=False)
+    imported_at = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"<ImportedScenario checksum={self.checksum} game_id={self.game_id} >"
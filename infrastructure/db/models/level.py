@@ -1,7 +1,8 @@
 from typing import Any
 
 from dataclass_factory import Factory
-from sqlalchemy import Integer, Text, ForeignKey, JSON, TypeDecorator, UniqueConstraint
+from sqlalchemy import Integer, Text, ForeignKey, TypeDecorator, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 
@@ -11,7 +12,7 @@ from shvatka.models.dto.scn.level import LevelScenario
 
 
 class ScenarioField(TypeDecorator):
-    impl = JSON
+    impl = JSONB
     cache_ok = True
     dcf = Factory()
 
@@ -0,0 +1,61 @@
+from sqlalchemy import Integer, Float, ForeignKey, CheckConstraint, Index, text
+from sqlalchemy.orm import relationship, mapped_column
+
+from infrastructure.db.models import Base
+from shvatka.models import dto
+
+
+class Rating(Base):
+    """Текущий рейтинг команды или игрока (ровно одно из двух)"""
+
+    __tablename__ = "ratings"
+    __mapper_args__ = {"eager_defaults": True}
+    id = mapped_column(Integer, primary_key=True)
+    team_id = mapped_column(ForeignKey("teams.id"), unique=True, nullable=True)
+    team = relationship("Team", foreign_keys=team_id)
+    player_id = mapped_column(ForeignKey("players.id"), unique=True, nullable=True)
+    player = relationship("Player", foreign_keys=player_id)
+    rating = mapped_column(Float, nullable=False)
+    games_count = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_game_id = mapped_column(ForeignKey("games.id"), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("(team_id IS NULL) <> (player_id IS NULL)", name="team_xor_player"),
+        # лидерборд - обратный проход по одному из индексов
+        Index("ix__ratings_teams_rating", "rating", postgresql_where=text("team_id IS NOT NULL")),
+        Index(
+            "ix__ratings_players_rating", "rating", postgresql_where=text("player_id IS NOT NULL")
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<Rating id={self.id} team_id={self.team_id} "
+            f"player_id={self.player_id} rating={self.rating} >"
+        )
+
+    def to_team_dto(self, team: dto.Team) -> dto.TeamRating:
+        return dto.TeamRating(team=team, rating=self.rating, games_count=self.games_count)
+
+    def to_player_dto(self, player: dto.Player) -> dto.PlayerRating:
+        return dto.PlayerRating(player=player, rating=self.rating, games_count=self.games_count)
+
+
+class RatingSnapshot(Base):
+    """Рейтинг команды или игрока до и после конкретной игры"""
+
+    __tablename__ = "ratings_snapshots"
+    __mapper_args__ = {"eager_defaults": True}
+    id = mapped_column(Integer, primary_key=True)
+    game_id = mapped_column(ForeignKey("games.id"), nullable=False, index=True)
+    team_id = mapped_column(ForeignKey("teams.id"), nullable=True)
+    player_id = mapped_column(ForeignKey("players.id"), nullable=True)
+    place = mapped_column(Integer, nullable=False)
+    rating_before = mapped_column(Float, nullable=False)
+    rating_after = mapped_column(Float, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<RatingSnapshot game_id={self.game_id} team_id={self.team_id} "
+            f"player_id={self.player_id} {self.rating_before}->{self.rating_after} >"
+        )
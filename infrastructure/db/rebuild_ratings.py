@@ -0,0 +1,39 @@
+"""
+Пересчёт рейтингов команд и игроков с нуля по всем завершённым играм.
+Нужен после изменения формулы или ручной правки результатов.
+
+python -m infrastructure.db.rebuild_ratings
+"""
+import asyncio
+import logging
+import time
+
+from sqlalchemy.orm import close_all_sessions
+
+from common.config.parser.logging_config import setup_logging
+from common.config.parser.paths import common_get_paths
+from infrastructure.db.dao import RatingDao
+from infrastructure.db.faсtory import create_pool
+from shvatka.services.rating import rebuild_ratings
+from tgbot.config.parser.main import load_config
+
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    paths = common_get_paths("BOT_PATH")
+
+    setup_logging(paths)
+    config = load_config(paths)
+    pool = create_pool(config.db)
+    try:
+        async with pool() as session:
+            started_at = time.monotonic()
+            await rebuild_ratings(RatingDao(session))
+            logger.info("ratings rebuilt in %.1f s", time.monotonic() - started_at)
+    finally:
+        close_all_sessions()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,140 @@
+"""
+Выгрузка levels_times и log_keys за период (например сезон) в CSV или Parquet.
+Строки читаются из бд порциями (yield_per) и сразу пишутся в файл.
+
+python -m infrastructure.export.season --since 2022-09-01 --until 2023-07-01 --format parquet
+"""
+import argparse
+import asyncio
+import csv
+import logging
+from datetime import datetime, date
+from pathlib import Path
+from typing import AsyncIterable, Sequence, Any
+
+from sqlalchemy.orm import close_all_sessions
+
+from common.config.models.paths import Paths
+from common.config.parser.logging_config import setup_logging
+from common.config.parser.paths import common_get_paths
+from infrastructure.db.dao.rdb import level_times, log_keys
+from infrastructure.db.dao.holder import HolderDao
+from infrastructure.db.faсtory import create_pool, create_redis, create_level_test_dao
+from shvatka.utils.datetime_utils import tz_game
+from tgbot.config.parser.main import load_config
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 5000
+
+
+async def write_csv(rows: AsyncIterable[Sequence[Any]], columns: Sequence[str], path: Path) -> int:
+    count = 0
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        async for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+async def write_parquet(
+    rows: AsyncIterable[Sequence[Any]],
+    columns: Sequence[str],
+    path: Path,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("parquet export requires pyarrow: poetry install -E parquet") from e
+
+    count = 0
+    writer = None
+    schema = None
+    batch: list[Sequence[Any]] = []
+
+    def flush():
+        nonlocal writer, schema
+        table = pa.Table.from_pydict(
+            {name: [row[i] for row in batch] for i, name in enumerate(columns)},
+            schema=schema,
+        )
+        if writer is None:
+            schema = table.schema
+            writer = pq.ParquetWriter(path, schema)
+        writer.write_table(table)
+        batch.clear()
+
+    try:
+        async for row in rows:
+            batch.append(tuple(row))
+            count += 1
+            if len(batch) >= batch_size:
+                flush()
+        if batch or writer is None:
+            flush()
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+WRITERS = {
+    "csv": write_csv,
+    "parquet": write_parquet,
+}
+
+
+async def export_season(
+    dao: HolderDao, since: datetime, until: datetime, format_: str, path: Path
+) -> None:
+    write = WRITERS[format_]
+    path.mkdir(parents=True, exist_ok=True)
+    exports = (
+        ("levels_times", level_times.EXPORT_COLUMNS, dao.level_time.iter_for_export),
+        ("log_keys", log_keys.EXPORT_COLUMNS, dao.key_time.iter_for_export),
+    )
+    for name, columns, iter_rows in exports:
+        file = path / f"{name}_{since:%Y%m%d}_{until:%Y%m%d}.{format_}"
+        count = await write(iter_rows(since, until, BATCH_SIZE), columns, file)
+        logger.info("exported %s rows of %s to %s", count, name, file)
+
+
+async def main(since: date, until: date, format_: str, path: Path):
+    paths = get_paths()
+
+    setup_logging(paths)
+    config = load_config(paths)
+    pool = create_pool(config.db)
+    try:
+        async with (
+            pool() as session,
+            create_redis(config.redis) as redis,
+        ):
+            dao = HolderDao(session, redis, create_level_test_dao())
+            await export_season(
+                dao=dao,
+                since=datetime.combine(since, datetime.min.time(), tzinfo=tz_game),
+                until=datetime.combine(until, datetime.min.time(), tzinfo=tz_game),
+                format_=format_,
+                path=path,
+            )
+    finally:
+        close_all_sessions()
+
+
+def get_paths() -> Paths:
+    return common_get_paths("EXPORT_PATH")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--since", type=date.fromisoformat, required=True)
+    parser.add_argument("--until", type=date.fromisoformat, required=True)
+    parser.add_argument("--format", choices=WRITERS.keys(), default="csv")
+    parser.add_argument("--out", type=Path, default=Path("export"))
+    args = parser.parse_args()
+    asyncio.run(main(args.since, args.until, args.format, args.out))
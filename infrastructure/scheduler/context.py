@@ -5,7 +5,7 @@ from redis.asyncio import Redis
 from sqlalchemy.orm import sessionmaker
 
 from infrastructure.db.dao.holder import HolderDao
-from infrastructure.db.dao.memory.level_testing import LevelTestingData
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
 from shvatka.interfaces.clients.file_storage import FileStorage
 from shvatka.interfaces.scheduler import Scheduler
 
@@ -22,7 +22,7 @@ class ScheduledContextHolder:
     scheduler: Scheduler
     file_storage: FileStorage
     game_log_chat: int
-    level_test_dao: LevelTestingData
+    level_test_dao: LevelTestStorage
 
 
 @dataclass
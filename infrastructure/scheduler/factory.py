@@ -3,10 +3,9 @@ from redis.asyncio import Redis
 from sqlalchemy.orm import sessionmaker
 
 from infrastructure.db.config.models.db import RedisConfig
-from infrastructure.db.dao.memory.level_testing import LevelTestingData
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
 from infrastructure.scheduler import ApScheduler
 from shvatka.interfaces.clients.file_storage import FileStorage
-from shvatka.interfaces.scheduler import Scheduler
 
 
 def create_scheduler(
@@ -16,8 +15,8 @@ def create_scheduler(
     redis_config: RedisConfig,
     game_log_chat: int,
     file_storage: FileStorage,
-    level_test_dao: LevelTestingData,
-) -> Scheduler:
+    level_test_dao: LevelTestStorage,
+) -> ApScheduler:
     return ApScheduler(
         redis_config=redis_config,
         pool=pool,
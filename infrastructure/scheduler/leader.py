@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import uuid
+from typing import Callable, Coroutine, Any
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY = "SH.scheduler_leader"
+LEASE_TTL = 5.0
+
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderLease:
+    """
+    Аренда лидерства в redis: ключ с TTL, продлить или отпустить его может
+    только тот, кто его поставил. Лидер, переставший продлевать аренду
+    (упал, потерял связь), теряет её через ttl секунд
+    """
+
+    def __init__(self, redis: Redis, key: str = LEASE_KEY, ttl: float = LEASE_TTL):
+        self.redis = redis
+        self.key = key
+        self.ttl_ms = int(ttl * 1000)
+        self.holder = uuid.uuid4().hex
+        self.renew_script = redis.register_script(RENEW_SCRIPT)
+        self.release_script = redis.register_script(RELEASE_SCRIPT)
+
+    async def acquire_or_renew(self) -> bool:
+        if await self.renew_script(keys=[self.key], args=[self.holder, self.ttl_ms]):
+            return True
+        return bool(await self.redis.set(self.key, self.holder, nx=True, px=self.ttl_ms))
+
+    async def release(self) -> None:
+        await self.release_script(keys=[self.key], args=[self.holder])
+
+
+class LeaderTasks:
+    """
+    Фоновые задачи, которые должны идти ровно в одном процессе:
+    запускаются, когда процесс становится лидером, и отменяются, когда он им быть перестаёт
+    """
+
+    def __init__(self):
+        self.jobs: list[Callable[[], Coroutine[Any, Any, None]]] = []
+        self.tasks: list[asyncio.Task] = []
+        self.is_running = False
+
+    def add(self, job: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        self.jobs.append(job)
+        if self.is_running:
+            self.tasks.append(asyncio.create_task(job()))
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self.is_running = True
+        self.tasks = [asyncio.create_task(job()) for job in self.jobs]
+
+    def stop(self) -> None:
+        self.is_running = False
+        for task in self.tasks:
+            task.cancel()
+        self.tasks.clear()
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 from datetime import datetime
+from typing import Callable, Coroutine, Any
 
 from aiogram import Bot
 from apscheduler.executors.asyncio import AsyncIOExecutor
@@ -10,13 +12,15 @@ from redis.asyncio import Redis
 from sqlalchemy.orm import sessionmaker
 
 from infrastructure.db.config.models.db import RedisConfig
-from infrastructure.db.dao.memory.level_testing import LevelTestingData
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
 from infrastructure.scheduler.context import ScheduledContextHolder
+from infrastructure.scheduler.leader import LeaderLease, LeaderTasks
 from infrastructure.scheduler.wrappers import (
     prepare_game_wrapper,
     start_game_wrapper,
     send_hint_wrapper,
     send_hint_for_testing_wrapper,
+    catch_up_hints_wrapper,
 )
 from shvatka.interfaces.clients.file_storage import FileStorage
 from shvatka.interfaces.scheduler import Scheduler, LevelTestScheduler
@@ -25,6 +29,8 @@ from shvatka.utils.datetime_utils import tz_utc
 
 logger = logging.getLogger(__name__)
 
+JOBS_POLL_INTERVAL = 1
+
 
 class ApScheduler(Scheduler, LevelTestScheduler):
     def __init__(
@@ -33,10 +39,15 @@ class ApScheduler(Scheduler, LevelTestScheduler):
         pool: sessionmaker,
         redis: Redis,
         file_storage: FileStorage,
-        level_test_dao: LevelTestingData,
+        level_test_dao: LevelTestStorage,
         bot: Bot,
         game_log_chat: int,
     ):
+        self.lease = LeaderLease(redis)
+        self.is_leader = False
+        self.election_task: asyncio.Task | None = None
+        self.catch_up_task: asyncio.Task | None = None
+        self.leader_tasks = LeaderTasks()
         ScheduledContextHolder.poll = pool
         ScheduledContextHolder.redis = redis
         ScheduledContextHolder.bot = bot
@@ -115,6 +126,9 @@ class ApScheduler(Scheduler, LevelTestScheduler):
             trigger="date",
             run_date=run_at,
             timezone=tz_utc,
+            # догонялка подсказок после рестарта и смены лидера планирует ту же задачу заново
+            id=_hint_key(level, team, hint_number),
+            replace_existing=True,
         )
 
     async def plain_test_hint(
@@ -136,10 +150,56 @@ class ApScheduler(Scheduler, LevelTestScheduler):
             timezone=tz_utc,
         )
 
+    def run_while_leader(self, job: Callable[[], Coroutine[Any, Any, None]]):
+        """фоновая задача, которая идёт только в процессе-лидере"""
+        self.leader_tasks.add(job)
+
     async def start(self):
-        self.scheduler.start()
+        # задачи выполняет только лидер, остальные процессы на паузе
+        # и лишь сохраняют задачи в общий job store
+        self.scheduler.start(paused=True)
+        await self.elect()
+        self.election_task = asyncio.create_task(self._election_loop())
+
+    async def elect(self):
+        try:
+            is_leader = await self.lease.acquire_or_renew()
+        except Exception as e:
+            logger.exception("can't renew scheduler lease", exc_info=e)
+            is_leader = False
+        if is_leader and not self.is_leader:
+            logger.info("became scheduler leader")
+            self.scheduler.resume()
+            self.leader_tasks.start()
+            # прежний лидер мог упасть посреди игры - досылаем пропущенное
+            self.catch_up_task = asyncio.create_task(self._catch_up())
+        elif not is_leader and self.is_leader:
+            logger.warning("lost scheduler leadership")
+            self.scheduler.pause()
+            self.leader_tasks.stop()
+        elif is_leader:
+            # задачи, добавленные другими процессами, планировщик сам не заметит
+            self.scheduler.wakeup()
+        self.is_leader = is_leader
+
+    async def _catch_up(self):
+        try:
+            await catch_up_hints_wrapper()
+        except Exception as e:
+            logger.exception("can't catch up hints", exc_info=e)
+
+    async def _election_loop(self):
+        while True:
+            await asyncio.sleep(JOBS_POLL_INTERVAL)
+            await self.elect()
 
     async def close(self):
+        if self.election_task:
+            self.election_task.cancel()
+        self.leader_tasks.stop()
+        if self.is_leader:
+            # отдаём аренду сразу, не дожидаясь истечения TTL
+            await self.lease.release()
         self.scheduler.shutdown()
         self.executor.shutdown()
         self.job_store.shutdown()
@@ -158,3 +218,7 @@ def _prepare_game_key(game: dto.Game) -> str:
 
 def _start_game_key(game: dto.Game) -> str:
     return f"game-{game.id}-start"
+
+
+def _hint_key(level: dto.Level, team: dto.Team, hint_number: int) -> str:
+    return f"hint:{team.id}:{level.db_id}:{hint_number}"
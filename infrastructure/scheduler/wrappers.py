@@ -6,7 +6,8 @@ from infrastructure.db.dao.holder import HolderDao
 from infrastructure.scheduler.context import ScheduledContextHolder, ScheduledContext
 from shvatka.interfaces.scheduler import LevelTestScheduler
 from shvatka.models import dto
-from shvatka.services.game_play import prepare_game, start_game, send_hint
+from shvatka.models.enums import GameStatus
+from shvatka.services.game_play import prepare_game, start_game, send_hint, catch_up_hints
 from shvatka.services.level_testing import send_testing_level_hint
 from shvatka.services.organizers import get_by_player
 from tgbot.views.game import GameBotLog, create_bot_game_view
@@ -51,6 +52,7 @@ async def start_game_wrapper(game_id: int, author_id: int):
             game_log=GameBotLog(bot=context.bot, log_chat_id=context.game_log_chat),
             view=create_bot_game_view(context.bot, context.dao, context.file_storage),
             scheduler=context.scheduler,
+            events=context.dao.game_events,
         )
 
 
@@ -63,12 +65,27 @@ async def send_hint_wrapper(level_id: int, team_id: int, hint_number: int):
             level=level,
             hint_number=hint_number,
             team=team,
-            dao=context.dao.level_time,
+            dao=context.dao.hint_sender,
             view=create_bot_game_view(context.bot, context.dao, context.file_storage),
             scheduler=context.scheduler,
+            events=context.dao.game_events,
         )
 
 
+async def catch_up_hints_wrapper():
+    async with prepare_context() as context:  # type: ScheduledContext
+        for game in await context.dao.game.get_active_games():
+            if game.status != GameStatus.started:
+                continue
+            await catch_up_hints(
+                game=await context.dao.game.get_full(game.id),
+                dao=context.dao.hint_sender,
+                view=create_bot_game_view(context.bot, context.dao, context.file_storage),
+                scheduler=context.scheduler,
+                events=context.dao.game_events,
+            )
+
+
 async def send_hint_for_testing_wrapper(
     level_id: int, game_id: int, player_id: int, hint_number: int
 ):
@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from shvatka.interfaces.dal.base import Committer
 from shvatka.interfaces.dal.level import LevelUpserter
+from shvatka.interfaces.dal.rating import RatingUpdater
+from shvatka.interfaces.dal.replay import GameReplaySaver
 from shvatka.models import dto
 from shvatka.models.dto import scn
 
@@ -28,7 +30,13 @@ class GameStatusCompleter(Protocol):
 
 
 class GameCompleter(
-    MaxGameNumberGetter, GameNumberUpdater, GameStatusCompleter, Committer, Protocol
+    MaxGameNumberGetter,
+    GameNumberUpdater,
+    GameStatusCompleter,
+    GameReplaySaver,
+    RatingUpdater,
+    Committer,
+    Protocol,
 ):
     pass
 
@@ -77,16 +85,38 @@ class GameByIdGetter(Protocol):
 
 
 class ActiveGameFinder(Protocol):
-    async def get_active_game(self) -> dto.Game | None:
+    async def get_active_games(self) -> list[dto.Game]:
         raise NotImplementedError
 
 
-class WaiverStarter(Committer, ActiveGameFinder, Protocol):
+class ActiveGameRouter(ActiveGameFinder, Protocol):
+    async def get_team(self, player: dto.Player) -> dto.Team | None:
+        raise NotImplementedError
+
+    async def get_team_game_ids(self, team: dto.Team, game_ids: Sequence[int]) -> set[int]:
+        raise NotImplementedError
+
+    async def get_bound_game_id(self, team: dto.Team) -> int | None:
+        raise NotImplementedError
+
+    async def get_org_game_ids(self, player: dto.Player, game_ids: Sequence[int]) -> set[int]:
+        raise NotImplementedError
+
+
+class TeamGameBinder(ActiveGameFinder, Protocol):
+    async def bind_team(self, game: dto.Game, team: dto.Team) -> None:
+        raise NotImplementedError
+
+    async def get_team_game_ids(self, team: dto.Team, game_ids: Sequence[int]) -> set[int]:
+        raise NotImplementedError
+
+
+class WaiverStarter(Committer, Protocol):
     async def start_waivers(self, game: dto.Game) -> None:
         raise NotImplementedError
 
 
-class GameStartPlanner(Committer, ActiveGameFinder, Protocol):
+class GameStartPlanner(Committer, Protocol):
     async def set_start_at(self, game: dto.Game, start_at: datetime) -> None:
         raise NotImplementedError
 
@@ -101,6 +131,9 @@ class GamePackager(Protocol):
     async def get_by_guid(self, guid: str) -> scn.VerifiableFileMeta:
         raise NotImplementedError
 
+    async def get_guids(self, game: dto.Game) -> list[str]:
+        raise NotImplementedError
+
 
 class CompletedGameFinder(Protocol):
     async def get_completed_games(self) -> list[dto.Game]:
@@ -6,7 +6,7 @@ from shvatka.models import dto
 
 
 class GamePreparer(GameOrgsGetter, Protocol):
-    async def delete_poll_data(self) -> None:
+    async def delete_poll_data(self, game: dto.Game) -> None:
         raise NotImplementedError
 
     async def get_agree_teams(self, game: dto.Game) -> Iterable[dto.Team]:
@@ -17,7 +17,9 @@ class GamePreparer(GameOrgsGetter, Protocol):
 
 
 class GamePlayerDao(Committer, GameOrgsGetter, Protocol):
-    async def is_key_duplicate(self, level: dto.Level, team: dto.Team, key: str) -> bool:
+    async def is_key_duplicate(
+        self, level_number: int, game: dto.Game, team: dto.Team, key: str
+    ) -> bool:
         raise NotImplementedError
 
     async def get_played_teams(self, game: dto.Game) -> Iterable[dto.Team]:
@@ -32,9 +34,15 @@ class GamePlayerDao(Committer, GameOrgsGetter, Protocol):
     async def get_current_level(self, team: dto.Team, game: dto.Game) -> dto.Level:
         raise NotImplementedError
 
+    async def get_current_level_number(self, team: dto.Team, game: dto.Game) -> int:
+        raise NotImplementedError
+
+    async def get_level_keys(self, game: dto.Game, level_number: int) -> set[str]:
+        raise NotImplementedError
+
     async def get_correct_typed_keys(
         self,
-        level: dto.Level,
+        level_number: int,
         game: dto.Game,
         team: dto.Team,
     ) -> set[str]:
@@ -44,7 +52,7 @@ class GamePlayerDao(Committer, GameOrgsGetter, Protocol):
         self,
         key: str,
         team: dto.Team,
-        level: dto.Level,
+        level_number: int,
         game: dto.Game,
         player: dto.Player,
         is_correct: bool,
@@ -52,7 +60,7 @@ class GamePlayerDao(Committer, GameOrgsGetter, Protocol):
     ) -> dto.KeyTime:
         raise NotImplementedError
 
-    async def level_up(self, team: dto.Team, level: dto.Level, game: dto.Game) -> None:
+    async def level_up(self, team: dto.Team, level_number: int, game: dto.Game) -> None:
         raise NotImplementedError
 
     async def finish(self, game: dto.Game) -> None:
@@ -1,9 +1,10 @@
-from typing import Protocol
+from typing import Protocol, AsyncIterator
 
 from shvatka.interfaces.dal.organizer import OrgByPlayerGetter
 from shvatka.models import dto
 
 
 class TypedKeyGetter(OrgByPlayerGetter, Protocol):
-    async def get_typed_keys(self, game: dto.Game) -> list[dto.KeyTime]:
+    def iter_typed_keys(self, game: dto.Game) -> AsyncIterator[dto.KeyTime]:
+        """ключи в порядке ввода"""
         raise NotImplementedError
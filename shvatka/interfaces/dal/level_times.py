@@ -21,9 +21,28 @@ class LevelTimeChecker(Protocol):
         raise NotImplementedError
 
 
+class HintSender(LevelTimeChecker, Protocol):
+    async def mark_hint_sent(self, team: dto.Team, level: dto.Level, hint_number: int) -> bool:
+        raise NotImplementedError
+
+    async def unmark_hint_sent(self, team: dto.Team, level: dto.Level, hint_number: int) -> None:
+        raise NotImplementedError
+
+
+class HintsCatchUpDao(HintSender, Protocol):
+    async def get_game_level_times(self, game: dto.Game) -> list[dto.LevelTime]:
+        raise NotImplementedError
+
+    async def get_sent_hints(self, team: dto.Team, level: dto.Level) -> set[int]:
+        raise NotImplementedError
+
+
 class GameStatDao(OrgByPlayerGetter, Protocol):
     async def get_game_level_times(self, game: dto.Game) -> list[dto.LevelTime]:
         raise NotImplementedError
 
     async def get_max_level_number(self, game: dto.Game) -> int:
         raise NotImplementedError
+
+    async def get_game_progress(self, game: dto.Game) -> list[dto.TeamProgress]:
+        raise NotImplementedError
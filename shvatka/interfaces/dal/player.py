@@ -16,6 +16,11 @@ class PlayerByIdGetter(Protocol):
         raise NotImplementedError
 
 
+class PlayerByUserGetter(Protocol):
+    async def get_by_user(self, user: dto.User) -> dto.Player:
+        raise NotImplementedError
+
+
 class TeamPlayerGetter(Protocol):
     async def get_team_player(self, player: dto.Player) -> dto.TeamPlayer:
         raise NotImplementedError
@@ -50,12 +55,12 @@ class WaiverRemover(Protocol):
 
 
 class PollVoteDeleter(Protocol):
-    async def del_player_vote(self, team_id: int, player_id: int) -> None:
+    async def del_player_vote(self, game_id: int, team_id: int, player_id: int) -> None:
         raise NotImplementedError
 
 
 class TeamLeaver(Committer, ActiveGameFinder, WaiverRemover, TeamPlayerGetter, Protocol):
-    async def del_player_vote(self, team_id: int, player_id: int) -> None:
+    async def del_player_vote(self, game_id: int, team_id: int, player_id: int) -> None:
         raise NotImplementedError
 
     async def get_team(self, player: dto.Player) -> dto.Team:
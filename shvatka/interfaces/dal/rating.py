@@ -0,0 +1,47 @@
+from typing import Protocol, Iterable, Sequence
+
+from shvatka.interfaces.dal.base import Committer
+from shvatka.models import dto
+
+
+class RatingUpdater(Protocol):
+    async def is_rated(self, game: dto.Game) -> bool:
+        raise NotImplementedError
+
+    async def get_game_results(self, game: dto.Game) -> list[dto.TeamResult]:
+        raise NotImplementedError
+
+    async def get_game_players(self, game: dto.Game) -> list[tuple[int, int]]:
+        raise NotImplementedError
+
+    async def get_team_ratings(self, ids: Iterable[int]) -> dict[int, float]:
+        raise NotImplementedError
+
+    async def get_player_ratings(self, ids: Iterable[int]) -> dict[int, float]:
+        raise NotImplementedError
+
+    async def save_rating_changes(self, changes: Sequence[dto.RatingChange]) -> None:
+        raise NotImplementedError
+
+
+class RatingRebuilder(Committer, Protocol):
+    async def get_all_results(self) -> list[tuple[int, list[dto.TeamResult]]]:
+        raise NotImplementedError
+
+    async def get_all_players(self) -> dict[int, list[tuple[int, int]]]:
+        raise NotImplementedError
+
+    async def delete_ratings(self) -> None:
+        raise NotImplementedError
+
+    async def save_rebuilt(self, changes: Sequence[dto.RatingChange]) -> None:
+        """changes в хронологическом порядке, текущий рейтинг - последний по каждому"""
+        raise NotImplementedError
+
+
+class LeaderboardGetter(Protocol):
+    async def get_teams_leaderboard(self, limit: int) -> list[dto.TeamRating]:
+        raise NotImplementedError
+
+    async def get_players_leaderboard(self, limit: int) -> list[dto.PlayerRating]:
+        raise NotImplementedError
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Protocol, Iterable, Sequence
+
+from shvatka.models import dto
+
+
+class GameReplayBuilder(Protocol):
+    async def get_game_level_starts(self, game: dto.Game) -> Sequence[tuple[int, int, datetime]]:
+        raise NotImplementedError
+
+    async def get_game_key_times(self, game: dto.Game) -> Sequence[tuple[int, datetime, bool]]:
+        raise NotImplementedError
+
+    async def get_team_names(self, ids: Iterable[int]) -> dict[int, str]:
+        raise NotImplementedError
+
+    async def get_max_level_number(self, game: dto.Game) -> int:
+        raise NotImplementedError
+
+
+class GameReplaySaver(GameReplayBuilder, Protocol):
+    async def save_replay(self, replay: dto.GameReplay) -> None:
+        raise NotImplementedError
+
+
+class GameReplayGetter(GameReplaySaver, Protocol):
+    async def get_replay(self, game_id: int) -> dto.GameReplay | None:
+        raise NotImplementedError
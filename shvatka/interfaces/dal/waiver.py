@@ -1,4 +1,4 @@
-from typing import Iterable, Protocol
+from typing import Iterable, Protocol, Sequence
 
 from shvatka.interfaces.dal.base import Committer
 from shvatka.interfaces.dal.player import TeamPlayerGetter, TeamPlayersGetter
@@ -7,7 +7,9 @@ from shvatka.models.enums.played import Played
 
 
 class WaiverVoteAdder(TeamPlayerGetter, Protocol):
-    async def add_player_vote(self, team_id: int, player_id: int, vote_var: str) -> None:
+    async def add_player_vote(
+        self, game_id: int, team_id: int, player_id: int, vote_var: str
+    ) -> None:
         raise NotImplementedError
 
     async def is_excluded(
@@ -23,7 +25,7 @@ class WaiverVoteAdder(TeamPlayerGetter, Protocol):
 
 
 class PollGetWaivers(Protocol):
-    async def get_dict_player_vote(self, team_id: int) -> dict[int, Played]:
+    async def get_dict_player_vote(self, game_id: int, team_id: int) -> dict[int, Played]:
         raise NotImplementedError
 
 
@@ -36,13 +38,13 @@ class WaiverApprover(Committer, TeamPlayerGetter, WaiverVoteGetter, TeamPlayersG
     async def upsert(self, waiver: dto.Waiver):
         raise NotImplementedError
 
-    async def del_player_vote(self, team_id: int, player_id: int) -> None:
+    async def upsert_many(self, waivers: Sequence[dto.Waiver]):
         raise NotImplementedError
 
-
-class GameWaiversGetter(Protocol):
-    async def get_played_teams(self, game: dto.Game) -> Iterable[dto.Team]:
+    async def del_player_vote(self, game_id: int, team_id: int, player_id: int) -> None:
         raise NotImplementedError
 
-    async def get_played(self, game: dto.Game, team: dto.Team) -> Iterable[dto.VotedPlayer]:
+
+class GameWaiversGetter(Protocol):
+    async def get_all_played(self, game: dto.Game) -> dict[dto.Team, list[dto.VotedPlayer]]:
         raise NotImplementedError
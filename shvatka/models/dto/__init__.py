@@ -3,12 +3,15 @@ from .chat import Chat  # noqa: F401
 from .forum_team import ForumTeam  # noqa: F401
 from .forum_user import ForumUser  # noqa: F401
 from .game import Game, FullGame  # noqa: F401
+from .game_event import GameEvent  # noqa: F401
 from .level import Level  # noqa: F401
 from .level_testing import LevelTestSuite  # noqa: F401
-from .levels_times import LevelTime, GameStat, LevelTimeOnGame  # noqa: F401
+from .levels_times import LevelTime, GameStat, LevelTimeOnGame, TeamProgress  # noqa: F401
 from .organizer import Organizer, PrimaryOrganizer, SecondaryOrganizer  # noqa: F401
 from .player import Player  # noqa: F401
 from .pool import VotedPlayer, Vote  # noqa: F401
+from .rating import TeamResult, RatingChange, TeamRating, PlayerRating  # noqa: F401
+from .replay import GameReplay, TeamReplay, TeamStanding, ReplayFrame  # noqa: F401
 from .team import Team  # noqa: F401
 from .team_player import TeamPlayer, FullTeamPlayer  # noqa: F401
 from .time_key import KeyTime, InsertedKey  # noqa: F401
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from shvatka.models.enums.game_event import GameEventType
+
+
+@dataclass
+class GameEvent:
+    """Событие хода игры для живой ленты оргов"""
+
+    type: GameEventType
+    game_id: int
+    team_id: int
+    team_name: str
+    level_number: int
+    at: datetime
+    key: str | None = None
+    hint_number: int | None = None
@@ -30,6 +30,17 @@ class LevelTimeOnGame(LevelTime):
     is_finished: bool
 
 
+@dataclass
+class TeamProgress:
+    game: Game
+    team: Team
+    level_number: int
+    start_at: datetime
+    keys_typed: int
+    wrong_keys: int
+    is_finished: bool
+
+
 @dataclass
 class GameStat:
     level_times: dict[Team, list[LevelTimeOnGame]]
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from .player import Player
+from .team import Team
+
+
+@dataclass
+class TeamResult:
+    """докуда команда дошла на игре"""
+
+    team_id: int
+    level_number: int
+    at: datetime
+
+
+@dataclass
+class RatingChange:
+    game_id: int
+    place: int
+    rating_before: float
+    rating_after: float
+    team_id: int | None = None
+    player_id: int | None = None
+
+
+@dataclass
+class TeamRating:
+    team: Team
+    rating: float
+    games_count: int
+
+
+@dataclass
+class PlayerRating:
+    player: Player
+    rating: float
+    games_count: int
@@ -0,0 +1,98 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from shvatka.utils.datetime_utils import tz_game
+
+
+@dataclass
+class TeamReplay:
+    team_id: int
+    team_name: str
+    # отсортированы по времени, индекс - номер уровня
+    level_starts: list[datetime]
+    # отсортированы по времени
+    correct_keys: list[datetime]
+    wrong_keys: list[datetime]
+
+    def standing_at(self, at: datetime, levels_count: int) -> "TeamStanding":
+        level_number = bisect_right(self.level_starts, at) - 1
+        return TeamStanding(
+            team_id=self.team_id,
+            team_name=self.team_name,
+            level_number=level_number,
+            level_started_at=self.level_starts[level_number] if level_number >= 0 else None,
+            correct_keys=bisect_right(self.correct_keys, at),
+            wrong_keys=bisect_right(self.wrong_keys, at),
+            is_finished=level_number >= levels_count,
+        )
+
+
+@dataclass
+class TeamStanding:
+    team_id: int
+    team_name: str
+    # -1 - команда ещё не начала игру
+    level_number: int
+    level_started_at: datetime | None
+    correct_keys: int
+    wrong_keys: int
+    is_finished: bool
+
+
+@dataclass
+class ReplayFrame:
+    at: datetime
+    standings: list[TeamStanding]
+
+
+@dataclass
+class GameReplay:
+    """
+    Индекс для восстановления положения команд на любой момент игры.
+    Поиск по каждой команде - бинарный, так что положение считается за O(teams * log events)
+    """
+
+    game_id: int
+    levels_count: int
+    teams: list[TeamReplay]
+
+    @property
+    def start_at(self) -> datetime | None:
+        return min((t.level_starts[0] for t in self.teams if t.level_starts), default=None)
+
+    @property
+    def finish_at(self) -> datetime | None:
+        return max(
+            (
+                max(t.level_starts[-1:] + t.correct_keys[-1:] + t.wrong_keys[-1:])
+                for t in self.teams
+                if t.level_starts
+            ),
+            default=None,
+        )
+
+    def standings_at(self, at: datetime) -> list[TeamStanding]:
+        if at.tzinfo is None:
+            # время без пояса (?at=2023-03-01T01:30) считаем игровым
+            at = at.replace(tzinfo=tz_game)
+        standings = [team.standing_at(at, self.levels_count) for team in self.teams]
+        standings.sort(
+            key=lambda s: (
+                -s.level_number,
+                s.level_started_at or at,
+            )
+        )
+        return standings
+
+    def timeline(self, step: timedelta) -> list[ReplayFrame]:
+        """кадры положения команд с шагом step от старта до последнего события"""
+        if (start_at := self.start_at) is None or (finish_at := self.finish_at) is None:
+            return []
+        frames = []
+        at = start_at
+        while at < finish_at:
+            frames.append(ReplayFrame(at=at, standings=self.standings_at(at)))
+            at += step
+        frames.append(ReplayFrame(at=finish_at, standings=self.standings_at(finish_at)))
+        return frames
@@ -4,7 +4,7 @@ from datetime import datetime
 from shvatka.models import dto
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeyTime:
     text: str
     is_correct: bool
@@ -15,7 +15,7 @@ class KeyTime:
     team: dto.Team
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InsertedKey(KeyTime):
     is_level_up: bool
 
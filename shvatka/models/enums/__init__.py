@@ -1,5 +1,6 @@
 from .achievement import Achievement
 from .chat_type import ChatType
+from .game_event import GameEventType
 from .game_status import GameStatus
 from .hint_type import HintType
 from .invite_type import InviteType
@@ -11,6 +12,7 @@ __all__ = (
     "GameStatus",
     "Achievement",
     "ChatType",
+    "GameEventType",
     "HintType",
     "InviteType",
     "OrgPermission",
@@ -0,0 +1,9 @@
+import enum
+
+
+class GameEventType(enum.Enum):
+    level_up = "level_up"
+    team_finished = "team_finished"
+    correct_key = "correct_key"
+    hint = "hint"
+    game_finished = "game_finished"
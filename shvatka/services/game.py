@@ -9,6 +9,8 @@ from shvatka.interfaces.dal.game import (
     GameAuthorsFinder,
     GameByIdGetter,
     ActiveGameFinder,
+    ActiveGameRouter,
+    TeamGameBinder,
     WaiverStarter,
     GameStartPlanner,
     GameNameChecker,
@@ -21,13 +23,16 @@ from shvatka.interfaces.dal.level import LevelLinker
 from shvatka.interfaces.scheduler import Scheduler
 from shvatka.models import dto
 from shvatka.models.dto import scn
+from shvatka.models.enums import GameStatus
 from shvatka.models.enums.game_status import EDITABLE_STATUSES
 from shvatka.services.level import check_is_author as check_is_level_author, check_can_link_to_game
 from shvatka.services.player import check_allow_be_author
+from shvatka.services.rating import update_ratings
+from shvatka.services.replay import save_replay
 from shvatka.services.scenario.files import upsert_files, get_file_metas, get_file_contents
 from shvatka.services.scenario.game_ops import parse_uploaded_game, check_all_files_saved
 from shvatka.utils import exceptions
-from shvatka.utils.exceptions import NotAuthorizedForEdit, AnotherGameIsActive, CantEditGame
+from shvatka.utils.exceptions import NotAuthorizedForEdit, CantEditGame, TeamInAnotherGame
 
 
 async def upsert_game(
@@ -106,6 +111,13 @@ async def get_full_game(id_: int, author: dto.Player, dao: GameByIdGetter) -> dt
     return game
 
 
+async def get_completed_game(id_: int, dao: GameByIdGetter) -> dto.FullGame:
+    """сценарий завершённой игры открыт всем"""
+    game = await dao.get_full(id_=id_)
+    check_game_completed(game)
+    return game
+
+
 async def get_game_package(
     id_: int,
     author: dto.Player,
@@ -124,8 +136,56 @@ async def get_game_package(
     return scn.RawGameScenario(scn=serialized, files=contents)
 
 
-async def get_active(dao: ActiveGameFinder) -> dto.Game | None:
-    return await dao.get_active_game()
+async def get_active_games(dao: ActiveGameFinder) -> list[dto.Game]:
+    return await dao.get_active_games()
+
+
+async def get_games_getting_waivers(dao: ActiveGameFinder) -> list[dto.Game]:
+    return [
+        game for game in await dao.get_active_games() if game.status == GameStatus.getting_waivers
+    ]
+
+
+async def get_active(
+    dao: ActiveGameRouter, team: dto.Team | None = None, player: dto.Player | None = None
+) -> dto.Game | None:
+    """
+    Активная игра, к которой относится чат команды или игрок.
+    Команда относится к игре, на которую подала вейверы или начала их собирать
+    (законченная, но не награждённая игра уступает новой),
+    игрок без команды - к игре, которую организует.
+    Пока активная игра одна - она общая для всех
+    """
+    games = await dao.get_active_games()
+    if len(games) <= 1:
+        return games[0] if games else None
+    by_id = {game.id: game for game in games}
+    if team is None and player is not None:
+        team = await dao.get_team(player)
+    if team is not None:
+        played = [by_id[id_] for id_ in sorted(await dao.get_team_game_ids(team, list(by_id)))]
+        candidates = [game for game in played if not game.is_finished()]
+        if (bound_id := await dao.get_bound_game_id(team)) in by_id:
+            candidates.append(by_id[bound_id])
+        candidates.extend(played)
+        if candidates:
+            return candidates[0]
+    if player is not None:
+        if game_ids := await dao.get_org_game_ids(player, list(by_id)):
+            return by_id[min(game_ids)]
+    return None
+
+
+async def bind_team_to_game(team: dto.Team, game: dto.Game, dao: TeamGameBinder):
+    """Команда начинает сборы вейверов на игру: дальше её чат относится к этой игре"""
+    other_ids = [
+        other.id
+        for other in await dao.get_active_games()
+        if other.id != game.id and not other.is_finished()
+    ]
+    if other_ids and await dao.get_team_game_ids(team, other_ids):
+        raise TeamInAnotherGame(team=team, game=game, game_status=game.status)
+    await dao.bind_team(game, team)
 
 
 async def rename_game(author: dto.Player, game: dto.Game, new_name: str, dao: GameRenamer):
@@ -139,7 +199,6 @@ async def start_waivers(game: dto.Game, author: dto.Player, dao: WaiverStarter):
     check_allow_be_author(author)
     check_is_author(game, author)
     check_game_editable(game)
-    await check_no_game_active(dao)
     await dao.start_waivers(game)
     await dao.commit()
 
@@ -154,7 +213,6 @@ async def plain_start(
     check_allow_be_author(author)
     check_is_author(game, author)
     check_game_editable(game)
-    await check_no_other_game_active(dao, game)
     await dao.set_start_at(game, start_at)
     game.start_at = start_at
     await scheduler.cancel_scheduled_game(game)
@@ -181,24 +239,9 @@ async def complete_game(game: dto.Game, dao: GameCompleter):
         raise exceptions.GameNotFinished(game=game)
     await dao.set_number(game, await dao.get_max_number() + 1)
     await dao.set_completed(game)
+    await update_ratings(game, dao)
     await dao.commit()
-
-
-async def check_no_other_game_active(dao: ActiveGameFinder, game: dto.Game):
-    if other_game := await dao.get_active_game():
-        if game.id != other_game.id:
-            raise AnotherGameIsActive(
-                game=game,
-                game_status=game.status,
-            )
-
-
-async def check_no_game_active(dao: ActiveGameFinder):
-    if game := await dao.get_active_game():
-        raise AnotherGameIsActive(
-            game=game,
-            game_status=game.status,
-        )
+    await save_replay(game, dao)
 
 
 async def check_new_game_name_available(name: str, author: dto.Player, dao: GameNameChecker):
@@ -217,6 +260,11 @@ def check_is_author(game: dto.Game, player: dto.Player):
         )
 
 
+def check_game_completed(game: dto.Game):
+    if not game.is_complete():
+        raise exceptions.GameNotCompleted(game=game)
+
+
 def check_game_editable(game: dto.Game):
     if game.status not in EDITABLE_STATUSES:
         raise CantEditGame(
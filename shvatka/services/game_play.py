@@ -3,19 +3,30 @@ import logging
 from datetime import timedelta, datetime
 
 from shvatka.interfaces.dal.game_play import GamePreparer, GamePlayerDao
-from shvatka.interfaces.dal.level_times import GameStarter, LevelTimeChecker
+from shvatka.interfaces.dal.level_times import GameStarter, HintSender, HintsCatchUpDao
 from shvatka.interfaces.scheduler import Scheduler
 from shvatka.models import dto
 from shvatka.models.dto import scn
+from shvatka.models.enums import GameEventType
 from shvatka.services.organizers import get_orgs, get_spying_orgs
+from shvatka.utils.concurrency import fan_out
 from shvatka.utils.datetime_utils import tz_utc
 from shvatka.utils.exceptions import InvalidKey
 from shvatka.utils.input_validation import is_key_valid
 from shvatka.utils.key_checker_lock import KeyCheckerFactory
-from shvatka.views.game import GameViewPreparer, GameLogWriter, GameView, OrgNotifier, LevelUp
+from shvatka.views.game import (
+    GameViewPreparer,
+    GameLogWriter,
+    GameView,
+    OrgNotifier,
+    LevelUp,
+    GameEventPublisher,
+)
 
 logger = logging.getLogger(__name__)
 
+CATCH_UP_CONCURRENCY = 10
+
 
 async def prepare_game(
     game: dto.Game,
@@ -35,7 +46,7 @@ async def prepare_game(
         orgs=await get_orgs(game, game_preparer),
         dao=game_preparer,
     )
-    await game_preparer.delete_poll_data()
+    await game_preparer.delete_poll_data(game)
 
 
 async def start_game(
@@ -44,6 +55,7 @@ async def start_game(
     game_log: GameLogWriter,
     view: GameView,
     scheduler: Scheduler,
+    events: GameEventPublisher,
 ):
     """
     Для начала игры нужно сделать несколько вещей:
@@ -59,16 +71,28 @@ async def start_game(
         return
     await dao.set_game_started(game)
     logger.info("game %s started", game.id)
-    teams = await dao.get_played_teams(game)
+    teams = list(await dao.get_played_teams(game))
 
     await dao.set_teams_to_first_level(game, teams)
     await dao.commit()
 
-    await asyncio.gather(*[view.send_puzzle(team, game.levels[0]) for team in teams])
-
-    await asyncio.gather(
-        *[schedule_first_hint(scheduler, team, game.levels[0], now) for team in teams]
+    # ошибка отправки одной команде не должна мешать остальным
+    await fan_out(
+        teams,
+        lambda team: view.send_puzzle(team, game.levels[0]),
+        name=f"game {game.id} first puzzle",
+        key=lambda team: team.id,
+    )
+    await fan_out(
+        teams,
+        lambda team: schedule_first_hint(scheduler, team, game.levels[0], now),
+        name=f"game {game.id} first hint scheduling",
+        key=lambda team: team.id,
     )
+    for team in teams:
+        await events.publish(
+            game_event(GameEventType.level_up, game=game, team=team, level_number=0, at=now)
+        )
 
     await game_log.log("Game started")
 
@@ -84,6 +108,7 @@ async def check_key(
     org_notifier: OrgNotifier,
     locker: KeyCheckerFactory,
     scheduler: Scheduler,
+    events: GameEventPublisher,
 ):
     """
     Проверяет введённый игроком ключ. Может случиться несколько исходов:
@@ -107,6 +132,7 @@ async def check_key(
     :param org_notifier: Для уведомления оргов о важных событиях.
     :param locker: Локи для обеспечения последовательного исполнения определённых операций.
     :param scheduler: Планировщик подсказок.
+    :param events: Лента событий игры (живой шпион для оргов).
     """
     if not is_key_valid(key):
         raise InvalidKey(key=key, team=team, player=player, game=game)
@@ -118,12 +144,41 @@ async def check_key(
         return
     elif new_key.is_correct:
         await view.correct_key(key=new_key)
+        await events.publish(
+            game_event(
+                GameEventType.correct_key,
+                game=game,
+                team=team,
+                level_number=new_key.level_number,
+                at=new_key.at,
+                key=new_key.text,
+            )
+        )
         if new_key.is_level_up:
-            async with locker.lock_globally():
+            async with locker.lock_game(game):
                 if await dao.is_team_finished(team, game):
-                    await finish_team(team, game, view, game_log, dao, locker)
+                    await events.publish(
+                        game_event(
+                            GameEventType.team_finished,
+                            game=game,
+                            team=team,
+                            level_number=len(game.levels),
+                            at=new_key.at,
+                        )
+                    )
+                    await finish_team(team, game, view, game_log, dao, locker, events)
                     return
             next_level = await dao.get_current_level(team, game)
+            assert next_level.number_in_game is not None
+            await events.publish(
+                game_event(
+                    GameEventType.level_up,
+                    game=game,
+                    team=team,
+                    level_number=next_level.number_in_game,
+                    at=new_key.at,
+                )
+            )
 
             await view.send_puzzle(team=team, level=next_level)
             await schedule_first_hint(scheduler, team, next_level)
@@ -144,21 +199,23 @@ async def submit_key(
     locker: KeyCheckerFactory,
 ) -> dto.InsertedKey:
     async with locker(team):  # несколько конкурентных ключей от одной команды - последовательно
-        level = await dao.get_current_level(team, game)
-        keys = level.get_keys()
+        level_number = await dao.get_current_level_number(team, game)
+        keys = await dao.get_level_keys(game, level_number)  # подсказки уровня тут не нужны
         new_key = await dao.save_key(
             key=key,
             team=team,
-            level=level,
+            level_number=level_number,
             game=game,
             player=player,
             is_correct=key in keys,
-            is_duplicate=await dao.is_key_duplicate(level, team, key),
+            is_duplicate=await dao.is_key_duplicate(level_number, game, team, key),
+        )
+        typed_keys = await dao.get_correct_typed_keys(
+            level_number=level_number, game=game, team=team
         )
-        typed_keys = await dao.get_correct_typed_keys(level=level, game=game, team=team)
         is_level_up = False
         if typed_keys == keys:
-            await dao.level_up(team=team, level=level, game=game)
+            await dao.level_up(team=team, level_number=level_number, game=game)
             is_level_up = True
         await dao.commit()
     return dto.InsertedKey.from_key_time(new_key, is_level_up)
@@ -171,6 +228,7 @@ async def finish_team(
     game_log: GameLogWriter,
     dao: GamePlayerDao,
     locker: KeyCheckerFactory,
+    events: GameEventPublisher,
 ):
     """
     два варианта:
@@ -182,29 +240,47 @@ async def finish_team(
     :param dao: Слой доступа к бд.
     :param view: Слой отображения данных.
     :param game_log: Логгер игры (публичные уведомления о статусе игры).
-    :param locker: Эту штуку мы просто очистим, если игра кончилась.
+    :param locker: Локи этой игры мы просто очистим, если игра кончилась.
+    :param events: Лента событий игры, после финиша всех команд она больше не нужна.
     """
     await view.game_finished(team)
     if await dao.is_all_team_finished(game):
         await dao.finish(game)
         await dao.commit()
         await game_log.log("Game finished")
-        locker.clear()
-        for team in await dao.get_played_teams(game):
-            await view.game_finished_by_all(team)
+        await events.publish(
+            game_event(
+                GameEventType.game_finished,
+                game=game,
+                team=team,
+                level_number=len(game.levels),
+                at=datetime.now(tz=tz_utc),
+            )
+        )
+        teams = list(await dao.get_played_teams(game))
+        locker.clear(game, teams)
+        await fan_out(
+            teams,
+            view.game_finished_by_all,
+            name=f"game {game.id} finished",
+            key=lambda team: team.id,
+        )
 
 
 async def send_hint(
     level: dto.Level,
     hint_number: int,
     team: dto.Team,
-    dao: LevelTimeChecker,
+    dao: HintSender,
     view: GameView,
     scheduler: Scheduler,
+    events: GameEventPublisher,
 ):
     """
     Отправить подсказку (запланированную ранее) и запланировать ещё одну.
     Если команда уже на следующем уровне - отправлять не надо.
+    Если подсказка уже отправлена (повтор задачи после рестарта) - тоже,
+    и следующую тогда не планируем: её запланировала первая отправка.
 
     :param level: Подсказка относится к уровню.
     :param hint_number: Номер подсказки, которую надо отправить.
@@ -212,6 +288,7 @@ async def send_hint(
     :param dao: Слой доступа к данным.
     :param view: Слой отображения.
     :param scheduler: Планировщик.
+    :param events: Лента событий игры.
     """
     if not await dao.is_team_on_level(team, level):
         logger.debug(
@@ -221,7 +298,8 @@ async def send_hint(
             hint_number,
         )
         return
-    await view.send_hint(team, hint_number, level)
+    if not await deliver_hint(level, hint_number, team, dao, view, events):
+        return
     next_hint_number = hint_number + 1
     if level.is_last_hint(hint_number):
         logger.debug(
@@ -238,6 +316,88 @@ async def send_hint(
     await scheduler.plain_hint(level, team, next_hint_number, next_hint_time)
 
 
+async def deliver_hint(
+    level: dto.Level,
+    hint_number: int,
+    team: dto.Team,
+    dao: HintSender,
+    view: GameView,
+    events: GameEventPublisher,
+) -> bool:
+    """:return: False, если подсказка уже была отправлена"""
+    if not await dao.mark_hint_sent(team, level, hint_number):
+        logger.info(
+            "hint #%s on level %s already sent to team %s", hint_number, level.db_id, team.id
+        )
+        return False
+    try:
+        await view.send_hint(team, hint_number, level)
+    except Exception:
+        await dao.unmark_hint_sent(team, level, hint_number)
+        raise
+    assert level.game_id is not None
+    assert level.number_in_game is not None
+    await events.publish(
+        dto.GameEvent(
+            type=GameEventType.hint,
+            game_id=level.game_id,
+            team_id=team.id,
+            team_name=team.name,
+            level_number=level.number_in_game,
+            at=datetime.now(tz=tz_utc),
+            hint_number=hint_number,
+        )
+    )
+    return True
+
+
+async def catch_up_hints(
+    game: dto.FullGame,
+    dao: HintsCatchUpDao,
+    view: GameView,
+    scheduler: Scheduler,
+    events: GameEventPublisher,
+    now: datetime | None = None,
+):
+    """
+    После рестарта: по времени начала текущего уровня каждой команды досылает
+    подсказки, время которых прошло, а не отмеченные в журнале, и планирует следующую.
+    Дубль уже запланированной задачи безопасен - журнал не даст отправить дважды
+    """
+    if now is None:
+        now = datetime.now(tz=tz_utc)
+    current: dict[int, dto.LevelTime] = {}
+    for level_time in await dao.get_game_level_times(game):  # по возрастанию уровня
+        current[level_time.team.id] = level_time
+    semaphore = asyncio.Semaphore(CATCH_UP_CONCURRENCY)
+
+    async def catch_up_team(level_time: dto.LevelTime):
+        if level_time.level_number >= len(game.levels):
+            return  # команда финишировала
+        level = game.levels[level_time.level_number]
+        team = level_time.team
+        async with semaphore:
+            sent = await dao.get_sent_hints(team, level)
+            for hint_number, hint in enumerate(level.scenario.time_hints):
+                if hint_number == 0 or hint_number in sent:
+                    continue  # нулевая подсказка уходит вместе с уровнем
+                run_at = level_time.start_at + timedelta(minutes=hint.time)
+                if run_at > now:
+                    await scheduler.plain_hint(level, team, hint_number, run_at)
+                    return
+                logger.info(
+                    "catch up hint #%s on level %s for team %s", hint_number, level.db_id, team.id
+                )
+                await deliver_hint(level, hint_number, team, dao, view, events)
+
+    results = await asyncio.gather(
+        *[catch_up_team(level_time) for level_time in current.values()], return_exceptions=True
+    )
+    for level_time, result in zip(current.values(), results):
+        if isinstance(result, Exception):
+            logger.error("can't catch up hints for team %s", level_time.team.id, exc_info=result)
+
+
 async def get_available_hints(
     game: dto.Game, team: dto.Team, dao: GamePlayerDao
 ) -> list[scn.TimeHint]:
@@ -261,6 +421,25 @@ async def schedule_first_hint(
     )
 
 
+def game_event(
+    type_: GameEventType,
+    game: dto.Game,
+    team: dto.Team,
+    level_number: int,
+    at: datetime,
+    key: str | None = None,
+) -> dto.GameEvent:
+    return dto.GameEvent(
+        type=type_,
+        game_id=game.id,
+        team_id=team.id,
+        team_name=team.name,
+        level_number=level_number,
+        at=at,
+        key=key,
+    )
+
+
 def calculate_first_hint_time(next_level: dto.Level, now: datetime = None) -> datetime:
     return calculate_next_hint_time(next_level.get_hint(0), next_level.get_hint(1), now)
 
@@ -1,6 +1,7 @@
 from shvatka.interfaces.dal.key_log import TypedKeyGetter
 from shvatka.interfaces.dal.level_times import GameStatDao
 from shvatka.models import dto
+from shvatka.services.game import check_game_completed
 from shvatka.services.organizers import get_by_player, check_can_see_log_keys, check_can_spy
 
 
@@ -11,9 +12,22 @@ async def get_typed_keys(
 ) -> dict[dto.Team, list[dto.KeyTime]]:
     org = await get_by_player(game=game, player=player, dao=dao)
     check_can_see_log_keys(org)
-    keys = await dao.get_typed_keys(game)
-    grouped = {}
-    for key in keys:
+    return await group_typed_keys(game, dao)
+
+
+async def get_completed_game_keys(
+    game: dto.Game, dao: TypedKeyGetter
+) -> dict[dto.Team, list[dto.KeyTime]]:
+    """лог ключей завершённой игры открыт всем"""
+    check_game_completed(game)
+    return await group_typed_keys(game, dao)
+
+
+async def group_typed_keys(
+    game: dto.Game, dao: TypedKeyGetter
+) -> dict[dto.Team, list[dto.KeyTime]]:
+    grouped: dict[dto.Team, list[dto.KeyTime]] = {}
+    async for key in dao.iter_typed_keys(game):
         grouped.setdefault(key.team, []).append(key)
     return grouped
 
@@ -22,6 +36,16 @@ async def get_game_stat(game: dto.Game, player: dto.Player, dao: GameStatDao) ->
     """return sorted by level number grouped by teams stat"""
     org = await get_by_player(game=game, player=player, dao=dao)
     check_can_spy(org)
+    return await collect_game_stat(game, dao)
+
+
+async def get_completed_game_stat(game: dto.Game, dao: GameStatDao) -> dto.GameStat:
+    """итоги завершённой игры открыты всем"""
+    check_game_completed(game)
+    return await collect_game_stat(game, dao)
+
+
+async def collect_game_stat(game: dto.Game, dao: GameStatDao) -> dto.GameStat:
     level_times = await dao.get_game_level_times(game)
     levels_count = await dao.get_max_level_number(game)
     result = {}
@@ -30,9 +54,10 @@ async def get_game_stat(game: dto.Game, player: dto.Player, dao: GameStatDao) ->
     return dto.GameStat(level_times=result)
 
 
-async def get_game_spy(game: dto.Game, player: dto.Player, dao: GameStatDao):
-    stat = await get_game_stat(game, player, dao)
-    result = []
-    for team, lts in stat.level_times.items():
-        result.append(lts[-1])
-    return result
+async def get_game_spy(
+    game: dto.Game, player: dto.Player, dao: GameStatDao
+) -> list[dto.TeamProgress]:
+    """текущий уровень каждой команды, без истории прохождения"""
+    org = await get_by_player(game=game, player=player, dao=dao)
+    check_can_spy(org)
+    return await dao.get_game_progress(game)
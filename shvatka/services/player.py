@@ -9,6 +9,7 @@ from shvatka.interfaces.dal.player import (
     TeamPlayersGetter,
     TeamPlayerGetter,
     PlayerByIdGetter,
+    PlayerByUserGetter,
     TeamPlayerPermissionFlipper,
 )
 from shvatka.interfaces.dal.secure_invite import InviteSaver, InviteRemover, InviterDao
@@ -46,6 +47,10 @@ async def get_player_by_id(id_: int, dao: PlayerByIdGetter) -> dto.Player:
     return await dao.get_by_id(id_)
 
 
+async def get_player_by_user(user: dto.User, dao: PlayerByUserGetter) -> dto.Player:
+    return await dao.get_by_user(user)
+
+
 async def get_team_player_by_player(player: dto.Player, dao: PlayerTeamChecker) -> dto.TeamPlayer:
     return await dao.get_team_player(player)
 
@@ -108,7 +113,7 @@ async def leave(player: dto.Player, remover: dto.Player, dao: TeamLeaver):
             remover, team, dao
         )  # team of remover must be the same as player
         check_can_remove_player(team_player)  # and remover must have permission for remove
-    if game := await dao.get_active_game():
+    for game in await dao.get_active_games():
         await dao.delete(
             dto.Waiver(
                 player=player,
@@ -116,7 +121,7 @@ async def leave(player: dto.Player, remover: dto.Player, dao: TeamLeaver):
                 team=team,
             )
         )
-        await dao.del_player_vote(team_id=team.id, player_id=player.id)
+        await dao.del_player_vote(game_id=game.id, team_id=team.id, player_id=player.id)
     await dao.leave_team(player)
     await dao.commit()
 
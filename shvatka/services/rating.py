@@ -0,0 +1,132 @@
+from typing import Hashable, TypeVar, Iterable
+
+from shvatka.interfaces.dal.rating import RatingUpdater, RatingRebuilder, LeaderboardGetter
+from shvatka.models import dto
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+LEADERBOARD_SIZE = 20
+
+T = TypeVar("T", bound=Hashable)
+
+
+def rank_teams(results: Iterable[dto.TeamResult]) -> dict[int, int]:
+    """места (с 1): кто дальше прошёл, а при равенстве - кто раньше туда дошёл"""
+    ranked = sorted(results, key=lambda r: (-r.level_number, r.at))
+    return {result.team_id: place for place, result in enumerate(ranked, 1)}
+
+
+def calculate_elo(
+    ratings: dict[T, float], places: dict[T, int], k: float = K_FACTOR
+) -> dict[T, float]:
+    """
+    Многосторонний Эло: каждый участник играет "матч" с каждым, у кого другое место.
+    Участники с одинаковым местом (игроки одной команды) друг с другом не сравниваются.
+    Изменение нормируется на число соперников, чтобы не зависеть от размера игры
+    """
+    new_ratings = {}
+    for a, place_a in places.items():
+        rating_a = ratings.get(a, INITIAL_RATING)
+        expected = actual = 0.0
+        opponents = 0
+        for b, place_b in places.items():
+            if place_a == place_b:
+                continue
+            opponents += 1
+            expected += 1 / (1 + 10 ** ((ratings.get(b, INITIAL_RATING) - rating_a) / 400))
+            actual += place_a < place_b
+        delta = k * (actual - expected) / opponents if opponents else 0.0
+        new_ratings[a] = rating_a + delta
+    return new_ratings
+
+
+def calculate_game(
+    game_id: int,
+    results: list[dto.TeamResult],
+    players: list[tuple[int, int]],
+    team_ratings: dict[int, float],
+    player_ratings: dict[int, float],
+) -> list[dto.RatingChange]:
+    """
+    :param players: (player_id, team_id) игравших
+    :return: изменения рейтинга команд и игроков, игроки получают место своей команды
+    """
+    team_places = rank_teams(results)
+    player_places = {
+        player_id: team_places[team_id] for player_id, team_id in players if team_id in team_places
+    }
+    changes = []
+    for team_id, rating in calculate_elo(team_ratings, team_places).items():
+        changes.append(
+            dto.RatingChange(
+                game_id=game_id,
+                place=team_places[team_id],
+                rating_before=team_ratings.get(team_id, INITIAL_RATING),
+                rating_after=rating,
+                team_id=team_id,
+            )
+        )
+    for player_id, rating in calculate_elo(player_ratings, player_places).items():
+        changes.append(
+            dto.RatingChange(
+                game_id=game_id,
+                place=player_places[player_id],
+                rating_before=player_ratings.get(player_id, INITIAL_RATING),
+                rating_after=rating,
+                player_id=player_id,
+            )
+        )
+    return changes
+
+
+async def update_ratings(game: dto.Game, dao: RatingUpdater) -> None:
+    """один проход по результатам завершённой игры, коммит - на вызывающей стороне"""
+    if await dao.is_rated(game):
+        return
+    results = await dao.get_game_results(game)
+    players = await dao.get_game_players(game)
+    changes = calculate_game(
+        game_id=game.id,
+        results=results,
+        players=players,
+        team_ratings=await dao.get_team_ratings(r.team_id for r in results),
+        player_ratings=await dao.get_player_ratings(p for p, _ in players),
+    )
+    await dao.save_rating_changes(changes)
+
+
+async def rebuild_ratings(dao: RatingRebuilder) -> None:
+    """пересчёт с нуля по всем завершённым играм в хронологическом порядке"""
+    players = await dao.get_all_players()
+    team_ratings: dict[int, float] = {}
+    player_ratings: dict[int, float] = {}
+    all_changes = []
+    for game_id, results in await dao.get_all_results():
+        changes = calculate_game(
+            game_id=game_id,
+            results=results,
+            players=players.get(game_id, []),
+            team_ratings=team_ratings,
+            player_ratings=player_ratings,
+        )
+        for change in changes:
+            if change.team_id is not None:
+                team_ratings[change.team_id] = change.rating_after
+            elif change.player_id is not None:
+                player_ratings[change.player_id] = change.rating_after
+        all_changes.extend(changes)
+    await dao.delete_ratings()
+    await dao.save_rebuilt(all_changes)
+    await dao.commit()
+
+
+async def get_teams_leaderboard(
+    dao: LeaderboardGetter, limit: int = LEADERBOARD_SIZE
+) -> list[dto.TeamRating]:
+    return await dao.get_teams_leaderboard(limit)
+
+
+async def get_players_leaderboard(
+    dao: LeaderboardGetter, limit: int = LEADERBOARD_SIZE
+) -> list[dto.PlayerRating]:
+    return await dao.get_players_leaderboard(limit)
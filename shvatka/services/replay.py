@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+from shvatka.interfaces.dal.replay import GameReplayBuilder, GameReplaySaver, GameReplayGetter
+from shvatka.models import dto
+from shvatka.utils import exceptions
+
+DEFAULT_TIMELINE_STEP = timedelta(minutes=15)
+
+
+async def build_replay(game: dto.Game, dao: GameReplayBuilder) -> dto.GameReplay:
+    level_starts = await dao.get_game_level_starts(game)
+    key_times = await dao.get_game_key_times(game)
+    teams: dict[int, dto.TeamReplay] = {}
+
+    def get_team(team_id: int) -> dto.TeamReplay:
+        if team_id not in teams:
+            teams[team_id] = dto.TeamReplay(
+                team_id=team_id, team_name="", level_starts=[], correct_keys=[], wrong_keys=[]
+            )
+        return teams[team_id]
+
+    for team_id, level_number, start_at in sorted(level_starts, key=lambda lt: (lt[0], lt[1])):
+        get_team(team_id).level_starts.append(start_at)
+    for team_id, enter_time, is_correct in key_times:
+        team = get_team(team_id)
+        (team.correct_keys if is_correct else team.wrong_keys).append(enter_time)
+    names = await dao.get_team_names(teams.keys())
+    for team in teams.values():
+        team.team_name = names.get(team.team_id, "")
+        team.correct_keys.sort()
+        team.wrong_keys.sort()
+    return dto.GameReplay(
+        game_id=game.id,
+        levels_count=await dao.get_max_level_number(game) + 1,
+        teams=list(teams.values()),
+    )
+
+
+async def save_replay(game: dto.Game, dao: GameReplaySaver) -> dto.GameReplay:
+    replay = await build_replay(game, dao)
+    await dao.save_replay(replay)
+    return replay
+
+
+async def get_replay(game: dto.Game, dao: GameReplayGetter) -> dto.GameReplay:
+    """повтор доступен только для завершённых игр, иначе это подсказка играющим"""
+    if not game.is_complete():
+        raise exceptions.GameNotCompleted(game=game)
+    if replay := await dao.get_replay(game.id):
+        return replay
+    # игры, завершённые до появления индекса
+    return await save_replay(game, dao)
+
+
+async def get_standings_at(
+    game: dto.Game, at: datetime, dao: GameReplayGetter
+) -> list[dto.TeamStanding]:
+    return (await get_replay(game, dao)).standings_at(at)
+
+
+async def get_timeline(
+    game: dto.Game, dao: GameReplayGetter, step: timedelta = DEFAULT_TIMELINE_STEP
+) -> list[dto.ReplayFrame]:
+    return (await get_replay(game, dao)).timeline(step)
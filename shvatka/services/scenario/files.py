@@ -24,10 +24,11 @@ async def upsert_files(
 
 
 async def get_file_metas(
-    game: dto.FullGame, author: dto.Player, dao: GamePackager
+    game: dto.Game, author: dto.Player, dao: GamePackager
 ) -> list[scn.FileMeta]:
     file_metas = []
-    for guid in game.get_guids():
+    # guid'ы читаются из jsonb в бд, без разбора подсказок
+    for guid in await dao.get_guids(game):
         file_meta = await dao.get_by_guid(guid)
         check_file_meta_can_read(author, file_meta, game)
         file_metas.append(file_meta)
@@ -13,11 +13,12 @@ from shvatka.utils.exceptions import WaiverForbidden, PermissionsError
 
 
 async def get_vote_to_voted(
+    game: dto.Game,
     team: dto.Team,
     dao: WaiverVoteGetter,
 ) -> dict[Played, list[dto.VotedPlayer]]:
     result = {}
-    for vote in await get_voted_list(team, dao):
+    for vote in await get_voted_list(game, team, dao):
         result.setdefault(vote.vote, []).append(dto.VotedPlayer(player=vote.player, pit=vote.pit))
     return result
 
@@ -25,19 +26,15 @@ async def get_vote_to_voted(
 async def get_all_played(
     game: dto.Game, dao: GameWaiversGetter
 ) -> dict[dto.Team, Iterable[dto.VotedPlayer]]:
-    teams = await dao.get_played_teams(game)
-    result = {}
-    for team in teams:
-        players = await dao.get_played(game, team)
-        result[team] = players
-    return result
+    return await dao.get_all_played(game)
 
 
 async def get_voted_list(
+    game: dto.Game,
     team: dto.Team,
     dao: WaiverVoteGetter,
 ) -> list[dto.Vote]:
-    poll_date = await dao.get_dict_player_vote(team.id)
+    poll_date = await dao.get_dict_player_vote(game.id, team.id)
     voted_players = await dao.get_by_ids_with_user_and_pit(poll_date.keys())
     result = []
     for voted in voted_players:
@@ -66,7 +63,7 @@ async def force_add_vote(
     dao: WaiverVoteAdder,
 ):
     await check_player_on_team(player, team, dao)
-    await dao.add_player_vote(team.id, player.id, vote.name)
+    await dao.add_player_vote(game.id, team.id, player.id, vote.name)
 
 
 async def approve_waivers(
@@ -82,25 +79,28 @@ async def approve_waivers(
     """
     team_player = await get_full_team_player(approver, team, dao)
     check_allow_approve_waivers(team_player)
-    for vote in await get_voted_list(team, dao):
-        if vote.vote == Played.not_allowed:
-            continue
-        waiver = dto.Waiver(
+    waivers = [
+        dto.Waiver(
             player=vote.player,
             team=team,
             game=game,
             played=vote.vote,
         )
-        await dao.upsert(waiver)
+        for vote in await get_voted_list(game, team, dao)
+        if vote.vote != Played.not_allowed
+    ]
+    await dao.upsert_many(waivers)
     await dao.commit()
 
 
-async def get_voted_yes(team: dto.Team, dao: WaiverApprover) -> list[dto.Vote]:
-    return list(filter(lambda x: x.vote == Played.yes, await get_voted_list(team, dao)))
+async def get_voted_yes(game: dto.Game, team: dto.Team, dao: WaiverApprover) -> list[dto.Vote]:
+    return list(filter(lambda x: x.vote == Played.yes, await get_voted_list(game, team, dao)))
 
 
-async def get_not_played_team_players(team: dto.Team, dao: WaiverApprover) -> list[dto.Player]:
-    votes_yes = await get_voted_yes(team, dao)
+async def get_not_played_team_players(
+    game: dto.Game, team: dto.Team, dao: WaiverApprover
+) -> list[dto.Player]:
+    votes_yes = await get_voted_yes(game, team, dao)
     players = await dao.get_players(team)
     not_played = set(players) - set(map(lambda v: v.pit, votes_yes))
     return list(sorted(map(lambda tp: tp.player, not_played), key=lambda p: p.id))
@@ -122,7 +122,7 @@ async def revoke_vote_by_captain(
         played=Played.revoked,
     )
     await dao.upsert(waiver)
-    await dao.del_player_vote(team.id, target.id)
+    await dao.del_player_vote(game.id, team.id, target.id)
     await dao.commit()
 
 
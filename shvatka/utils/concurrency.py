@@ -0,0 +1,53 @@
+import asyncio
+import logging
+import time
+from typing import Iterable, Callable, Awaitable, TypeVar, Any
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+FAN_OUT_CONCURRENCY = 20
+
+
+async def fan_out(
+    items: Iterable[T],
+    action: Callable[[T], Awaitable[Any]],
+    name: str,
+    key: Callable[[T], Any] = repr,
+    limit: int = FAN_OUT_CONCURRENCY,
+) -> list[T]:
+    """
+    Выполняет action для всех элементов, не больше limit одновременно.
+    Ошибка на одном элементе логируется и не мешает остальным.
+    В лог пишется, когда закончился первый и последний элемент.
+    :return: элементы, на которых action упал
+    """
+    items = list(items)
+    semaphore = asyncio.Semaphore(limit)
+    started = time.monotonic()
+
+    async def run(item: T) -> float:
+        async with semaphore:
+            await action(item)
+        return time.monotonic() - started
+
+    results = await asyncio.gather(*[run(item) for item in items], return_exceptions=True)
+    failed: list[T] = []
+    elapsed: list[float] = []
+    for item, result in zip(items, results):
+        if isinstance(result, BaseException):
+            logger.error("%s failed for %s", name, key(item), exc_info=result)
+            failed.append(item)
+        else:
+            elapsed.append(result)
+    if elapsed:
+        logger.info(
+            "%s: %s done, first after %.3fs, last after %.3fs, %s failed",
+            name,
+            len(elapsed),
+            min(elapsed),
+            max(elapsed),
+            len(failed),
+        )
+    return failed
@@ -130,6 +130,10 @@ class AnotherGameWasStarted(AnotherGameIsActive):
     notify_user = "Другая игра уже начата"
 
 
+class TeamInAnotherGame(AnotherGameIsActive):
+    notify_user = "Команда уже подала вейверы на другую активную игру"
+
+
 class GameNotCompleted(GameStatusError):
     notify_user = "Данная игра не завершена. Невозможно отобразить её данные"
 
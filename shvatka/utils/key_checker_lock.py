@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Protocol, Iterable
 
 from shvatka.models import dto
 
@@ -24,11 +24,12 @@ class KeyCheckerFactory(Protocol):
     def lock_player(self, player: dto.Player) -> KeyCheckerLock:
         raise NotImplementedError
 
-    def lock_globally(self) -> KeyCheckerLock:
+    def lock_game(self, game: dto.Game) -> KeyCheckerLock:
         raise NotImplementedError
 
     def __call__(self, team: dto.Team) -> KeyCheckerLock:
         return self.lock_team(team)
 
-    def clear(self) -> None:
+    def clear(self, game: dto.Game, teams: Iterable[dto.Team]) -> None:
+        """освобождает локи закончившейся игры, не трогая другие идущие игры"""
         raise NotImplementedError
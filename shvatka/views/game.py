@@ -47,6 +47,11 @@ class GameLogWriter(Protocol):
         raise NotImplementedError
 
 
+class GameEventPublisher(Protocol):
+    async def publish(self, event: dto.GameEvent) -> None:
+        raise NotImplementedError
+
+
 class OrgNotifier(Protocol):
     async def notify(self, event: Event) -> None:
         raise NotImplementedError
@@ -0,0 +1,27 @@
+"""
+python -m tests.benchmarks.log_keys
+
+Рендер лога ключей должен расти линейно от количества ключей.
+"""
+import timeit
+
+from tests.unit.test_log_keys_view import create_log_keys
+from tgbot.views.keys import render_log_keys, render_log_keys_pages
+
+
+def main():
+    for keys_count in (5_000, 10_000, 20_000):
+        log_keys = create_log_keys(teams=10, keys_per_team=keys_count // 10)
+        single = min(timeit.repeat(lambda: render_log_keys(log_keys), number=1, repeat=5))
+        pages = min(
+            timeit.repeat(
+                lambda: render_log_keys_pages(log_keys, "Лог ключей"), number=1, repeat=5
+            )
+        )
+        print(
+            f"{keys_count:>6} keys: one page {single * 1000:.1f} ms, pages {pages * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
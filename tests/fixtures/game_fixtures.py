@@ -51,86 +51,87 @@ async def finished_game(
     await add_vote(game, slytherin, draco, Played.yes, dao.waiver_vote_adder)
     await approve_waivers(game, gryffindor, harry, dao.waiver_approver)
     await dao.game.set_started(game)
+    await dao.game_starter.set_teams_to_first_level(game, [gryffindor, slytherin])
 
-    await dao.key_time.save_key(
+    await dao.game_player.save_key(
         key="SHWRONG",
         team=gryffindor,
-        level=game.levels[0],
+        level_number=0,
         game=game,
         player=ron,
         is_correct=False,
         is_duplicate=False,
     )
-    await dao.key_time.save_key(
+    await dao.game_player.save_key(
         key="SH123",
         team=gryffindor,
-        level=game.levels[0],
+        level_number=0,
         game=game,
         player=harry,
         is_correct=True,
         is_duplicate=False,
     )
-    await dao.key_time.save_key(
+    await dao.game_player.save_key(
         key="SH123",
         team=slytherin,
-        level=game.levels[0],
+        level_number=0,
         game=game,
         player=draco,
         is_correct=True,
         is_duplicate=False,
     )
-    await dao.key_time.save_key(
+    await dao.game_player.save_key(
         key="SH123",
         team=gryffindor,
-        level=game.levels[0],
+        level_number=0,
         game=game,
         player=hermione,
         is_correct=True,
         is_duplicate=True,
     )
-    await dao.key_time.save_key(
+    await dao.game_player.save_key(
         key="SH321",
         team=slytherin,
-        level=game.levels[0],
+        level_number=0,
         game=game,
         player=draco,
         is_correct=True,
         is_duplicate=False,
     )
-    await dao.game_player.level_up(slytherin, game.levels[0], game)
+    await dao.game_player.level_up(slytherin, 0, game)
     await asyncio.sleep(1)
-    await dao.key_time.save_key(
+    await dao.game_player.save_key(
         key="SH123",
         team=gryffindor,
-        level=game.levels[0],
+        level_number=0,
         game=game,
         player=ron,
         is_correct=True,
         is_duplicate=False,
     )
-    await dao.game_player.level_up(gryffindor, game.levels[0], game)
+    await dao.game_player.level_up(gryffindor, 0, game)
     await asyncio.sleep(2)
-    await dao.key_time.save_key(
+    await dao.game_player.save_key(
         key="SHOOT",
         team=gryffindor,
-        level=game.levels[1],
+        level_number=1,
         game=game,
         player=hermione,
         is_correct=True,
         is_duplicate=False,
     )
-    await dao.game_player.level_up(gryffindor, game.levels[1], game)
+    await dao.game_player.level_up(gryffindor, 1, game)
     await asyncio.sleep(1)
-    await dao.key_time.save_key(
+    await dao.game_player.save_key(
         key="SHOOT",
         team=slytherin,
-        level=game.levels[1],
+        level_number=1,
         game=game,
         player=draco,
         is_correct=True,
         is_duplicate=False,
     )
-    await dao.game_player.level_up(slytherin, game.levels[1], game)
+    await dao.game_player.level_up(slytherin, 1, game)
     await dao.game.set_finished(game)
     await dao.commit()
 
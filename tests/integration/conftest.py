@@ -22,7 +22,7 @@ from common.factory import create_telegraph
 from infrastructure.clients.file_gateway import BotFileGateway
 from infrastructure.db.config.models.db import RedisConfig
 from infrastructure.db.dao.holder import HolderDao
-from infrastructure.db.dao.memory.level_testing import LevelTestingData
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
 from infrastructure.db.faсtory import create_lock_factory, create_level_test_dao
 from shvatka.interfaces.clients.file_storage import FileStorage, FileGateway
 from shvatka.interfaces.scheduler import Scheduler
@@ -50,12 +50,12 @@ logger = logging.getLogger(__name__)
 
 
 @pytest.fixture(scope="session")
-def level_test_dao() -> LevelTestingData:
-    return create_level_test_dao()
+def level_test_dao(redis: Redis) -> LevelTestStorage:
+    return create_level_test_dao(redis)
 
 
 @pytest_asyncio.fixture
-async def dao(session: AsyncSession, redis: Redis, level_test_dao: LevelTestingData) -> HolderDao:
+async def dao(session: AsyncSession, redis: Redis, level_test_dao: LevelTestStorage) -> HolderDao:
     dao_ = HolderDao(session=session, redis=redis, level_test=level_test_dao)
     await clear_data(dao_)
     return dao_
@@ -63,7 +63,7 @@ async def dao(session: AsyncSession, redis: Redis, level_test_dao: LevelTestingD
 
 @pytest_asyncio.fixture
 async def check_dao(
-    session: AsyncSession, redis: Redis, level_test_dao: LevelTestingData
+    session: AsyncSession, redis: Redis, level_test_dao: LevelTestStorage
 ) -> HolderDao:
     dao_ = HolderDao(session=session, redis=redis, level_test=level_test_dao)
     return dao_
@@ -78,6 +78,9 @@ async def clear_data(dao: HolderDao):
     await dao.level.delete_all()
     await dao.level_time.delete_all()
     await dao.key_time.delete_all()
+    await dao.game_team_stat.delete_all()
+    await dao.imported_scenario.delete_all()
+    await dao.rating.delete_ratings()
     await dao.game.delete_all()
     await dao.team_player.delete_all()
     await dao.chat.delete_all()
@@ -173,7 +176,7 @@ def dp(
     scheduler: Scheduler,
     locker: KeyCheckerFactory,
     file_storage: FileStorage,
-    level_test_dao: LevelTestingData,
+    level_test_dao: LevelTestStorage,
     telegraph: Telegraph,
     message_manager: MockMessageManager,
 ) -> Dispatcher:
@@ -88,7 +88,7 @@ async def test_game_simple(
     assert game.id == gotten_games[0].id
 
     await start_waivers(game, author, dao.game)
-    active_game = await get_active(dao.game)
+    active_game = await get_active(dao.active_game_router)
     assert GameStatus.getting_waivers == active_game.status
     assert active_game.id == game.id
 
@@ -115,10 +115,23 @@ async def test_cant_change_finished(finished_game: dto.FullGame, dao: HolderDao)
 
 @pytest.mark.asyncio
 async def test_set_game_completed(
-    finished_game: dto.FullGame, dao: HolderDao, check_dao: HolderDao
+    finished_game: dto.FullGame,
+    gryffindor: dto.Team,
+    slytherin: dto.Team,
+    dao: HolderDao,
+    check_dao: HolderDao,
 ):
-    await complete_game(game=finished_game, dao=dao.game)
+    await complete_game(game=finished_game, dao=dao.game_completer)
     game = await check_dao.game.get_by_id(finished_game.id, finished_game.author)
     assert game.is_complete()
     db_game = await check_dao.game._get_by_id(finished_game.id)
     assert 1 == db_game.number
+
+    replay = await check_dao.replay.get_replay(finished_game.id)
+    assert replay is not None
+    assert 2 == replay.levels_count
+    standings = replay.standings_at(replay.finish_at)
+    assert [gryffindor.name, slytherin.name] == [s.team_name for s in standings]
+    assert all(s.is_finished for s in standings)
+    first = replay.standings_at(replay.start_at)
+    assert {0} == {s.level_number for s in first}
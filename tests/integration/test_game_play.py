@@ -2,14 +2,14 @@ from datetime import datetime, timedelta
 
 import pytest
 from dataclass_factory import Factory
-from mockito import mock, when, ANY, unstub
+from mockito import mock, when, ANY, unstub, verify
 
 from infrastructure.db import models
 from infrastructure.db.dao.holder import HolderDao
 from shvatka.interfaces.clients.file_storage import FileStorage
 from shvatka.interfaces.scheduler import Scheduler
 from shvatka.models import dto
-from shvatka.models.enums import GameStatus
+from shvatka.models.enums import GameStatus, GameEventType
 from shvatka.models.enums.played import Played
 from shvatka.services.game import start_waivers
 from shvatka.services.game_play import start_game, send_hint, check_key, get_available_hints
@@ -21,6 +21,7 @@ from shvatka.utils.datetime_utils import tz_utc
 from shvatka.utils.key_checker_lock import KeyCheckerFactory
 from shvatka.views.game import GameView, GameLogWriter, OrgNotifier, LevelUp
 from tests.mocks.aiogram_mocks import mock_coro
+from tests.mocks.game_events import GameEventPublisherMock
 from tests.utils.time_key import assert_time_key
 
 
@@ -51,20 +52,27 @@ async def test_game_play(
     when(dummy_sched).plain_hint(
         level=game.levels[0], team=gryffindor, hint_number=1, run_at=ANY
     ).thenReturn(mock_coro(None))
+    events = GameEventPublisherMock()
     game.start_at = datetime.now(tz=tz_utc)
-    await start_game(game, dao.game_starter, dummy_log, dummy_view, dummy_sched)
+    await start_game(game, dao.game_starter, dummy_log, dummy_view, dummy_sched, events)
     assert 1 == await check_dao.level_time.count()
 
     when(dummy_view).send_hint(gryffindor, 1, game.levels[0]).thenReturn(mock_coro(None))
     when(dummy_sched).plain_hint(game.levels[0], gryffindor, 2, ANY).thenReturn(mock_coro(None))
-    await send_hint(
+    hint_kwargs = dict(
         level=game.levels[0],
         hint_number=1,
         team=gryffindor,
-        dao=dao.level_time,
+        dao=dao.hint_sender,
         view=dummy_view,
         scheduler=dummy_sched,
+        events=events,
     )
+    await send_hint(**hint_kwargs)
+    # повтор задачи после рестарта не отправляет подсказку второй раз
+    await send_hint(**hint_kwargs)
+    verify(dummy_view, times=1).send_hint(gryffindor, 1, game.levels[0])
+    assert {1} == await dao.hint_sender.get_sent_hints(gryffindor, game.levels[0])
 
     dummy_org_notifier = mock(OrgNotifier)
     orgs = await get_orgs(game, dao.organizer)
@@ -78,6 +86,7 @@ async def test_game_play(
         org_notifier=dummy_org_notifier,
         locker=locker,
         scheduler=scheduler,
+        events=events,
     )
     when(dummy_view).wrong_key(key=ANY).thenReturn(mock_coro(None))
     await check_key(key="SHWRONG", **key_kwargs)
@@ -190,6 +199,16 @@ async def test_game_play(
     )
     assert await dao.game_player.is_all_team_finished(game)
     assert GameStatus.finished == (await dao.game.get_by_id(game.id, author)).status
+    assert [
+        (GameEventType.level_up, 0),
+        (GameEventType.hint, 0),
+        (GameEventType.correct_key, 0),
+        (GameEventType.correct_key, 0),
+        (GameEventType.level_up, 1),
+        (GameEventType.correct_key, 1),
+        (GameEventType.team_finished, 2),
+        (GameEventType.game_finished, 2),
+    ] == [(e.type, e.level_number) for e in events.events]
 
 
 @pytest.mark.asyncio
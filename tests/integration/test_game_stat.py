@@ -5,7 +5,7 @@ import pytest
 
 from infrastructure.db.dao.holder import HolderDao
 from shvatka.models import dto
-from shvatka.services.game_stat import get_game_stat, get_typed_keys
+from shvatka.services.game_stat import get_game_stat, get_typed_keys, get_game_spy
 
 
 @pytest.mark.asyncio
@@ -25,3 +25,22 @@ async def test_game_log_keys(
     )
     assert 5 == len(actual[gryffindor])
     assert 3 == len(actual[slytherin])
+    assert all(key.team is actual[gryffindor][0].team for key in actual[gryffindor])
+
+
+@pytest.mark.asyncio
+async def test_game_spy(
+    finished_game: dto.FullGame, gryffindor: dto.Team, slytherin: dto.Team, dao: HolderDao
+):
+    actual = await get_game_spy(finished_game, finished_game.author, dao.game_stat)
+    progress = {p.team: p for p in actual}
+    assert 2 == len(progress)
+
+    assert progress[gryffindor].is_finished
+    assert 2 == progress[gryffindor].level_number
+    assert 5 == progress[gryffindor].keys_typed
+    assert 1 == progress[gryffindor].wrong_keys
+
+    assert progress[slytherin].is_finished
+    assert 3 == progress[slytherin].keys_typed
+    assert 0 == progress[slytherin].wrong_keys
@@ -2,6 +2,7 @@ import pytest
 from dataclass_factory import Factory
 
 from infrastructure.db.dao.holder import HolderDao
+from shvatka.models import dto
 from shvatka.models.dto.scn.game import RawGameScenario
 from shvatka.models.dto.scn.level import LevelScenario
 from shvatka.services.level import upsert_raw_level
@@ -28,3 +29,14 @@ async def test_simple_level(simple_scn: RawGameScenario, dao: HolderDao, dcf: Fa
     assert lvl.number_in_game is None
 
     assert lvl.scenario.keys == {"SH123", "SH321"}
+
+
+@pytest.mark.asyncio
+async def test_level_projections(game: dto.FullGame, dao: HolderDao):
+    first_level = game.levels[0]
+
+    assert await dao.level.get_keys(game, 0) == first_level.get_keys()
+    assert await dao.level.get_keys(game, 1) == {"SHOOT"}
+    assert await dao.level.get_hint_times(game, 0) == [0, 1, 2, 5]
+    assert await dao.level.get_hints_count(game, 0) == first_level.hints_count
+    assert await dao.level.get_guids(game) == game.get_guids()
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+from dataclass_factory import Factory
+from redis.asyncio import Redis
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.db.dao.holder import HolderDao
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
+from shvatka.interfaces.clients.file_storage import FileGateway
+from shvatka.interfaces.scheduler import Scheduler
+from shvatka.models import dto
+from shvatka.models.dto.scn.game import RawGameScenario
+from shvatka.models.enums import GameStatus
+from shvatka.models.enums.played import Played
+from shvatka.services.game import (
+    start_waivers,
+    upsert_game,
+    get_active,
+    get_active_games,
+    bind_team_to_game,
+)
+from shvatka.services.game_play import check_key
+from shvatka.services.game_stat import get_typed_keys
+from shvatka.services.player import join_team
+from shvatka.services.waiver import add_vote, approve_waivers
+from shvatka.utils.exceptions import TeamInAnotherGame
+from shvatka.utils.key_checker_lock import KeyCheckerFactory
+from tests.mocks.game_events import GameEventPublisherMock
+from tests.mocks.game_view import GameViewMock, GameLogWriterMock
+from tests.mocks.org_notifier import OrgNotifierMock
+
+KEYS_PER_TEAM = 50
+
+
+@pytest.mark.asyncio
+async def test_two_games_at_once(
+    pool: sessionmaker,
+    redis: Redis,
+    level_test_dao: LevelTestStorage,
+    dao: HolderDao,
+    check_dao: HolderDao,
+    locker: KeyCheckerFactory,
+    scheduler: Scheduler,
+    dcf: Factory,
+    file_gateway: FileGateway,
+    three_lvl_scn: RawGameScenario,
+    author: dto.Player,
+    harry: dto.Player,
+    hermione: dto.Player,
+    ron: dto.Player,
+    draco: dto.Player,
+    gryffindor: dto.Team,
+    slytherin: dto.Team,
+    game: dto.FullGame,
+):
+    await dao.player.promote(author, ron)
+    await dao.commit()
+    ron.can_be_author = True
+    second = await upsert_game(
+        RawGameScenario(scn={**three_lvl_scn.scn, "name": "Second game"}, files={}),
+        ron,
+        dao.game_upserter,
+        dcf,
+        file_gateway,
+    )
+    await start_waivers(game, author, dao.game)
+    await start_waivers(second, ron, dao.game)
+    assert [game.id, second.id] == [g.id for g in await get_active_games(dao.game)]
+
+    # каждая команда собирает вейверы на свою игру
+    await bind_team_to_game(gryffindor, game, dao.team_game_binder)
+    await bind_team_to_game(slytherin, second, dao.team_game_binder)
+    assert game.id == (await get_active(dao.active_game_router, team=gryffindor)).id
+    assert second.id == (await get_active(dao.active_game_router, team=slytherin)).id
+    assert second.id == (await get_active(dao.active_game_router, player=draco)).id
+    assert second.id == (await get_active(dao.active_game_router, player=ron)).id
+
+    await join_team(hermione, gryffindor, harry, dao.team_player)
+    await add_vote(game, gryffindor, harry, Played.yes, dao.waiver_vote_adder)
+    await add_vote(game, gryffindor, hermione, Played.yes, dao.waiver_vote_adder)
+    await add_vote(second, slytherin, draco, Played.yes, dao.waiver_vote_adder)
+    await approve_waivers(game, gryffindor, harry, dao.waiver_approver)
+    await approve_waivers(second, slytherin, draco, dao.waiver_approver)
+    with pytest.raises(TeamInAnotherGame):
+        await bind_team_to_game(gryffindor, second, dao.team_game_binder)
+
+    for game_, team in ((game, gryffindor), (second, slytherin)):
+        await dao.game.set_started(game_)
+        await dao.game_starter.set_teams_to_first_level(game_, [team])
+    await dao.commit()
+
+    views = {game.id: GameViewMock(), second.id: GameViewMock()}
+    logs = {game.id: GameLogWriterMock(), second.id: GameLogWriterMock()}
+
+    async def submit(key: str, player: dto.Player, team: dto.Team, game_: dto.FullGame):
+        async with pool() as session:
+            dao_ = HolderDao(session=session, redis=redis, level_test=level_test_dao)
+            await check_key(
+                key=key,
+                player=player,
+                team=team,
+                game=game_,
+                dao=dao_.game_player,
+                view=views[game_.id],
+                game_log=logs[game_.id],
+                org_notifier=OrgNotifierMock(),
+                locker=locker,
+                scheduler=scheduler,
+                events=GameEventPublisherMock(),
+            )
+
+    await asyncio.gather(
+        *[submit(f"SHWRONG{i}", harry, gryffindor, game) for i in range(KEYS_PER_TEAM)],
+        *[submit(f"SHWRONG{i}", draco, slytherin, second) for i in range(KEYS_PER_TEAM)],
+    )
+    slytherin_lock = locker(slytherin)
+    second_lock = locker.lock_game(second)
+    for key in ("SH123", "SH321", "SHOOT"):
+        await submit(key, harry, gryffindor, game)
+
+    assert GameStatus.finished == (await check_dao.game.get_by_id(game.id)).status
+    assert GameStatus.started == (await check_dao.game.get_by_id(second.id)).status
+    assert ["Game finished"] == logs[game.id].messages
+    assert [] == logs[second.id].messages
+    # законченная игра не сбрасывает локи идущей
+    assert locker(slytherin) is slytherin_lock
+    assert locker.lock_game(second) is second_lock
+
+    assert KEYS_PER_TEAM == len(views[game.id].calls["wrong_key"])
+    assert KEYS_PER_TEAM == len(views[second.id].calls["wrong_key"])
+    assert [gryffindor] == views[game.id].calls["game_finished_by_all"]
+    first_keys = await get_typed_keys(game=game, player=author, dao=check_dao.typed_keys)
+    second_keys = await get_typed_keys(game=second, player=ron, dao=check_dao.typed_keys)
+    assert [gryffindor] == list(first_keys)
+    assert KEYS_PER_TEAM + 3 == len(first_keys[gryffindor])
+    assert [slytherin] == list(second_keys)
+    assert KEYS_PER_TEAM == len(second_keys[slytherin])
+    assert 0 == await check_dao.game_player.get_current_level_number(slytherin, second)
@@ -0,0 +1,15 @@
+import pytest
+from redis.asyncio.client import Redis
+
+from infrastructure.db.dao.redis.orgs_cache import OrgsCache
+from shvatka.models import dto
+
+
+@pytest.mark.asyncio
+async def test_invalidate_other_process(redis: Redis, game: dto.FullGame):
+    # два кэша - как два процесса бота
+    cache, other = OrgsCache(redis), OrgsCache(redis)
+    version = await cache.get_version(game)
+    cache.set(game, version, [])
+    await other.invalidate(game)
+    assert cache.get(game, await cache.get_version(game)) is None
@@ -0,0 +1,31 @@
+import pytest
+
+from infrastructure.db.dao.holder import HolderDao
+from shvatka.models import dto
+from shvatka.services.game import complete_game
+from shvatka.services.rating import get_teams_leaderboard, rebuild_ratings, INITIAL_RATING
+
+
+@pytest.mark.asyncio
+async def test_rating_on_complete_game(
+    finished_game: dto.FullGame,
+    gryffindor: dto.Team,
+    slytherin: dto.Team,
+    harry: dto.Player,
+    dao: HolderDao,
+    check_dao: HolderDao,
+):
+    await complete_game(game=finished_game, dao=dao.game_completer)
+
+    leaderboard = await get_teams_leaderboard(check_dao.rating)
+    assert [gryffindor.id, slytherin.id] == [r.team.id for r in leaderboard]
+    assert leaderboard[0].rating > INITIAL_RATING > leaderboard[1].rating
+    assert [1, 1] == [r.games_count for r in leaderboard]
+    assert {harry.id: INITIAL_RATING} == await check_dao.rating.get_player_ratings([harry.id])
+    assert await check_dao.rating.is_rated(finished_game)
+
+    await rebuild_ratings(dao.rating)
+    rebuilt = await get_teams_leaderboard(check_dao.rating)
+    assert [(r.team.id, r.rating, r.games_count) for r in leaderboard] == [
+        (r.team.id, r.rating, r.games_count) for r in rebuilt
+    ]
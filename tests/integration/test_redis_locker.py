@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+from redis.asyncio.client import Redis
+
+from infrastructure.db.dao.redis.locker import RedisLockFactory
+from shvatka.models import dto
+
+
+@pytest.mark.asyncio
+async def test_team_lock_shared_between_processes(redis: Redis):
+    # две фабрики - как два процесса бота
+    lockers = [RedisLockFactory(redis), RedisLockFactory(redis)]
+    team = dto.Team(1, *[None] * 5)
+    inside = 0
+    max_inside = 0
+
+    async def check_key(locker: RedisLockFactory):
+        nonlocal inside, max_inside
+        async with locker(team):
+            inside += 1
+            max_inside = max(max_inside, inside)
+            await asyncio.sleep(0.01)
+            inside -= 1
+
+    await asyncio.gather(*[check_key(lockers[i % 2]) for i in range(10)])
+    assert 1 == max_inside
+
+
+@pytest.mark.asyncio
+async def test_other_team_not_locked(redis: Redis):
+    locker = RedisLockFactory(redis)
+    async with locker(dto.Team(1, *[None] * 5)):
+        other = locker(dto.Team(2, *[None] * 5))
+        await asyncio.wait_for(other.acquire(), timeout=1)
+        await other.release()
+
+
+@pytest.mark.asyncio
+async def test_game_lock_shared_between_processes(redis: Redis):
+    lockers = [RedisLockFactory(redis), RedisLockFactory(redis)]
+    game = dto.Game(1, *[None] * 7)
+    finished: list[int] = []
+    game_finished: list[int] = []
+
+    async def finish_team(team_id: int, locker: RedisLockFactory):
+        # как в check_key: проверка "все финишировали" под локом игры
+        async with locker.lock_game(game):
+            others_finished = len(finished)
+            await asyncio.sleep(0.01)
+            finished.append(team_id)
+            if others_finished == 1:
+                game_finished.append(team_id)
+
+    await asyncio.gather(finish_team(1, lockers[0]), finish_team(2, lockers[1]))
+    assert 1 == len(game_finished)
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+from redis.asyncio import Redis
+
+from infrastructure.scheduler.leader import LeaderLease
+
+
+@pytest.mark.asyncio
+async def test_leader_lease(redis: Redis):
+    first = LeaderLease(redis, key="test.leader")
+    second = LeaderLease(redis, key="test.leader")
+
+    assert await first.acquire_or_renew()
+    assert not await second.acquire_or_renew()
+    assert await first.acquire_or_renew()
+
+    await second.release()  # чужую аренду отпустить нельзя
+    assert not await second.acquire_or_renew()
+
+    await first.release()
+    assert await second.acquire_or_renew()
+    assert not await first.acquire_or_renew()
+    await second.release()
+
+
+@pytest.mark.asyncio
+async def test_leader_lease_expired(redis: Redis):
+    first = LeaderLease(redis, key="test.leader", ttl=0.01)
+    second = LeaderLease(redis, key="test.leader")
+
+    assert await first.acquire_or_renew()
+    await asyncio.sleep(0.05)
+    assert await second.acquire_or_renew()
+    assert not await first.acquire_or_renew()
+    await second.release()
@@ -26,7 +26,7 @@ async def test_get_voted_list(
     await add_vote(game, gryffindor, harry, Played.yes, dao.waiver_vote_adder)
     await add_vote(game, gryffindor, hermione, Played.yes, dao.waiver_vote_adder)
 
-    actual = await get_vote_to_voted(gryffindor, dao.waiver_vote_getter)
+    actual = await get_vote_to_voted(game, gryffindor, dao.waiver_vote_getter)
     assert len(actual) == 1
     actual_voted = actual[Played.yes]
     assert len(actual_voted) == 2
@@ -41,7 +41,7 @@ async def test_get_voted_list(
     assert {harry.id, hermione.id} == {player.player.id for player in players}
 
     await leave(hermione, hermione, dao.team_leaver)
-    actual = await get_vote_to_voted(gryffindor, dao.waiver_vote_getter)
+    actual = await get_vote_to_voted(game, gryffindor, dao.waiver_vote_getter)
     assert len(actual) == 1
     actual_voted = actual[Played.yes]
     assert len(actual_voted) == 1
@@ -0,0 +1,10 @@
+from shvatka.models import dto
+from shvatka.views.game import GameEventPublisher
+
+
+class GameEventPublisherMock(GameEventPublisher):
+    def __init__(self):
+        self.events: list[dto.GameEvent] = []
+
+    async def publish(self, event: dto.GameEvent) -> None:
+        self.events.append(event)
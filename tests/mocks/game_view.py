@@ -0,0 +1,36 @@
+from shvatka.models import dto
+from shvatka.views.game import GameView, GameLogWriter
+
+
+class GameViewMock(GameView):
+    def __init__(self):
+        self.calls = {}
+
+    async def send_puzzle(self, team: dto.Team, level: dto.Level) -> None:
+        self.calls.setdefault("send_puzzle", []).append((team, level))
+
+    async def send_hint(self, team: dto.Team, hint_number: int, level: dto.Level) -> None:
+        self.calls.setdefault("send_hint", []).append((team, hint_number, level))
+
+    async def duplicate_key(self, key: dto.KeyTime) -> None:
+        self.calls.setdefault("duplicate_key", []).append(key)
+
+    async def correct_key(self, key: dto.KeyTime) -> None:
+        self.calls.setdefault("correct_key", []).append(key)
+
+    async def wrong_key(self, key: dto.KeyTime) -> None:
+        self.calls.setdefault("wrong_key", []).append(key)
+
+    async def game_finished(self, team: dto.Team) -> None:
+        self.calls.setdefault("game_finished", []).append(team)
+
+    async def game_finished_by_all(self, team: dto.Team) -> None:
+        self.calls.setdefault("game_finished_by_all", []).append(team)
+
+
+class GameLogWriterMock(GameLogWriter):
+    def __init__(self):
+        self.messages: list[str] = []
+
+    async def log(self, message: str) -> None:
+        self.messages.append(message)
@@ -0,0 +1,88 @@
+import csv
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from infrastructure.analytics import engine
+from infrastructure.analytics.arrays import build_game_arrays, GameArraysCache
+from infrastructure.analytics.report import write_levels
+
+START = datetime(2023, 1, 1, 12)
+
+
+def at(minutes: int) -> datetime:
+    return START + timedelta(minutes=minutes)
+
+
+def create_game_arrays(game_id: int = 1):
+    return build_game_arrays(
+        game_id=game_id,
+        # команда 10 прошла оба уровня, 20 только первый, 30 застряла на первом
+        level_starts=[
+            (10, 0, at(0)),
+            (10, 1, at(20)),
+            (10, 2, at(50)),
+            (20, 0, at(0)),
+            (20, 1, at(40)),
+            (30, 0, at(0)),
+        ],
+        key_counts=[(10, 0, 4, 3), (20, 0, 2, 1), (30, 0, 5, 5), (20, 1, 1, 1)],
+        hint_times=[(0, 0), (0, 15), (0, 30), (1, 0), (1, 10)],
+    )
+
+
+def test_build_game_arrays():
+    game = create_game_arrays()
+    assert [10, 20, 30] == game.team_ids.tolist()
+    assert 2 == game.levels_count
+    assert np.isnan(game.hint_times[1, 2])
+    assert [[4, 0], [2, 1], [5, 0]] == game.keys.tolist()
+
+
+def test_level_stats():
+    first, second = engine.level_stats(create_game_arrays())
+    assert (3, 2) == (first.teams, first.solved)
+    assert 30 * 60 == first.mean
+    assert (0, 1, 1) == first.hints
+    assert 9 / 11 == pytest.approx(first.wrong_keys_rate)
+    assert (2, 1) == (second.teams, second.solved)
+    assert (0, 1, 0) == second.hints
+
+
+def test_team_rankings():
+    first = create_game_arrays(1)
+    second = create_game_arrays(2)
+    second.team_ids[:] = [20, 10, 40]
+    ranks = engine.team_rankings([first, second])
+    assert [10, 20, 30, 40] == [rank.team_id for rank in ranks]
+    assert (2, 1) == (ranks[0].games, ranks[0].wins)
+    assert [0, 4, 2] == engine.hint_dependency_total([first, second]).tolist()
+
+
+def test_game_arrays_cache(tmp_path: Path):
+    cache = GameArraysCache(tmp_path)
+    assert cache.get(1) is None
+    cache.put(create_game_arrays())
+    loaded = cache.get(1)
+    assert loaded is not None
+    np.testing.assert_array_equal(create_game_arrays().level_starts, loaded.level_starts)
+
+
+def test_write_levels_unsolved(tmp_path: Path):
+    # второй уровень никто не решил
+    game = build_game_arrays(
+        game_id=1,
+        level_starts=[(10, 0, at(0)), (10, 1, at(20)), (20, 0, at(0)), (20, 1, at(30))],
+        key_counts=[(10, 1, 3, 3)],
+        hint_times=[(0, 0), (1, 0)],
+    )
+    path = tmp_path / "levels.csv"
+    write_levels([SimpleNamespace(id=1, name="game")], [game], path)  # type: ignore[list-item]
+    with path.open(encoding="utf-8") as f:
+        first, second = csv.DictReader(f)
+    assert "1500" == first["mean_seconds"]
+    assert ("0", "") == (second["solved"], second["mean_seconds"])
+    assert all("" == second[f"p{p}_seconds"] for p in engine.PERCENTILES)
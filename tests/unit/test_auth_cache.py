@@ -0,0 +1,102 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from api.config.models.auth import AuthConfig
+from api.dependencies.auth import AuthProvider
+from api.dependencies.identity import IdentityProvider
+from shvatka.models import dto
+from shvatka.utils.exceptions import PlayerNotInTeam
+
+
+class UserDaoMock:
+    def __init__(self, user: dto.User):
+        self.user = user
+        self.calls = 0
+
+    async def get_by_username(self, username: str) -> dto.User:
+        self.calls += 1
+        return self.user
+
+
+class HolderDaoMock:
+    def __init__(self, user: dto.User):
+        self.user = UserDaoMock(user)
+
+
+@pytest.fixture
+def auth() -> AuthProvider:
+    return AuthProvider(
+        AuthConfig(
+            secret_key="secret",
+            token_expire=timedelta(minutes=5),
+            bot_username="",
+            auth_url="",
+            bot_token="",
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_current_user_cached(auth: AuthProvider):
+    user = dto.User(tg_id=42, db_id=1, username="harry")
+    dao = HolderDaoMock(user)
+    token = auth.create_user_token(user).access_token
+    assert user == await auth.get_current_user(token, dao)  # type: ignore[arg-type]
+    assert user == await auth.get_current_user(token, dao)  # type: ignore[arg-type]
+    assert 1 == dao.user.calls
+
+
+@pytest.mark.asyncio
+async def test_username_of_other_user(auth: AuthProvider):
+    token = auth.create_user_token(dto.User(tg_id=42, db_id=1, username="harry")).access_token
+    dao = HolderDaoMock(dto.User(tg_id=43, db_id=2, username="harry"))
+    with pytest.raises(HTTPException):
+        await auth.get_current_user(token, dao)  # type: ignore[arg-type]
+
+
+class IdentityDaoMock:
+    def __init__(self, player: dto.Player, team: dto.Team | None):
+        self.player = self
+        self.team_player = self
+        self.player_instance = player
+        self.team = team
+        self.calls = 0
+
+    async def get_by_user(self, user: dto.User) -> dto.Player:
+        self.calls += 1
+        return self.player_instance
+
+    async def upsert_player(self, user: dto.User) -> dto.Player:
+        raise AssertionError("player must not be written on reads")
+
+    async def get_team(self, player: dto.Player) -> dto.Team | None:
+        self.calls += 1
+        return self.team
+
+
+@pytest.mark.asyncio
+async def test_player_and_team_cached():
+    user = dto.User(tg_id=42, db_id=1, username="harry")
+    player = dto.Player(id=7, can_be_author=False, is_dummy=False, user=user)
+    team = SimpleNamespace(id=3)
+    dao = IdentityDaoMock(player, team)  # type: ignore[arg-type]
+    identity = IdentityProvider(timedelta(minutes=1))
+    for _ in range(3):
+        assert player == await identity.player(dao, user)  # type: ignore[arg-type]
+        assert team == await identity.team(dao, player)  # type: ignore[arg-type]
+    assert 2 == dao.calls
+
+
+@pytest.mark.asyncio
+async def test_no_team_not_cached():
+    user = dto.User(tg_id=42, db_id=1, username="harry")
+    player = dto.Player(id=7, can_be_author=False, is_dummy=False, user=user)
+    dao = IdentityDaoMock(player, None)
+    identity = IdentityProvider(timedelta(minutes=1))
+    for _ in range(2):
+        with pytest.raises(PlayerNotInTeam):
+            await identity.team(dao, player)  # type: ignore[arg-type]
+    assert 2 == dao.calls
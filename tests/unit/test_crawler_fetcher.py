@@ -0,0 +1,55 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from infrastructure.crawler.fetcher import HttpCache, CachedResponse, Checkpoint
+from infrastructure.crawler.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_http_cache(tmp_path: Path):
+    cache = HttpCache(tmp_path / "cache")
+    assert cache.get("http://example.org/1.jpg") is None
+
+    response = CachedResponse(
+        url="http://example.org/1.jpg",
+        status=200,
+        content_type="image/jpeg",
+        etag='"abc"',
+        last_modified=None,
+        body=b"12345",
+    )
+    cache.put(response)
+    assert cache.get("http://example.org/1.jpg") == response
+    assert cache.get("http://example.org/2.jpg") is None
+
+
+def test_checkpoint_resume(tmp_path: Path):
+    checkpoint = Checkpoint(tmp_path / "checkpoint.json")
+    checkpoint.mark_done(42)
+    checkpoint.mark_done(21)
+
+    resumed = Checkpoint(tmp_path / "checkpoint.json")
+    assert resumed.is_done(42)
+    assert resumed.is_done(21)
+    assert not resumed.is_done(1)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_is_shared():
+    limiter = RateLimiter(0.05)
+    started_at = time.monotonic()
+    await asyncio.gather(*(limiter.wait() for _ in range(3)))
+    assert time.monotonic() - started_at >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst():
+    bucket = TokenBucket(rate=20, burst=3)
+    started_at = time.monotonic()
+    await asyncio.gather(*(bucket.wait() for _ in range(3)))
+    assert time.monotonic() - started_at < 0.05
+    await asyncio.gather(*(bucket.wait() for _ in range(2)))
+    assert time.monotonic() - started_at >= 0.1
+    assert 0.1 == pytest.approx(bucket.waited, abs=0.01)
@@ -0,0 +1,36 @@
+from infrastructure.crawler.game_scn.parser.parser import parse_game
+from shvatka.models.dto import scn
+
+GAME_HTML = """<html><body>
+<div class='maintitle'><b>42<a>Test game</a><span id='dt'>01.02.13 в 22:00</span></b></div>
+<div id='sc'><div class='borderwrap'><table><tr class='ipbtable'><td>
+<center><b>Уровень 1. Ключ:</b>SH1</center>
+<p>загадка</p><img src='http://example.org/1.jpg'/>
+<b>Подсказка 1 (10 мин.)</b><p>подсказка</p>
+</td></tr></table></div></div>
+<div id='tb'><table><tr class='ipbtable'><td><b>team</b></td><td>22:30:00</td></tr></table></div>
+</body></html>"""
+
+
+def test_parse_game_without_io():
+    page = parse_game(GAME_HTML)
+
+    assert page.id == 42
+    assert page.name == "Test game"
+    assert page.levels[0].keys == {"SH1"}
+    assert [th.time for th in page.levels[0].time_hints] == [0, 10]
+    (guid,) = page.images.keys()
+    assert page.images[guid] == "http://example.org/1.jpg"
+    assert [meta.guid for meta in page.files_meta] == [guid]
+    assert len(page.stat.results["team"]) == 1
+
+
+def test_mark_not_downloaded():
+    page = parse_game(GAME_HTML)
+    (guid,) = page.images.keys()
+
+    page.mark_not_downloaded(guid)
+
+    photo = page.levels[0].time_hints[0].hint[-1]
+    assert isinstance(photo, scn.PhotoHint)
+    assert "http://example.org/1.jpg" in photo.caption
@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from shvatka.utils.concurrency import fan_out
+
+
+@pytest.mark.asyncio
+async def test_fan_out_isolates_errors_and_bounds_concurrency():
+    running = 0
+    max_running = 0
+    done = []
+
+    async def action(item: int):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if item % 5 == 0:
+            raise RuntimeError(item)
+        done.append(item)
+
+    failed = await fan_out(range(20), action, name="test", limit=3)
+
+    assert [0, 5, 10, 15] == failed
+    assert 16 == len(done)
+    assert 3 == max_running
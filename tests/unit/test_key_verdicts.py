@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from tgbot.views.key_verdicts import KeyVerdictCoalescer
+from tgbot.views.utils import MAX_MESSAGE_LENGTH
+
+
+class BotMock:
+    def __init__(self):
+        self.sent: list[tuple[int, str]] = []
+
+    async def send_message(self, chat_id: int, text: str):
+        self.sent.append((chat_id, text))
+
+
+@pytest.mark.asyncio
+async def test_verdicts_coalesced():
+    bot = BotMock()
+    verdicts = KeyVerdictCoalescer(window=0.05)
+    verdicts.add(bot, 1, "SH1 неверный")  # type: ignore[arg-type]
+    verdicts.add(bot, 1, "SH2 неверный")  # type: ignore[arg-type]
+    verdicts.add(bot, 2, "SH3 верный")  # type: ignore[arg-type]
+    assert [] == bot.sent
+    await asyncio.sleep(0.1)
+    assert [(1, "SH1 неверный\nSH2 неверный"), (2, "SH3 верный")] == bot.sent
+
+
+@pytest.mark.asyncio
+async def test_verdicts_flushed_before_puzzle():
+    bot = BotMock()
+    verdicts = KeyVerdictCoalescer(window=10)
+    verdicts.add(bot, 1, "SH1 верный")  # type: ignore[arg-type]
+    await verdicts.flush(1)
+    assert [(1, "SH1 верный")] == bot.sent
+    assert not verdicts.tasks and not verdicts.pending
+
+
+@pytest.mark.asyncio
+async def test_verdicts_burst_split():
+    bot = BotMock()
+    verdicts = KeyVerdictCoalescer(window=10)
+    for i in range(300):
+        verdicts.add(bot, 1, f"SH{i:04} неверный " + "x" * 30)  # type: ignore[arg-type]
+    await verdicts.flush(1)
+    assert len(bot.sent) > 1
+    assert all(len(text) <= MAX_MESSAGE_LENGTH for _, text in bot.sent)
+    assert 300 == sum(len(text.splitlines()) for _, text in bot.sent)
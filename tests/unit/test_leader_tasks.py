@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from infrastructure.scheduler.leader import LeaderTasks
+
+
+@pytest.mark.asyncio
+async def test_tasks_follow_leadership():
+    runs = 0
+
+    async def job():
+        nonlocal runs
+        runs += 1
+        await asyncio.Event().wait()
+
+    leader_tasks = LeaderTasks()
+    leader_tasks.add(job)
+    await asyncio.sleep(0)
+    assert 0 == runs
+
+    leader_tasks.start()
+    leader_tasks.start()
+    await asyncio.sleep(0)
+    assert 1 == runs
+
+    tasks = list(leader_tasks.tasks)
+    leader_tasks.stop()
+    await asyncio.sleep(0)
+    assert all(task.cancelled() for task in tasks)
+
+    leader_tasks.start()
+    leader_tasks.add(job)
+    await asyncio.sleep(0)
+    assert 3 == runs
+    leader_tasks.stop()
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from infrastructure.db.dao.redis.game_events import _to_fields, _from_fields
+from shvatka.models import dto
+from shvatka.models.enums import GameEventType
+from shvatka.utils.datetime_utils import tz_utc
+from tgbot.services.live_spy import LiveSpyState, render_live_spy
+
+
+def event(type_: GameEventType, team_id: int, level_number: int, **kwargs) -> dto.GameEvent:
+    return dto.GameEvent(
+        type=type_,
+        game_id=1,
+        team_id=team_id,
+        team_name=f"team {team_id}",
+        level_number=level_number,
+        at=datetime(2023, 2, 18, 12, tzinfo=tz_utc),
+        **kwargs,
+    )
+
+
+def test_event_fields_roundtrip():
+    expected = event(GameEventType.hint, 1, 2, hint_number=3)
+    raw = {k.encode(): str(v).encode() for k, v in _to_fields(expected).items()}
+    assert expected == _from_fields(raw)
+
+
+def test_live_spy_state():
+    state = LiveSpyState()
+    state.apply(event(GameEventType.level_up, 1, 0))
+    state.apply(event(GameEventType.level_up, 2, 0))
+    state.apply(event(GameEventType.correct_key, 1, 0, key="SH123"))
+    state.apply(event(GameEventType.hint, 1, 0, hint_number=1))
+    assert 1 == state.teams[1].correct_keys
+    assert 1 == state.teams[1].hints
+
+    state.apply(event(GameEventType.level_up, 1, 1))
+    assert 0 == state.teams[1].correct_keys
+    assert "уровень 2" in render_live_spy(state)
+
+    state.apply(event(GameEventType.team_finished, 1, 2))
+    assert not state.is_all_finished
+    state.apply(event(GameEventType.team_finished, 2, 2))
+    assert state.is_all_finished
+
+
+def test_live_spy_game_finished():
+    state = LiveSpyState()
+    state.apply(event(GameEventType.level_up, 1, 0))
+    state.apply(event(GameEventType.level_up, 2, 0))
+    state.apply(event(GameEventType.team_finished, 1, 2))
+    state.apply(event(GameEventType.game_finished, 1, 2))
+    assert not state.is_all_finished
+    assert state.is_game_finished
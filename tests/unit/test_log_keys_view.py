@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+from shvatka.models import dto
+from shvatka.models.enums import ChatType
+from shvatka.utils.datetime_utils import tz_utc
+from tgbot.views.keys import render_log_keys, render_log_keys_pages
+
+
+def create_log_keys(teams: int, keys_per_team: int) -> dict[dto.Team, list[dto.KeyTime]]:
+    start = datetime(2023, 2, 18, 12, tzinfo=tz_utc)
+    result = {}
+    for team_id in range(teams):
+        user = dto.User(tg_id=team_id, first_name=f"player {team_id}")
+        player = dto.Player(id=team_id, can_be_author=False, is_dummy=False, user=user)
+        team = dto.Team(
+            id=team_id,
+            chat=dto.Chat(tg_id=-team_id, type=ChatType.supergroup),
+            name=f"team <{team_id}>",
+            captain=player,
+            is_dummy=False,
+            description=None,
+        )
+        result[team] = [
+            dto.KeyTime(
+                text=f"SH{i}",
+                is_correct=i % 3 == 0,
+                is_duplicate=False,
+                at=start + timedelta(seconds=i),
+                level_number=i // 100,
+                player=player,
+                team=team,
+            )
+            for i in range(keys_per_team)
+        ]
+    return result
+
+
+def test_render_log_keys():
+    text = render_log_keys(create_log_keys(2, 150))
+    assert 2 == text.count("<hr/>")
+    assert 4 == text.count("<ol>")
+    assert 300 == text.count("<li>")
+    assert "team &lt;1&gt;" in text
+
+
+def test_render_log_keys_pages():
+    log_keys = create_log_keys(4, 5000)
+    pages = render_log_keys_pages(log_keys, "Лог ключей", budget=30_000)
+    assert all(len(page.html) <= 30_000 for page in pages)
+    assert 20_000 == sum(page.html.count("<li>") for page in pages)
+    assert all(page.html.count("<ol>") == page.html.count("</ol>") for page in pages)
+    assert len(pages) > 4
+    assert pages[0].title.startswith("Лог ключей. team <0> (1/")
@@ -24,3 +24,22 @@ async def test_other_lock():
     lock1 = locker(team_1)
     lock2 = locker(team_2)
     assert lock1 is not lock2
+
+
+@pytest.mark.asyncio
+async def test_clear_only_finished_game():
+    locker = MemoryLockFactory()
+    game_1 = dto.Game(1, *[None] * 7)
+    game_2 = dto.Game(2, *[None] * 7)
+    team_1 = dto.Team(1, *[None] * 5)
+    team_2 = dto.Team(2, *[None] * 5)
+
+    assert locker.lock_game(game_1) is not locker.lock_game(game_2)
+    lock1 = locker(team_1)
+    lock2 = locker(team_2)
+    game_lock2 = locker.lock_game(game_2)
+
+    locker.clear(game_1, [team_1])
+    assert locker(team_1) is not lock1
+    assert locker(team_2) is lock2
+    assert locker.lock_game(game_2) is game_lock2
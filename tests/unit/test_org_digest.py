@@ -0,0 +1,120 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from infrastructure.db.dao.complex.orgs import OrgAdderImpl
+from infrastructure.db.dao.redis.orgs_cache import OrgsCache
+from shvatka.views.game import LevelUp
+from tgbot.views.org_digest import LevelUpDigest, render_level_up_digest
+from tgbot.views.utils import split_lines, MAX_MESSAGE_LENGTH
+
+
+class BotMock:
+    def __init__(self):
+        self.sent: list[tuple[int, str]] = []
+
+    async def send_message(self, chat_id: int, text: str):
+        self.sent.append((chat_id, text))
+
+
+def org(tg_id: int):
+    return SimpleNamespace(player=SimpleNamespace(user=SimpleNamespace(tg_id=tg_id)))
+
+
+def level_up(team_name: str, number: int, orgs: list) -> LevelUp:
+    level = SimpleNamespace(number_in_game=number, name_id=f"level_{number}")
+    return LevelUp(team=SimpleNamespace(name=team_name), new_level=level, orgs_list=orgs)
+
+
+@pytest.mark.asyncio
+async def test_level_up_digest():
+    bot = BotMock()
+    digest = LevelUpDigest(window=0.05)
+    first, second = org(1), org(2)
+
+    digest.add(bot, level_up("gryffindor", 1, [first, second]))  # type: ignore[arg-type]
+    digest.add(bot, level_up("slytherin", 2, [first]))  # type: ignore[arg-type]
+    assert [] == bot.sent
+    await asyncio.sleep(0.1)
+
+    sent = dict(bot.sent)
+    assert 2 == len(bot.sent)
+    assert "gryffindor" in sent[1] and "slytherin" in sent[1]
+    assert "slytherin" not in sent[2]
+    assert not digest.tasks and not digest.pending
+
+
+class RedisStub:
+    def __init__(self):
+        self.values: dict[str, int] = {}
+
+    async def get(self, key: str) -> int | None:
+        return self.values.get(key)
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    async def expire(self, key: str, ttl: int) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_orgs_cache():
+    redis = RedisStub()
+    # два процесса с общим redis
+    cache, other = OrgsCache(redis, ttl=60), OrgsCache(redis, ttl=60)  # type: ignore[arg-type]
+    game = SimpleNamespace(id=1)
+    version = await cache.get_version(game)  # type: ignore[arg-type]
+    assert cache.get(game, version) is None  # type: ignore[arg-type]
+    cache.set(game, version, [])  # type: ignore[arg-type]
+    other.set(game, version, [])  # type: ignore[arg-type]
+    assert [] == cache.get(game, version)  # type: ignore[arg-type]
+
+    await other.invalidate(game)  # type: ignore[arg-type]
+    version = await cache.get_version(game)  # type: ignore[arg-type]
+    assert cache.get(game, version) is None  # type: ignore[arg-type]
+
+    expired = OrgsCache(redis, ttl=-1)  # type: ignore[arg-type]
+    expired.set(game, version, [])  # type: ignore[arg-type]
+    assert expired.get(game, version) is None  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_orgs_invalidated_after_commit():
+    redis = RedisStub()
+    cache = OrgsCache(redis)  # type: ignore[arg-type]
+    game = SimpleNamespace(id=1)
+    committed = []
+
+    class GameDaoStub:
+        async def commit(self):
+            committed.append(await cache.get_version(game))  # type: ignore[arg-type]
+
+    class OrganizerStub:
+        async def add_new(self, game, player):
+            return "org"
+
+    adder = OrgAdderImpl(
+        game=GameDaoStub(), organizer=OrganizerStub(), secure_invite=None, orgs_cache=cache
+    )  # type: ignore[arg-type]
+    await adder.add_new_org(game, None)  # type: ignore[arg-type]
+    assert 0 == await cache.get_version(game)  # type: ignore[arg-type]
+    await adder.commit()
+    assert [0] == committed
+    assert 1 == await cache.get_version(game)  # type: ignore[arg-type]
+
+
+def test_split_lines():
+    assert ["a\nb", "cc"] == split_lines(["a", "b", "cc"], limit=3)
+    assert ["abc", "de", "f"] == split_lines(["abcde", "f"], limit=3)
+    assert [] == split_lines([])
+
+
+def test_big_digest_split():
+    level_ups = [level_up(f"team {i:04}", 1, []) for i in range(500)]
+    texts = render_level_up_digest(level_ups)
+    assert len(texts) > 1
+    assert all(len(text) <= MAX_MESSAGE_LENGTH for text in texts)
+    assert 501 == sum(len(text.splitlines()) for text in texts)
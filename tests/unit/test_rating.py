@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from shvatka.models import dto
+from shvatka.services.rating import calculate_elo, calculate_game, rank_teams, INITIAL_RATING
+
+START = datetime(2023, 1, 1, 12)
+
+
+def test_rank_teams():
+    results = [
+        dto.TeamResult(team_id=1, level_number=2, at=START + timedelta(hours=2)),
+        dto.TeamResult(team_id=2, level_number=3, at=START + timedelta(hours=3)),
+        dto.TeamResult(team_id=3, level_number=2, at=START + timedelta(hours=1)),
+    ]
+    assert {2: 1, 3: 2, 1: 3} == rank_teams(results)
+
+
+def test_elo_zero_sum_for_equal_ratings():
+    new = calculate_elo({}, {"a": 1, "b": 2, "c": 3})
+    assert new["a"] > INITIAL_RATING > new["c"]
+    assert INITIAL_RATING == pytest.approx(new["b"])
+    assert 3 * INITIAL_RATING == pytest.approx(sum(new.values()))
+
+
+def test_elo_upset_moves_more():
+    favourite_won = calculate_elo({"a": 1700, "b": 1300}, {"a": 1, "b": 2})
+    underdog_won = calculate_elo({"a": 1700, "b": 1300}, {"a": 2, "b": 1})
+    assert underdog_won["b"] - 1300 > favourite_won["a"] - 1700 > 0
+
+
+def test_teammates_not_compared():
+    results = [
+        dto.TeamResult(team_id=1, level_number=1, at=START),
+        dto.TeamResult(team_id=2, level_number=0, at=START),
+    ]
+    changes = calculate_game(1, results, [(10, 1), (11, 1), (20, 2)], {}, {10: 1600})
+    players = {c.player_id: c for c in changes if c.player_id is not None}
+    assert {1} == {players[10].place, players[11].place}
+    assert players[11].rating_after - INITIAL_RATING > players[10].rating_after - 1600
+    assert players[20].rating_after < INITIAL_RATING
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+from infrastructure.db.dao.redis.replay import _to_json, _from_json
+from shvatka.models import dto
+from shvatka.utils.datetime_utils import tz_utc, tz_game
+
+START = datetime(2023, 1, 1, 12, tzinfo=tz_utc)
+
+
+def at(minutes: int) -> datetime:
+    return START + timedelta(minutes=minutes)
+
+
+def create_replay() -> dto.GameReplay:
+    return dto.GameReplay(
+        game_id=1,
+        levels_count=2,
+        teams=[
+            dto.TeamReplay(
+                team_id=1,
+                team_name="slow",
+                level_starts=[at(0), at(40)],
+                correct_keys=[at(40)],
+                wrong_keys=[at(5), at(10)],
+            ),
+            dto.TeamReplay(
+                team_id=2,
+                team_name="fast",
+                level_starts=[at(0), at(30), at(60)],
+                correct_keys=[at(30), at(60)],
+                wrong_keys=[],
+            ),
+        ],
+    )
+
+
+def test_standings_at():
+    replay = create_replay()
+    assert ["slow", "fast"] == [s.team_name for s in replay.standings_at(at(0))]
+    slow, fast = replay.standings_at(at(10))
+    assert 2 == slow.wrong_keys
+    fast, slow = replay.standings_at(at(35))
+    assert ("fast", 1, 1) == (fast.team_name, fast.level_number, fast.correct_keys)
+    assert ("slow", 0) == (slow.team_name, slow.level_number)
+    fast, slow = replay.standings_at(at(90))
+    assert fast.is_finished
+    assert not slow.is_finished
+    assert at(40) == slow.level_started_at
+
+
+def test_standings_at_naive():
+    naive = at(35).astimezone(tz_game).replace(tzinfo=None)
+    fast, slow = create_replay().standings_at(naive)
+    assert ("fast", 1) == (fast.team_name, fast.level_number)
+
+
+def test_standings_before_start():
+    standings = create_replay().standings_at(at(-1))
+    assert {-1} == {s.level_number for s in standings}
+
+
+def test_timeline():
+    frames = create_replay().timeline(timedelta(minutes=25))
+    assert [at(0), at(25), at(50), at(60)] == [frame.at for frame in frames]
+    assert "fast" == frames[-1].standings[0].team_name
+
+
+def test_replay_serialization():
+    replay = create_replay()
+    assert replay == _from_json(replay.game_id, _to_json(replay))
@@ -0,0 +1,32 @@
+from api.dependencies.cache import ResponseCache
+
+
+def test_evict_least_recently_used():
+    cache = ResponseCache(max_bytes=10)
+    cache.put("/a", b"aaaa")
+    cache.put("/b", b"bbbb")
+    assert cache.get("/a") is not None
+    cache.put("/c", b"cccc")
+    assert cache.get("/b") is None
+    assert cache.get("/a") is not None
+    assert cache.get("/c") is not None
+    assert 8 == cache.size
+
+
+def test_too_big_not_cached():
+    cache = ResponseCache(max_bytes=3)
+    response = cache.put("/a", b"aaaa")
+    assert response.body == b"aaaa"
+    assert cache.get("/a") is None
+    assert 0 == cache.size
+
+
+def test_etag_matches():
+    response = ResponseCache(max_bytes=10).put("/a", b"aaaa")
+    assert response.etag.startswith('"')
+    assert response.matches(response.etag)
+    assert response.matches(f'"other", W/{response.etag}')
+    assert response.matches("*")
+    assert not response.matches('"other"')
+    assert not response.matches(None)
+    assert response.etag == ResponseCache(max_bytes=10).put("/b", b"aaaa").etag
@@ -0,0 +1,80 @@
+import csv
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from openpyxl import load_workbook
+
+from infrastructure.export.season import write_csv, write_parquet
+from tgbot.views.results.level_times import export_results_internal, TeamLevelsTimes, LevelTime
+
+
+def test_export_results_xlsx():
+    game = SimpleNamespace(name="Game", is_complete=lambda: True, is_finished=lambda: False)
+    data = [
+        TeamLevelsTimes(
+            SimpleNamespace(name="Gryffindor"),
+            [LevelTime(0, datetime(2023, 1, 1, 12)), LevelTime(1, datetime(2023, 1, 1, 13))],
+        ),
+        TeamLevelsTimes(SimpleNamespace(name="S"), [LevelTime(0, datetime(2023, 1, 1, 12))]),
+    ]
+    file = BytesIO()
+    export_results_internal(game, data, file)  # type: ignore[arg-type]
+    file.seek(0)
+
+    ws = load_workbook(file).active
+    assert [
+        ("Game", None, None),
+        (None, 0, 1),
+        ("Gryffindor", datetime(2023, 1, 1, 12), datetime(2023, 1, 1, 13)),
+        ("S", datetime(2023, 1, 1, 12), None),
+    ] == list(ws.iter_rows(values_only=True))
+    assert 10 == ws.column_dimensions["A"].width
+    assert "HH:MM:SS" == ws["B3"].number_format
+
+
+@pytest.mark.asyncio
+async def test_export_csv(tmp_path: Path):
+    async def rows():
+        yield 1, "Gryffindor", 0
+        yield 1, "Gryffindor", 1
+
+    path = tmp_path / "levels_times.csv"
+    assert 2 == await write_csv(rows(), ("game_id", "team_name", "level_number"), path)
+    with path.open(encoding="utf-8") as f:
+        assert [
+            ["game_id", "team_name", "level_number"],
+            ["1", "Gryffindor", "0"],
+            ["1", "Gryffindor", "1"],
+        ] == list(csv.reader(f))
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(tmp_path: Path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    async def rows():
+        for level_number in range(5):
+            yield 1, "Gryffindor", level_number
+
+    path = tmp_path / "levels_times.parquet"
+    columns = ("game_id", "team_name", "level_number")
+    assert 5 == await write_parquet(rows(), columns, path, batch_size=2)
+    table = pq.read_table(path)
+    assert list(columns) == table.column_names
+    assert [0, 1, 2, 3, 4] == table.column("level_number").to_pylist()
+
+
+@pytest.mark.asyncio
+async def test_export_parquet_empty(tmp_path: Path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    async def rows():
+        return
+        yield
+
+    path = tmp_path / "log_keys.parquet"
+    assert 0 == await write_parquet(rows(), ("game_id", "key_text"), path)
+    assert 0 == pq.read_table(path).num_rows
@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from infrastructure.scheduler.scheduler import ApScheduler
+from shvatka.utils.datetime_utils import tz_utc
+
+
+@pytest.mark.asyncio
+async def test_hint_job_replaced():
+    scheduler = ApScheduler.__new__(ApScheduler)
+    scheduler.scheduler = AsyncIOScheduler()
+    scheduler.scheduler.start(paused=True)
+    level, team = SimpleNamespace(db_id=1), SimpleNamespace(id=2)
+    run_at = datetime.now(tz=tz_utc) + timedelta(minutes=5)
+    try:
+        # как после рестарта: догонялка планирует ту же подсказку ещё раз
+        await scheduler.plain_hint(level, team, 1, run_at)  # type: ignore[arg-type]
+        await scheduler.plain_hint(level, team, 1, run_at)  # type: ignore[arg-type]
+        await scheduler.plain_hint(level, team, 2, run_at)  # type: ignore[arg-type]
+        assert ["hint:2:1:1", "hint:2:1:2"] == sorted(
+            job.id for job in scheduler.scheduler.get_jobs()
+        )
+    finally:
+        scheduler.scheduler.shutdown(wait=False)
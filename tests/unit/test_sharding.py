@@ -0,0 +1,30 @@
+from collections import Counter
+
+from tgbot.utils.sharding import HashRing, get_chat_id
+
+
+def test_hash_ring_stable():
+    ring = HashRing(4)
+    assert [ring.get_node(chat_id) for chat_id in range(100)] == [
+        HashRing(4).get_node(chat_id) for chat_id in range(100)
+    ]
+    load = Counter(ring.get_node(chat_id) for chat_id in range(-10_000, 0))
+    assert {0, 1, 2, 3} == set(load)
+    assert min(load.values()) > 1000
+
+
+def test_hash_ring_grow_moves_few_chats():
+    old, new = HashRing(4), HashRing(5)
+    moved = sum(old.get_node(chat_id) != new.get_node(chat_id) for chat_id in range(10_000))
+    assert moved < 3000
+
+
+def test_get_chat_id():
+    chat = {"id": -100, "type": "group"}
+    user = {"id": 7, "is_bot": False, "first_name": "a"}
+    assert -100 == get_chat_id({"update_id": 1, "message": {"chat": chat, "from": user}})
+    assert -100 == get_chat_id(
+        {"update_id": 1, "callback_query": {"from": user, "message": {"chat": chat}}}
+    )
+    assert 7 == get_chat_id({"update_id": 1, "inline_query": {"from": user, "query": ""}})
+    assert 0 == get_chat_id({"update_id": 1})
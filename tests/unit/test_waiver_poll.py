@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Iterable
+
+import pytest
+
+from shvatka.models import dto
+from shvatka.models.enums.played import Played
+from tgbot.services.waiver_poll import CachedVoteGetter, WaiverPollRenderer
+
+
+def voted(player_id: int) -> dto.VotedPlayer:
+    return dto.VotedPlayer(player=SimpleNamespace(id=player_id), pit=None)  # type: ignore
+
+
+class VoteGetterStub:
+    def __init__(self):
+        self.requested: list[list[int]] = []
+
+    async def get_dict_player_vote(self, game_id: int, team_id: int) -> dict[int, Played]:
+        return {1: Played.yes, 2: Played.no}
+
+    async def get_by_ids_with_user_and_pit(self, ids: Iterable[int]) -> list[dto.VotedPlayer]:
+        ids = list(ids)
+        self.requested.append(ids)
+        return [voted(id_) for id_ in ids]
+
+
+class RendererStub(WaiverPollRenderer):
+    def __init__(self):
+        super().__init__(pool=None, redis=None, level_test_dao=None, window=0.01)  # type: ignore
+        self.rendered = 0
+
+    async def render(self, *args, **kwargs):
+        self.rendered += 1
+
+
+@pytest.mark.asyncio
+async def test_cached_vote_getter():
+    stub = VoteGetterStub()
+    players = {1: voted(1)}
+    getter = CachedVoteGetter(dao=stub, players=players)  # type: ignore[arg-type]
+
+    assert 2 == len(await getter.get_by_ids_with_user_and_pit([1, 2]))
+    assert 2 == len(await getter.get_by_ids_with_user_and_pit([1, 2]))
+    assert [[2]] == stub.requested
+
+
+@pytest.mark.asyncio
+async def test_render_debounced():
+    renderer = RendererStub()
+    game, team = SimpleNamespace(id=1), SimpleNamespace(id=2)
+    for _ in range(10):
+        renderer.schedule(None, team, game, 1, 1)  # type: ignore
+    await asyncio.sleep(0.05)
+    assert 1 == renderer.rendered
+
+    renderer.schedule(None, team, game, 1, 1)  # type: ignore
+    await asyncio.sleep(0.05)
+    assert 2 == renderer.rendered
+    assert not renderer.pending
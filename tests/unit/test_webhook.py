@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+from aiogram import Dispatcher
+from aiohttp.test_utils import TestClient, TestServer
+
+from tgbot.config.models.bot import WebhookConfig
+from tgbot.webhook import create_webhook_app, SECRET_HEADER
+
+
+class SlowDispatcher(Dispatcher):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+        self.processed: list[int] = []
+
+    async def feed_raw_update(self, bot, update, **kwargs):
+        await self.release.wait()
+        self.processed.append(update["update_id"])
+
+
+@pytest.mark.asyncio
+async def test_webhook_backpressure():
+    dp = SlowDispatcher()
+    config = WebhookConfig(url="https://example.org", secret="s", max_concurrency=1, max_queue=1)
+    app = create_webhook_app(dp, None, config)  # type: ignore[arg-type]
+    async with TestClient(TestServer(app)) as client:
+        headers = {SECRET_HEADER: "s"}
+        assert 401 == (await client.post("/webhook", json={"update_id": 0})).status
+        for update_id in (1, 2):
+            resp = await client.post("/webhook", json={"update_id": update_id}, headers=headers)
+            assert 200 == resp.status
+        resp = await client.post("/webhook", json={"update_id": 3}, headers=headers)
+        assert 503 == resp.status
+        assert 503 == (await client.get("/health")).status
+
+        dp.release.set()
+        await asyncio.sleep(0.01)
+        assert [1, 2] == dp.processed
+        health = await client.get("/health")
+        assert 200 == health.status
+        assert 0 == (await health.json())["in_flight"]
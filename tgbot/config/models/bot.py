@@ -15,6 +15,12 @@ class BotConfig:
     superusers: list[int]
     bot_api: BotApiConfig
     telegraph_token: str
+    webhook: WebhookConfig | None = None
+    workers: int = 1
+    # секунды, за которые переходы на уровни сводятся в одно сообщение оргу; None - сразу
+    org_digest_window: float | None = None
+    # секунды, за которые ответы на ключи сводятся в одно сообщение команде; None - сразу
+    key_verdicts_window: float | None = None
 
     def create_session(self) -> AiohttpSession | None:
         if self.bot_api.is_local:
@@ -48,6 +54,29 @@ class BotApiConfig:
         )
 
 
+@dataclass
+class WebhookConfig:
+    """
+    Приём апдейтов вебхуком вместо long polling.
+    max_concurrency - сколько апдейтов обрабатывается одновременно,
+    max_queue - сколько принятых апдейтов может ждать обработки,
+    сверх этого telegram получает 503 и повторит доставку позже
+    """
+
+    url: str
+    path: str = "/webhook"
+    secret: str | None = None
+    host: str = "0.0.0.0"
+    port: int = 8080
+    max_concurrency: int = 100
+    max_queue: int = 1000
+    health_path: str = "/health"
+
+    @property
+    def full_url(self) -> str:
+        return self.url.rstrip("/") + self.path
+
+
 class BotApiType(Enum):
     official = "official"
     local = "local"
@@ -1,4 +1,4 @@
-from tgbot.config.models.bot import BotConfig, BotApiConfig, BotApiType
+from tgbot.config.models.bot import BotConfig, BotApiConfig, BotApiType, WebhookConfig
 
 
 def load_bot_config(dct: dict) -> BotConfig:
@@ -9,6 +9,10 @@ def load_bot_config(dct: dict) -> BotConfig:
         superusers=dct["superusers"],
         bot_api=load_botapi(dct["botapi"]),
         telegraph_token=dct["telegraph_token"],
+        webhook=load_webhook(dct["webhook"]) if dct.get("webhook") else None,
+        workers=dct.get("workers", 1),
+        org_digest_window=dct.get("org_digest_window", None),
+        key_verdicts_window=dct.get("key_verdicts_window", None),
     )
 
 
@@ -18,3 +22,16 @@ def load_botapi(dct: dict) -> BotApiConfig:
         botapi_url=dct.get("botapi_url", None),
         botapi_file_url=dct.get("file_url", None),
     )
+
+
+def load_webhook(dct: dict) -> WebhookConfig:
+    return WebhookConfig(
+        url=dct["url"],
+        path=dct.get("path", "/webhook"),
+        secret=dct.get("secret", None),
+        host=dct.get("host", "0.0.0.0"),
+        port=dct.get("port", 8080),
+        max_concurrency=dct.get("max_concurrency", 100),
+        max_queue=dct.get("max_queue", 1000),
+        health_path=dct.get("health_path", "/health"),
+    )
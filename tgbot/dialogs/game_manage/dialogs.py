@@ -9,6 +9,7 @@ from aiogram_dialog.widgets.kbd import (
     Calendar,
     Cancel,
     Start,
+    Group,
 )
 from aiogram_dialog.widgets.text import Const, Format, Case, Jinja
 
@@ -20,6 +21,7 @@ from .getters import (
     get_game_datetime,
     get_games,
     get_completed_game,
+    get_game_replay,
 )
 from .handlers import (
     select_my_game,
@@ -37,6 +39,7 @@ from .handlers import (
     select_game,
     show_my_game_orgs,
     show_my_zip_scn,
+    replay_move,
 )
 from ..preview_data import PREVIEW_GAME
 
@@ -80,10 +83,46 @@ games = Dialog(
             id="game_zip_scn",
             on_click=show_zip_scn,
         ),
+        SwitchTo(
+            Const("⏯Повтор игры"),
+            id="game_replay",
+            state=states.CompletedGamesPanelSG.replay,
+        ),
         state=states.CompletedGamesPanelSG.game,
         preview_data={"game": PREVIEW_GAME},
         getter=get_completed_game,
     ),
+    Window(
+        Jinja(
+            "Повтор игры <b>{{game.name}}</b>\n"
+            "{% if frame %}"
+            "Положение на {{ frame.at|user_timezone }} ({{frame_number}}/{{frames_count}}):\n\n"
+            "{% for s in frame.standings %}"
+            "{{loop.index}}. <b>{{s.team_name}}</b>: "
+            "{% if s.is_finished %}🏁финишировала"
+            "{% elif s.level_number < 0 %}ещё не начала"
+            "{% else %}уровень №{{s.level_number + 1}}"
+            "{% endif %} (ключей: {{s.correct_keys}}, ошибок: {{s.wrong_keys}})\n"
+            "{% endfor %}"
+            "{% else %}"
+            "Нет данных о прохождении"
+            "{% endif %}"
+        ),
+        Group(
+            Button(Const("⏮"), id="replay_first", on_click=replay_move),
+            Button(Const("◀"), id="replay_prev", on_click=replay_move),
+            Button(Const("▶"), id="replay_next", on_click=replay_move),
+            Button(Const("⏭"), id="replay_last", on_click=replay_move),
+            width=4,
+        ),
+        SwitchTo(
+            Const("⤴Назад к игре"),
+            id="to_game",
+            state=states.CompletedGamesPanelSG.game,
+        ),
+        state=states.CompletedGamesPanelSG.replay,
+        getter=get_game_replay,
+    ),
 )
 
 my_games = Dialog(
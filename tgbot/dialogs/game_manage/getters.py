@@ -6,6 +6,7 @@ from infrastructure.db.dao.holder import HolderDao
 from shvatka.models import dto
 from shvatka.services import game
 from shvatka.services.game import get_authors_games, get_completed_games
+from shvatka.services.replay import get_replay, DEFAULT_TIMELINE_STEP
 from shvatka.utils.datetime_utils import tz_game
 
 
@@ -29,6 +30,19 @@ async def get_completed_game(dao: HolderDao, dialog_manager: DialogManager, **_)
     }
 
 
+async def get_game_replay(dao: HolderDao, dialog_manager: DialogManager, **_):
+    game_ = await game.get_game(id_=dialog_manager.dialog_data["game_id"], dao=dao.game)
+    frames = (await get_replay(game_, dao.game_replay)).timeline(DEFAULT_TIMELINE_STEP)
+    dialog_manager.dialog_data["replay_frames_count"] = len(frames)
+    frame_number = min(dialog_manager.dialog_data.get("replay_frame", 0), len(frames) - 1)
+    return {
+        "game": game_,
+        "frame": frames[frame_number] if frames else None,
+        "frame_number": frame_number + 1,
+        "frames_count": len(frames),
+    }
+
+
 async def get_game(dao: HolderDao, player: dto.Player, dialog_manager: DialogManager, **_):
     game_id = (
         dialog_manager.dialog_data.get("my_game_id", None)
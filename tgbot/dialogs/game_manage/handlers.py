@@ -35,6 +35,22 @@ async def select_game(c: CallbackQuery, widget: Any, manager: DialogManager, ite
     await manager.switch_to(states.CompletedGamesPanelSG.game)
 
 
+async def replay_move(c: CallbackQuery, widget: Button, manager: DialogManager):
+    await c.answer()
+    frame = manager.dialog_data.get("replay_frame", 0)
+    frames_count = manager.dialog_data.get("replay_frames_count", 1)
+    match widget.widget_id:
+        case "replay_first":
+            frame = 0
+        case "replay_prev":
+            frame -= 1
+        case "replay_next":
+            frame += 1
+        case "replay_last":
+            frame = frames_count - 1
+    manager.dialog_data["replay_frame"] = max(0, min(frame, frames_count - 1))
+
+
 async def start_schedule_game(c: CallbackQuery, widget: Button, manager: DialogManager):
     await c.answer()
     game_id = manager.dialog_data["my_game_id"]
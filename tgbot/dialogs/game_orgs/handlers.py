@@ -28,6 +28,7 @@ async def change_permission_handler(c: CallbackQuery, button: Button, manager: D
     org = await get_org_by_id(org_id, dao.organizer)
     permission = OrgPermission[button.widget_id]
     await flip_permission(author, org, permission, dao.organizer)
+    await dao.orgs_cache.invalidate(org.game)
 
 
 async def change_deleted_handler(c: CallbackQuery, button: Button, manager: DialogManager):
@@ -37,3 +38,4 @@ async def change_deleted_handler(c: CallbackQuery, button: Button, manager: Dial
     org_id = manager.dialog_data["org_id"]
     org = await get_org_by_id(org_id, dao.organizer)
     await flip_deleted(author, org, dao.organizer)
+    await dao.orgs_cache.invalidate(org.game)
@@ -8,7 +8,7 @@ from aiogram_dialog.widgets.text import Const, Format, Jinja, Multi
 from shvatka.utils.datetime_utils import tz_utc
 from tgbot import states
 from .getters import get_org, get_spy, get_keys
-from .handlers import keys_handler
+from .handlers import keys_handler, live_spy_handler
 
 game_spy = Dialog(
     Window(
@@ -29,6 +29,12 @@ game_spy = Dialog(
             state=states.OrgSpySG.spy,
             when=F["org"].can_spy & F["game"].is_started,
         ),
+        Button(
+            Const("📡Живой шпион"),
+            id="live_spy",
+            on_click=live_spy_handler,
+            when=F["org"].can_spy & F["game"].is_started,
+        ),
         SwitchTo(
             Const("🔑Лог ключей"),
             id="spy_keys",
@@ -47,7 +53,8 @@ game_spy = Dialog(
             "{% else %}"
             "<b>{{ lt.team.name }}</b> - уровень {{ lt.level_number + 1 }} начат "
             "{% endif %}"
-            "{{ lt.start_at|user_timezone }}"
+            "{{ lt.start_at|user_timezone }}, "
+            "ключей: {{ lt.keys_typed }} (неверных: {{ lt.wrong_keys }})\n"
             "{% endfor %}",
             when=F["org"].can_spy,
         ),
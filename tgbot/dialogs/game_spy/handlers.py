@@ -1,3 +1,4 @@
+from aiogram import Bot
 from aiogram.types import CallbackQuery
 from aiogram_dialog import DialogManager
 from aiogram_dialog.widgets.kbd import Button
@@ -5,8 +6,9 @@ from aiogram_dialog.widgets.kbd import Button
 from infrastructure.db.dao.holder import HolderDao
 from shvatka.models import dto
 from shvatka.services.game_stat import get_typed_keys
-from tgbot.views.keys import render_log_keys
+from tgbot.views.keys import publish_log_keys
 from tgbot.views.telegraph import Telegraph
+from tgbot.views.utils import total_remove_msg
 
 
 async def keys_handler(c: CallbackQuery, widget: Button, manager: DialogManager):
@@ -15,10 +17,24 @@ async def keys_handler(c: CallbackQuery, widget: Button, manager: DialogManager)
     game: dto.Game = manager.middleware_data["game"]
     dao: HolderDao = manager.middleware_data["dao"]
     player: dto.Player = manager.middleware_data["player"]
-    keys = await get_typed_keys(game=game, player=player, dao=dao.key_time)
-    text = render_log_keys(keys)
-    page = await telegraph.create_page(
+    keys = await get_typed_keys(game=game, player=player, dao=dao.typed_keys)
+    manager.dialog_data["key_link"] = await publish_log_keys(
+        telegraph=telegraph,
         title=f"Лог ключей игры {game.name}",
-        html_content=text,
+        log_keys=keys,
     )
-    manager.dialog_data["key_link"] = page["url"]
+
+
+async def live_spy_handler(c: CallbackQuery, widget: Button, manager: DialogManager):
+    await c.answer()
+    bot: Bot = manager.middleware_data["bot"]
+    game: dto.Game = manager.middleware_data["game"]
+    dao: HolderDao = manager.middleware_data["dao"]
+    msg = await bot.send_message(
+        chat_id=c.from_user.id,
+        text="Живой шпион: сообщение будет обновляться по ходу игры",
+    )
+    old_msg_id = await dao.live_spy.subscribe(
+        game_id=game.id, chat_id=msg.chat.id, message_id=msg.message_id
+    )
+    await total_remove_msg(bot, chat_id=msg.chat.id, msg_id=old_msg_id)
@@ -20,6 +20,8 @@ from tgbot.filters.game_status import GameStatusFilter
 from tgbot.filters.team_player import TeamPlayerFilter
 from tgbot.views.commands import SPY_COMMAND, SPY_LEVELS_COMMAND, SPY_KEYS_COMMAND
 from tgbot.views.game import GameBotLog, create_bot_game_view, BotOrgNotifier
+from tgbot.views.key_verdicts import KeyVerdictCoalescer
+from tgbot.views.org_digest import LevelUpDigest
 
 
 async def check_key_handler(
@@ -33,6 +35,8 @@ async def check_key_handler(
     bot: Bot,
     config: BotConfig,
     file_storage: FileStorage,
+    org_digest: LevelUpDigest | None,
+    key_verdicts: KeyVerdictCoalescer | None,
 ):
     try:
         await check_key(
@@ -41,11 +45,14 @@ async def check_key_handler(
             team=team,
             game=await dao.game.get_full(game.id),
             dao=dao.game_player,
-            view=create_bot_game_view(bot=bot, dao=dao, storage=file_storage),
+            view=create_bot_game_view(
+                bot=bot, dao=dao, storage=file_storage, verdicts=key_verdicts
+            ),
             game_log=GameBotLog(bot=bot, log_chat_id=config.log_chat),
-            org_notifier=BotOrgNotifier(bot=bot),
+            org_notifier=BotOrgNotifier(bot=bot, digest=org_digest),
             locker=locker,
             scheduler=scheduler,
+            events=dao.game_events,
         )
     except InvalidKey:
         raise SkipHandler
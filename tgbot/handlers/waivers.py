@@ -7,6 +7,7 @@ from infrastructure.db.dao.holder import HolderDao
 from shvatka.models import dto
 from shvatka.models.enums import GameStatus
 from shvatka.models.enums.played import Played
+from shvatka.services.game import bind_team_to_game, get_games_getting_waivers, get_game
 from shvatka.services.player import get_my_team, get_full_team_player
 from shvatka.services.waiver import (
     add_vote,
@@ -16,22 +17,76 @@ from shvatka.services.waiver import (
     get_not_played_team_players,
     force_add_vote,
 )
-from shvatka.utils.exceptions import PlayerNotInTeam, AnotherGameIsActive
+from shvatka.utils.exceptions import PlayerNotInTeam, AnotherGameIsActive, GameStatusError
 from tgbot import keyboards as kb
 from tgbot.filters.game_status import GameStatusFilter
 from tgbot.filters.is_team import IsTeamFilter
 from tgbot.filters.team_player import TeamPlayerFilter
 from tgbot.middlewares import TeamPlayerMiddleware
 from tgbot.services.waiver import swap_saved_message, get_saved_message
+from tgbot.services.waiver_poll import WaiverPollRenderer
 from tgbot.utils.router import disable_router_on_game
 from tgbot.views.commands import START_WAIVERS_COMMAND, APPROVE_WAIVERS_COMMAND
 from tgbot.views.utils import total_remove_msg
 from tgbot.views.waiver import get_waiver_poll_text, start_approve_waivers, get_waiver_final_text
 
 
-async def start_waivers(m: Message, team: dto.Team, game: dto.Game, dao: HolderDao, bot: Bot):
+async def start_waivers(
+    m: Message,
+    team: dto.Team,
+    game: dto.Game,
+    dao: HolderDao,
+    bot: Bot,
+    waiver_poll: WaiverPollRenderer,
+):
+    await bind_team_to_game(team, game, dao.team_game_binder)
+    await send_waiver_poll(m, team, game, dao, bot, waiver_poll)
+
+
+async def choose_game_for_waivers(m: Message, team: dto.Team, dao: HolderDao):
+    """активных игр несколько, а команда ещё не выбрала, на какую собирает вейверы"""
+    games = await get_games_getting_waivers(dao.game)
+    if not games:
+        await m.answer("Сейчас ни одна игра не собирает вейверы")
+        return
+    await m.answer(
+        text="На какую игру собираем вейверы?",
+        reply_markup=kb.get_kb_choose_game_waivers(team, games),
+    )
+
+
+async def choose_game_for_waivers_handler(
+    c: CallbackQuery,
+    callback_data: kb.WaiverChooseGameCD,
+    player: dto.Player,
+    team: dto.Team,
+    dao: HolderDao,
+    bot: Bot,
+    waiver_poll: WaiverPollRenderer,
+):
+    if team.id != callback_data.team_id:
+        raise PlayerNotInTeam(player=player, team=team)
+    game = await get_game(callback_data.game_id, dao=dao.game)
+    if not game.is_getting_waivers():
+        raise GameStatusError(game=game, game_status=game.status, player=player)
+    await bind_team_to_game(team, game, dao.team_game_binder)
+    await c.answer()
+    chooser: Message = c.message  # type: ignore[assignment]
+    await send_waiver_poll(chooser, team, game, dao, bot, waiver_poll)
+    await total_remove_msg(bot, chooser.chat.id, chooser.message_id)
+
+
+async def send_waiver_poll(
+    m: Message,
+    team: dto.Team,
+    game: dto.Game,
+    dao: HolderDao,
+    bot: Bot,
+    waiver_poll: WaiverPollRenderer,
+):
+    waiver_poll.reset(game, team)
     msg = await m.answer(
-        text=await get_waiver_poll_text(team, game, dao),
+        text=await get_waiver_poll_text(team, game, dao.waiver_vote_getter),
         reply_markup=kb.get_kb_waivers(team),
         disable_web_page_preview=True,
     )
@@ -46,6 +101,8 @@ async def add_vote_handler(
     team: dto.Team,
     game: dto.Game,
     dao: HolderDao,
+    bot: Bot,
+    waiver_poll: WaiverPollRenderer,
 ):
     if team.id != callback_data.team_id:
         raise PlayerNotInTeam(player=player, team=team)
@@ -57,10 +114,12 @@ async def add_vote_handler(
         dao=dao.waiver_vote_adder,
     )
     await c.answer()
-    await c.message.edit_text(  # type: ignore[union-attr]
-        text=await get_waiver_poll_text(team, game, dao),
-        reply_markup=kb.get_kb_waivers(team),
-        disable_web_page_preview=True,
+    waiver_poll.schedule(
+        bot=bot,
+        team=team,
+        game=game,
+        chat_id=c.message.chat.id,  # type: ignore[union-attr]
+        msg_id=c.message.message_id,  # type: ignore[union-attr]
     )
 
 
@@ -121,7 +180,7 @@ async def confirm_approve_waivers_handler(
     await approve_waivers(game=game, team=team, approver=player, dao=dao.waiver_approver)
     await bot.send_message(
         chat_id=team.chat.tg_id,
-        text=await get_waiver_final_text(team, game, dao),
+        text=await get_waiver_final_text(team, game, dao.waiver_vote_getter),
         disable_web_page_preview=True,
     )
     await c.answer("Вейверы успешно опубликованы!")
@@ -194,7 +253,7 @@ async def waiver_add_force_menu(
             notify_user="Ты не состоишь в команде, за которую подаёшь вейверы!",
         )
     check_allow_approve_waivers(await get_full_team_player(player, team, dao.waiver_approver))
-    players = await get_not_played_team_players(team=team, dao=dao.waiver_approver)
+    players = await get_not_played_team_players(game=game, team=team, dao=dao.waiver_approver)
     await c.answer()
     await c.message.edit_text(  # type: ignore[union-attr]
         text="Кого из игроков добавить в список вейверов принудительно?",
@@ -222,7 +281,7 @@ async def add_force_player(
     check_allow_approve_waivers(await get_full_team_player(player, team, dao.waiver_approver))
     target = await dao.player.get_by_id(callback_data.player_id)
     await force_add_vote(game, team, target, Played.yes, dao.waiver_vote_adder)
-    players = await get_not_played_team_players(team=team, dao=dao.waiver_approver)
+    players = await get_not_played_team_players(game=game, team=team, dao=dao.waiver_approver)
     await c.answer()
     await c.message.edit_text(  # type: ignore[union-attr]
         text="Кого из игроков добавить в список вейверов принудительно?",
@@ -235,14 +294,21 @@ def setup() -> Router:
     router = Router(name=__name__)
     disable_router_on_game(router)
 
-    player_router = router.include_router(Router(name=__name__ + ".player"))
-    captain_router = router.include_router(Router(name=__name__ + ".captain"))
+    choose_router = router.include_router(Router(name=__name__ + ".choose"))
+    waivers_router = router.include_router(Router(name=__name__ + ".waivers"))
+    player_router = waivers_router.include_router(Router(name=__name__ + ".player"))
+    captain_router = waivers_router.include_router(Router(name=__name__ + ".captain"))
 
     # filters
-    router.message.filter(
+    # чат не относится ни к одной игре - команда должна выбрать, на какую собирает вейверы
+    choose_router.message.filter(GameStatusFilter(active=False))
+    choose_router.callback_query.filter(
+        GameStatusFilter(active=False), TeamPlayerFilter(can_manage_waivers=True)
+    )
+    waivers_router.message.filter(
         GameStatusFilter(status=GameStatus.getting_waivers),
     )
-    router.callback_query.filter(
+    waivers_router.callback_query.filter(
         GameStatusFilter(status=GameStatus.getting_waivers),
     )
     player_router.callback_query.filter(TeamPlayerFilter())
@@ -250,8 +316,19 @@ def setup() -> Router:
     # middlewares
     player_router.callback_query.outer_middleware.register(TeamPlayerMiddleware())
     captain_router.callback_query.outer_middleware.register(TeamPlayerMiddleware())
+    choose_router.callback_query.outer_middleware.register(TeamPlayerMiddleware())
 
     # handlers
+    choose_router.message.register(
+        choose_game_for_waivers,
+        Command(START_WAIVERS_COMMAND),
+        IsTeamFilter(),
+    )
+    choose_router.callback_query.register(
+        choose_game_for_waivers_handler,
+        kb.WaiverChooseGameCD.filter(),
+        IsTeamFilter(),
+    )
     captain_router.message.register(
         start_waivers,
         Command(START_WAIVERS_COMMAND),
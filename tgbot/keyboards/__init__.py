@@ -17,6 +17,7 @@ from .waiver import (
     get_kb_manage_waivers,
     get_kb_waiver_one_player,
     get_kb_force_add_waivers,
+    get_kb_choose_game_waivers,
     WaiverVoteCD,
     WaiverConfirmCD,
     WaiverAddForceMenuCD,
@@ -24,4 +25,5 @@ from .waiver import (
     WaiverMainCD,
     WaiverRemovePlayerCD,
     WaiverAddPlayerForceCD,
+    WaiverChooseGameCD,
 )
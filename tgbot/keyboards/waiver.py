@@ -46,6 +46,11 @@ class WaiverAddPlayerForceCD(CallbackData, prefix="waiver_add_force"):
     player_id: int
 
 
+class WaiverChooseGameCD(CallbackData, prefix="waiver_game"):
+    game_id: int
+    team_id: int
+
+
 def get_kb_waivers(team: dto.Team) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     builder.button(text="Играю", callback_data=WaiverVoteCD(vote=Played.yes, team_id=team.id))
@@ -114,3 +119,14 @@ def get_kb_force_add_waivers(
         )
     builder.adjust(1)
     return builder.as_markup()
+
+
+def get_kb_choose_game_waivers(team: dto.Team, games: Iterable[dto.Game]) -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    for game in games:
+        builder.button(
+            text=game.name,
+            callback_data=WaiverChooseGameCD(game_id=game.id, team_id=team.id),
+        )
+    builder.adjust(1)
+    return builder.as_markup()
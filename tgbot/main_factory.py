@@ -1,4 +1,6 @@
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from aiogram import Bot, Dispatcher
 from aiogram.fsm.storage.base import BaseStorage
@@ -6,25 +8,40 @@ from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.fsm.storage.redis import RedisStorage, DefaultKeyBuilder, RedisEventIsolation
 from dataclass_factory import Factory
 from redis.asyncio.client import Redis
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, close_all_sessions
 
 from common.config.models.paths import Paths
 from common.config.parser.paths import common_get_paths
+from common.factory import create_telegraph, create_dataclass_factory
+from infrastructure.clients.factory import create_file_storage
 from infrastructure.db.config.models.storage import StorageConfig, StorageType
-from infrastructure.db.dao.memory.level_testing import LevelTestingData
-from infrastructure.db.faсtory import create_redis
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
+from infrastructure.db.faсtory import (
+    create_redis,
+    create_pool,
+    create_lock_factory,
+    create_level_test_dao,
+)
+from infrastructure.scheduler.factory import create_scheduler
 from shvatka.interfaces.clients.file_storage import FileStorage
 from shvatka.interfaces.scheduler import Scheduler
 from shvatka.utils.key_checker_lock import KeyCheckerFactory
 from tgbot.config.models.main import TgBotConfig
 from tgbot.handlers import setup_handlers
 from tgbot.middlewares import setup_middlewares
+from tgbot.services.live_spy import LiveSpyUpdater
 from tgbot.username_resolver.user_getter import UserGetter
+from tgbot.views.jinja_filters import setup_jinja
 from tgbot.views.telegraph import Telegraph
 
 logger = logging.getLogger(__name__)
 
 
+def is_multiprocess(config: TgBotConfig) -> bool:
+    """несколько воркеров или реплик за вебхуком - общее состояние только в redis"""
+    return config.bot.workers > 1 or config.bot.webhook is not None
+
+
 def create_bot(config: TgBotConfig) -> Bot:
     return Bot(
         token=config.bot.token,
@@ -33,6 +50,54 @@ def create_bot(config: TgBotConfig) -> Bot:
     )
 
 
+@asynccontextmanager
+async def bot_environment(config: TgBotConfig) -> AsyncIterator[tuple[Dispatcher, Bot]]:
+    """
+    Бот и диспетчер со всеми зависимостями.
+    Задачи планировщика и живого шпиона выполняет тот процесс, что держит аренду лидера
+    """
+    dcf = create_dataclass_factory()
+    file_storage = create_file_storage(config.file_storage_config)
+    pool = create_pool(config.db)
+    bot = create_bot(config)
+    setup_jinja(bot=bot)
+    redis = create_redis(config.redis)
+    level_test_dao = create_level_test_dao(redis)
+
+    async with (
+        UserGetter(config.tg_client) as user_getter,
+        redis,
+        create_scheduler(
+            pool=pool,
+            redis=redis,
+            bot=bot,
+            redis_config=config.redis,
+            game_log_chat=config.bot.log_chat,
+            file_storage=file_storage,
+            level_test_dao=level_test_dao,
+        ) as scheduler,
+    ):
+        dp = create_dispatcher(
+            config=config,
+            user_getter=user_getter,
+            dcf=dcf,
+            pool=pool,
+            redis=redis,
+            scheduler=scheduler,
+            locker=create_lock_factory(redis if is_multiprocess(config) else None),
+            file_storage=file_storage,
+            level_test_dao=level_test_dao,
+            telegraph=create_telegraph(config.bot),
+        )
+        scheduler.run_while_leader(LiveSpyUpdater(bot=bot, redis=redis).run)
+        try:
+            yield dp, bot
+        finally:
+            close_all_sessions()
+            await bot.session.close()
+            await redis.close()
+
+
 def create_dispatcher(
     config: TgBotConfig,
     user_getter: UserGetter,
@@ -42,7 +107,7 @@ def create_dispatcher(
     scheduler: Scheduler,
     locker: KeyCheckerFactory,
     file_storage: FileStorage,
-    level_test_dao: LevelTestingData,
+    level_test_dao: LevelTestStorage,
     telegraph: Telegraph,
 ) -> Dispatcher:
     dp = create_only_dispatcher(config, redis)
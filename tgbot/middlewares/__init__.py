@@ -3,7 +3,7 @@ from dataclass_factory import Factory
 from redis.asyncio.client import Redis
 from sqlalchemy.orm import sessionmaker
 
-from infrastructure.db.dao.memory.level_testing import LevelTestingData
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
 from shvatka.interfaces.clients.file_storage import FileStorage
 from shvatka.interfaces.scheduler import Scheduler
 from shvatka.utils.key_checker_lock import KeyCheckerFactory
@@ -27,7 +27,7 @@ def setup_middlewares(
     scheduler: Scheduler,
     locker: KeyCheckerFactory,
     file_storage: FileStorage,
-    level_test_dao: LevelTestingData,
+    level_test_dao: LevelTestStorage,
     telegraph: Telegraph,
 ):
     dp.update.middleware(ConfigMiddleware(bot_config))
@@ -42,6 +42,8 @@ def setup_middlewares(
             file_storage=file_storage,
             level_test_dao=level_test_dao,
             telegraph=telegraph,
+            org_digest_window=bot_config.org_digest_window,
+            key_verdicts_window=bot_config.key_verdicts_window,
         )
     )
     dp.update.middleware(LoadDataMiddleware())
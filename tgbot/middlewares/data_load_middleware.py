@@ -26,7 +26,9 @@ class LoadDataMiddleware(BaseMiddleware):
         chat = await save_chat(data, holder_dao)
         data["chat"] = chat
         data["team"] = await load_team(chat, holder_dao)
-        data["game"] = await get_active(holder_dao.game)
+        data["game"] = await get_active(
+            holder_dao.active_game_router, team=data["team"], player=data["player"]
+        )
         result = await handler(event, data)
         return result
 
@@ -8,12 +8,16 @@ from sqlalchemy.orm import sessionmaker
 
 from infrastructure.clients.file_gateway import BotFileGateway
 from infrastructure.db.dao.holder import HolderDao
-from infrastructure.db.dao.memory.level_testing import LevelTestingData
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
+from infrastructure.db.dao.redis.orgs_cache import OrgsCache
 from shvatka.interfaces.clients.file_storage import FileStorage
 from shvatka.interfaces.scheduler import Scheduler
 from shvatka.utils.key_checker_lock import KeyCheckerFactory
+from tgbot.services.waiver_poll import WaiverPollRenderer
 from tgbot.username_resolver.user_getter import UserGetter
 from tgbot.views.hint_factory.hint_parser import HintParser
+from tgbot.views.key_verdicts import KeyVerdictCoalescer
+from tgbot.views.org_digest import LevelUpDigest
 from tgbot.views.telegraph import Telegraph
 
 
@@ -27,8 +31,10 @@ class InitMiddleware(BaseMiddleware):
         scheduler: Scheduler,
         locker: KeyCheckerFactory,
         file_storage: FileStorage,
-        level_test_dao: LevelTestingData,
+        level_test_dao: LevelTestStorage,
         telegraph: Telegraph,
+        org_digest_window: float | None = None,
+        key_verdicts_window: float | None = None,
     ):
         self.pool = pool
         self.user_getter = user_getter
@@ -39,6 +45,14 @@ class InitMiddleware(BaseMiddleware):
         self.file_storage = file_storage
         self.level_test_dao = level_test_dao
         self.telegraph = telegraph
+        self.waiver_poll = WaiverPollRenderer(
+            pool=pool, redis=redis, level_test_dao=level_test_dao
+        )
+        self.orgs_cache = OrgsCache(redis=redis)
+        self.org_digest = LevelUpDigest(org_digest_window) if org_digest_window else None
+        self.key_verdicts = (
+            KeyVerdictCoalescer(key_verdicts_window) if key_verdicts_window else None
+        )
 
     async def __call__(
         self,
@@ -52,8 +66,11 @@ class InitMiddleware(BaseMiddleware):
         data["locker"] = self.locker
         data["file_storage"] = self.file_storage
         data["telegraph"] = self.telegraph
+        data["waiver_poll"] = self.waiver_poll
+        data["org_digest"] = self.org_digest
+        data["key_verdicts"] = self.key_verdicts
         async with self.pool() as session:
-            holder_dao = HolderDao(session, self.redis, self.level_test_dao)
+            holder_dao = HolderDao(session, self.redis, self.level_test_dao, self.orgs_cache)
             data["dao"] = holder_dao
             data["hint_parser"] = HintParser(
                 dao=holder_dao.file_info,
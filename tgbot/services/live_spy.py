@@ -0,0 +1,129 @@
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+from aiogram.utils.text_decorations import html_decoration as hd
+from redis.asyncio.client import Redis
+
+from infrastructure.db.dao import GameEventsStream, LiveSpyMessages
+from shvatka.models import dto
+from shvatka.models.enums import GameEventType
+from tgbot.views.jinja_filters.timezone import datetime_filter
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL = 10
+
+
+@dataclass
+class TeamLiveProgress:
+    team_name: str
+    level_number: int
+    level_started_at: datetime
+    correct_keys: int = 0
+    hints: int = 0
+    is_finished: bool = False
+
+
+@dataclass
+class LiveSpyState:
+    """Состояние игры, собранное только по ленте событий, без запросов в бд"""
+
+    last_id: str = "0"
+    teams: dict[int, TeamLiveProgress] = field(default_factory=dict)
+    rendered: dict[int, int] = field(default_factory=dict)
+    is_game_finished: bool = False
+
+    def apply(self, event: dto.GameEvent) -> None:
+        match event.type:
+            case GameEventType.level_up | GameEventType.team_finished:
+                self.teams[event.team_id] = TeamLiveProgress(
+                    team_name=event.team_name,
+                    level_number=event.level_number,
+                    level_started_at=event.at,
+                    is_finished=event.type == GameEventType.team_finished,
+                )
+            case GameEventType.correct_key:
+                if progress := self.teams.get(event.team_id):
+                    progress.correct_keys += 1
+            case GameEventType.hint:
+                if progress := self.teams.get(event.team_id):
+                    progress.hints = max(progress.hints, event.hint_number or 0)
+            case GameEventType.game_finished:
+                self.is_game_finished = True
+
+    @property
+    def is_all_finished(self) -> bool:
+        return bool(self.teams) and all(p.is_finished for p in self.teams.values())
+
+
+class LiveSpyUpdater:
+    """
+    Для каждой игры, на которую подписан хоть один орг,
+    читает ленту событий и раз в REFRESH_INTERVAL секунд редактирует сообщения оргов.
+    """
+
+    def __init__(self, bot: Bot, redis: Redis, interval: float = REFRESH_INTERVAL):
+        self.bot = bot
+        self.events = GameEventsStream(redis=redis)
+        self.messages = LiveSpyMessages(redis=redis)
+        self.interval = interval
+        self.states: dict[int, LiveSpyState] = {}
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.exception("can't refresh live spy", exc_info=e)
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self) -> None:
+        for game_id in await self.messages.get_games():
+            await self.refresh_game(game_id)
+
+    async def refresh_game(self, game_id: int) -> None:
+        state = self.states.setdefault(game_id, LiveSpyState())
+        changed = False
+        while events := await self.events.read(game_id, last_id=state.last_id):
+            for id_, event in events:
+                state.apply(event)
+                state.last_id = id_
+            changed = True
+        messages = await self.messages.get_messages(game_id)
+        text = render_live_spy(state)
+        for chat_id, message_id in messages.items():
+            if not changed and state.rendered.get(chat_id) == message_id:
+                continue
+            with suppress(TelegramAPIError):
+                await self.bot.edit_message_text(text=text, chat_id=chat_id, message_id=message_id)
+            state.rendered[chat_id] = message_id
+        if state.is_game_finished or state.is_all_finished:
+            logger.info("game %s finished, live spy stopped", game_id)
+            await self.messages.unsubscribe_game(game_id)
+            self.states.pop(game_id)
+
+
+def render_live_spy(state: LiveSpyState) -> str:
+    if not state.teams:
+        return "Живой шпион: игра ещё не началась"
+    lines = ["Живой шпион:"]
+    for progress in sorted(
+        state.teams.values(), key=lambda p: (-p.level_number, p.level_started_at)
+    ):
+        if progress.is_finished:
+            lines.append(
+                f"<b>{hd.quote(progress.team_name)}</b> - финишировала в "
+                f"{datetime_filter(progress.level_started_at)}"
+            )
+        else:
+            lines.append(
+                f"<b>{hd.quote(progress.team_name)}</b> - уровень {progress.level_number + 1} "
+                f"начат {datetime_filter(progress.level_started_at)}, "
+                f"ключей: {progress.correct_keys}, подсказок: {progress.hints}"
+            )
+    return "\n".join(lines)
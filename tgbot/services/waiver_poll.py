@@ -0,0 +1,100 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+from redis.asyncio.client import Redis
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.db.dao.holder import HolderDao
+from infrastructure.db.dao.redis.level_testing import LevelTestStorage
+from shvatka.interfaces.dal.waiver import WaiverVoteGetter
+from shvatka.models import dto
+from shvatka.models.enums.played import Played
+from tgbot import keyboards as kb
+from tgbot.utils.debounce import Debouncer
+from tgbot.views.waiver import get_waiver_poll_text
+
+logger = logging.getLogger(__name__)
+
+RENDER_WINDOW = 3.0
+PLAYERS_CACHE_TTL = 600.0
+
+
+@dataclass
+class CachedVoteGetter(WaiverVoteGetter):
+    """голоса читаются из redis каждый раз, а игроки с ролями - из кэша, в бд только новые"""
+
+    dao: WaiverVoteGetter
+    players: dict[int, dto.VotedPlayer]
+
+    async def get_dict_player_vote(self, game_id: int, team_id: int) -> dict[int, Played]:
+        return await self.dao.get_dict_player_vote(game_id, team_id)
+
+    async def get_by_ids_with_user_and_pit(self, ids: Iterable[int]) -> list[dto.VotedPlayer]:
+        ids = list(ids)
+        if missed := [id_ for id_ in ids if id_ not in self.players]:
+            for voted in await self.dao.get_by_ids_with_user_and_pit(missed):
+                self.players[voted.player.id] = voted
+        return [self.players[id_] for id_ in ids if id_ in self.players]
+
+
+RenderArgs = tuple[Bot, dto.Team, dto.Game, int, int]
+
+
+class WaiverPollRenderer(Debouncer[tuple[int, int], RenderArgs]):
+    """
+    Перерисовка сообщения с опросом вейверов не чаще раза в window секунд на (игра, команда).
+    Первый голос в окне планирует правку, остальные голоса окна попадают в неё же:
+    текст собирается в момент правки и отражает последнее состояние опроса.
+    """
+
+    def __init__(
+        self,
+        pool: sessionmaker,
+        redis: Redis,
+        level_test_dao: LevelTestStorage,
+        window: float = RENDER_WINDOW,
+    ):
+        super().__init__(window)
+        self.pool = pool
+        self.redis = redis
+        self.level_test_dao = level_test_dao
+        self.players: dict[tuple[int, int], tuple[float, dict[int, dto.VotedPlayer]]] = {}
+
+    def schedule(self, bot: Bot, team: dto.Team, game: dto.Game, chat_id: int, msg_id: int):
+        self.push((game.id, team.id), (bot, team, game, chat_id, msg_id))
+
+    def get_players_cache(self, game: dto.Game, team: dto.Team) -> dict[int, dto.VotedPlayer]:
+        key = (game.id, team.id)
+        created_at, players = self.players.get(key, (0.0, {}))
+        if time.monotonic() - created_at > PLAYERS_CACHE_TTL:
+            players = {}
+            self.players[key] = (time.monotonic(), players)
+        return players
+
+    def reset(self, game: dto.Game, team: dto.Team) -> None:
+        self.players.pop((game.id, team.id), None)
+
+    async def flush_items(self, key: tuple[int, int], items: list[RenderArgs]) -> None:
+        try:
+            await self.render(*items[-1])
+        except TelegramAPIError as e:
+            logger.warning("can't edit waiver poll %s: %s", key, e)
+
+    async def render(self, bot: Bot, team: dto.Team, game: dto.Game, chat_id: int, msg_id: int):
+        async with self.pool() as session:
+            dao = HolderDao(session, self.redis, self.level_test_dao)
+            getter = CachedVoteGetter(
+                dao=dao.waiver_vote_getter, players=self.get_players_cache(game, team)
+            )
+            text = await get_waiver_poll_text(team, game, getter)
+        await bot.edit_message_text(
+            text=text,
+            chat_id=chat_id,
+            message_id=msg_id,
+            reply_markup=kb.get_kb_waivers(team),
+            disable_web_page_preview=True,
+        )
@@ -79,3 +79,4 @@ class CaptainsBridgeSG(StatesGroup):
 class CompletedGamesPanelSG(StatesGroup):
     list = State()
     game = State()
+    replay = State()
@@ -0,0 +1,52 @@
+import asyncio
+import logging
+from typing import Generic, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class Debouncer(Generic[K, T]):
+    """
+    Копит элементы по ключу (чат, команда) и через window секунд после первого
+    отдаёт всю пачку в flush_items одним вызовом.
+    Элемент, пришедший во время flush_items, попадает уже в следующую пачку
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self.pending: dict[K, list[T]] = {}
+        self.tasks: dict[K, asyncio.Task] = {}
+
+    def push(self, key: K, item: T) -> None:
+        self.pending.setdefault(key, []).append(item)
+        if key not in self.tasks:
+            self.tasks[key] = asyncio.create_task(self._flush_later(key))
+
+    async def flush(self, key: K) -> None:
+        """отдаёт накопленное сразу, не дожидаясь конца окна"""
+        if task := self.tasks.pop(key, None):
+            task.cancel()
+        await self._flush(key)
+
+    async def flush_items(self, key: K, items: list[T]) -> None:
+        raise NotImplementedError
+
+    async def _flush_later(self, key: K) -> None:
+        try:
+            await asyncio.sleep(self.window)
+        finally:
+            if self.tasks.get(key) is asyncio.current_task():
+                del self.tasks[key]
+        await self._flush(key)
+
+    async def _flush(self, key: K) -> None:
+        items = self.pending.pop(key, [])
+        if not items:
+            return
+        try:
+            await self.flush_items(key, items)
+        except Exception as e:
+            logger.exception("%s can't flush %s", type(self).__name__, key, exc_info=e)
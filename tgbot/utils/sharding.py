@@ -0,0 +1,38 @@
+import bisect
+import hashlib
+from typing import Any
+
+RING_REPLICAS = 100
+
+
+class HashRing:
+    """при изменении числа воркеров переезжает только ~1/n чатов"""
+
+    def __init__(self, nodes: int, replicas: int = RING_REPLICAS):
+        points = sorted(
+            (_hash(f"{node}:{replica}"), node)
+            for node in range(nodes)
+            for replica in range(replicas)
+        )
+        self.hashes = [h for h, _ in points]
+        self.nodes = [node for _, node in points]
+
+    def get_node(self, key: int) -> int:
+        index = bisect.bisect(self.hashes, _hash(str(key))) % len(self.hashes)
+        return self.nodes[index]
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def get_chat_id(update: dict[str, Any]) -> int:
+    """чат апдейта, а для апдейтов без чата (inline, poll_answer) - пользователь"""
+    for key, event in update.items():
+        if key == "update_id" or not isinstance(event, dict):
+            continue
+        if chat := event.get("chat") or (event.get("message") or {}).get("chat"):
+            return chat["id"]
+        if user := event.get("from") or event.get("user"):
+            return user["id"]
+    return 0
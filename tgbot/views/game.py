@@ -1,16 +1,15 @@
 import logging
-from contextlib import suppress
 from dataclasses import dataclass
-from typing import Iterable, cast
+from typing import Iterable, cast, Callable, Awaitable, Any
 
 from aiogram import Bot
-from aiogram.exceptions import TelegramAPIError
 from aiogram.utils.markdown import html_decoration as hd
 
 from infrastructure.db.dao.holder import HolderDao
 from shvatka.interfaces.clients.file_storage import FileStorage
 from shvatka.interfaces.dal.game_play import GamePreparer
 from shvatka.models import dto
+from shvatka.utils.concurrency import fan_out
 from shvatka.views.game import (
     GameViewPreparer,
     GameView,
@@ -22,6 +21,8 @@ from shvatka.views.game import (
     LevelTestCompleted,
 )
 from tgbot.views.hint_sender import HintSender, create_hint_sender
+from tgbot.views.key_verdicts import KeyVerdictCoalescer
+from tgbot.views.org_digest import LevelUpDigest, render_level_up
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ logger = logging.getLogger(__name__)
 class BotView(GameViewPreparer, GameView):
     bot: Bot
     hint_sender: HintSender
+    verdicts: KeyVerdictCoalescer | None = None
 
     async def prepare_game_view(
         self,
@@ -39,17 +41,23 @@ class BotView(GameViewPreparer, GameView):
         dao: GamePreparer,
     ) -> None:
         # TODO set bot commands for orgs, hide bot commands for players
-        for team in teams:
-            try:
-                await self.bot.edit_message_reply_markup(
-                    chat_id=team.chat.tg_id,
-                    message_id=await dao.get_poll_msg(team=team, game=game),
-                    reply_markup=None,
-                )
-            except TelegramAPIError as e:
-                logger.error("can't remove waivers keyboard for team %s", team.id, exc_info=e)
+        async def remove_keyboard(team: dto.Team):
+            await self.bot.edit_message_reply_markup(
+                chat_id=team.chat.tg_id,
+                message_id=await dao.get_poll_msg(team=team, game=game),
+                reply_markup=None,
+            )
+
+        await fan_out(
+            teams,
+            remove_keyboard,
+            name=f"game {game.id} remove waivers keyboard",
+            key=lambda team: team.id,
+        )
 
     async def send_puzzle(self, team: dto.Team, level: dto.Level) -> None:
+        if self.verdicts is not None:
+            await self.verdicts.flush(team.chat.tg_id)
         await self.hint_sender.send_hints(
             chat_id=team.chat.tg_id,
             hint_containers=level.get_hint(0).hint,
@@ -69,21 +77,23 @@ class BotView(GameViewPreparer, GameView):
         )
 
     async def duplicate_key(self, key: dto.KeyTime) -> None:
-        await self.bot.send_message(
-            chat_id=key.team.chat.tg_id, text=f"Ключ {hd.pre(key.text)} уже был введён ранее."
-        )
+        await self.send_verdict(key, f"Ключ {hd.pre(key.text)} уже был введён ранее.")
 
     async def correct_key(self, key: dto.KeyTime) -> None:
-        await self.bot.send_message(
-            chat_id=key.team.chat.tg_id, text=f"Ключ {hd.pre(key.text)} верный! Поздравляю!"
-        )
+        await self.send_verdict(key, f"Ключ {hd.pre(key.text)} верный! Поздравляю!")
 
     async def wrong_key(self, key: dto.KeyTime) -> None:
-        await self.bot.send_message(
-            chat_id=key.team.chat.tg_id, text=f"Ключ {hd.pre(key.text)} неверный."
-        )
+        await self.send_verdict(key, f"Ключ {hd.pre(key.text)} неверный.")
+
+    async def send_verdict(self, key: dto.KeyTime, text: str) -> None:
+        if self.verdicts is not None:
+            self.verdicts.add(self.bot, key.team.chat.tg_id, text)
+        else:
+            await self.bot.send_message(chat_id=key.team.chat.tg_id, text=text)
 
     async def game_finished(self, team: dto.Team) -> None:
+        if self.verdicts is not None:
+            await self.verdicts.flush(team.chat.tg_id)
         await self.bot.send_message(chat_id=team.chat.tg_id, text=f"Игра завершена! Поздравляю!")
 
     async def game_finished_by_all(self, team: dto.Team) -> None:
@@ -103,29 +113,33 @@ class GameBotLog(GameLogWriter):
 @dataclass
 class BotOrgNotifier(OrgNotifier):
     bot: Bot
+    digest: LevelUpDigest | None = None
 
     async def notify(self, event: Event) -> None:
         match event:
             case LevelUp():
-                for org in event.orgs_list:
-                    with suppress(TelegramAPIError):
-                        await self.notify_level_up(cast(LevelUp, event), org)
+                level_up = cast(LevelUp, event)
+                if self.digest is not None:
+                    self.digest.add(self.bot, level_up)
+                    return
+                await self.fan_out(event, lambda org: self.notify_level_up(level_up, org))
             case NewOrg():
-                for org in event.orgs_list:
-                    with suppress(TelegramAPIError):
-                        await self.notify_new_org(cast(NewOrg, event), org)
+                new_org = cast(NewOrg, event)
+                await self.fan_out(event, lambda org: self.notify_new_org(new_org, org))
             case LevelTestCompleted():
-                for org in event.orgs_list:
-                    with suppress(TelegramAPIError):
-                        await self.level_test_completed(cast(LevelTestCompleted, event), org)
+                completed = cast(LevelTestCompleted, event)
+                await self.fan_out(event, lambda org: self.level_test_completed(completed, org))
+
+    async def fan_out(self, event: Event, send: Callable[[dto.Organizer], Awaitable[Any]]) -> None:
+        await fan_out(
+            event.orgs_list,
+            send,
+            name=f"notify orgs about {type(event).__name__}",
+            key=lambda org: org.player.id,
+        )
 
     async def notify_level_up(self, level_up: LevelUp, org: dto.Organizer):
-        await self.bot.send_message(
-            chat_id=org.player.user.tg_id,
-            text=f"Команда {hd.quote(level_up.team.name)} перешла "
-            f"на уровень {level_up.new_level.number_in_game} "
-            f"({level_up.new_level.name_id})",
-        )
+        await self.bot.send_message(chat_id=org.player.user.tg_id, text=render_level_up(level_up))
 
     async def notify_new_org(self, new_org: NewOrg, org: dto.Organizer):
         await self.bot.send_message(
@@ -144,8 +158,14 @@ class BotOrgNotifier(OrgNotifier):
         )
 
 
-def create_bot_game_view(bot: Bot, dao: HolderDao, storage: FileStorage) -> BotView:
+def create_bot_game_view(
+    bot: Bot,
+    dao: HolderDao,
+    storage: FileStorage,
+    verdicts: KeyVerdictCoalescer | None = None,
+) -> BotView:
     return BotView(
         bot=bot,
         hint_sender=create_hint_sender(bot=bot, dao=dao, storage=storage),
+        verdicts=verdicts,
     )
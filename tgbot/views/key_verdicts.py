@@ -0,0 +1,29 @@
+import logging
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+
+from tgbot.utils.debounce import Debouncer
+from tgbot.views.utils import split_lines
+
+logger = logging.getLogger(__name__)
+
+
+class KeyVerdictCoalescer(Debouncer[int, tuple[Bot, str]]):
+    """
+    Копит ответы на ключи (верный/неверный/повтор) по чату команды
+    и раз в window секунд отправляет их одним сообщением.
+    Перед загадкой нового уровня накопленное отправляется сразу (flush),
+    чтобы ответ на ключ не пришёл после загадки
+    """
+
+    def add(self, bot: Bot, chat_id: int, text: str) -> None:
+        self.push(chat_id, (bot, text))
+
+    async def flush_items(self, chat_id: int, items: list[tuple[Bot, str]]) -> None:
+        bot = items[-1][0]
+        for text in split_lines(text for _, text in items):
+            try:
+                await bot.send_message(chat_id=chat_id, text=text)
+            except TelegramAPIError as e:
+                logger.error("can't send key verdicts to chat %s", chat_id, exc_info=e)
@@ -1,10 +1,20 @@
+import asyncio
 import enum
+import typing
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import groupby
 
 from aiogram.utils.text_decorations import html_decoration as hd
 
 from shvatka.models import dto
 from shvatka.utils.datetime_utils import tz_game, DATETIME_FORMAT
+from tgbot.views.telegraph import Telegraph
+
+# телеграф хранит страницу как json из нод и не принимает больше 64КБ,
+# html на странице лога ключей раздувается при конвертации примерно вдвое
+TELEGRAPH_PAGE_BUDGET = 30_000
+TELEGRAPH_CONCURRENCY = 5
 
 
 class KeyEmoji(enum.Enum):
@@ -13,25 +23,125 @@ class KeyEmoji(enum.Enum):
     duplicate = "💤"
 
 
+@dataclass
+class KeysPage:
+    title: str
+    html: str
+
+
 def render_log_keys(log_keys: dict[dto.Team, list[dto.KeyTime]]) -> str:
-    text = f"Лог ключей на {datetime.now(tz=tz_game).strftime(DATETIME_FORMAT)}:<br/>"
+    parts = [render_header()]
+    for team, keys in log_keys.items():
+        parts.append(f"<hr/>{hd.quote(team.name)}:")
+        for i, (level_number, items) in enumerate(iter_levels(keys)):
+            if i > 0:
+                parts.append("<br/>")
+            parts.append(f"Уровень №{level_number + 1}<br/><ol>")
+            parts.extend(items)
+            parts.append("</ol>")
+    return "".join(parts)
+
+
+def render_log_keys_pages(
+    log_keys: dict[dto.Team, list[dto.KeyTime]],
+    title: str,
+    budget: int = TELEGRAPH_PAGE_BUDGET,
+) -> list[KeysPage]:
+    """Страница (или несколько, если не влезает в budget) на каждую команду"""
+    pages = []
     for team, keys in log_keys.items():
-        text += f"<hr/>{hd.quote(team.name)}:"
-        n_level = keys[0].level_number - 1
-        for i, key in enumerate(keys):
-            if n_level < key.level_number:
-                # keys are sorted, so is previous and next level not equals - add caption
-                n_level = key.level_number
-                if i > 0:
-                    text += "</ol><br/>"
-                text += f"Уровень №{n_level + 1}<br/><ol>"
-            text += (
-                f"<li>{to_emoji(key).value}{hd.quote(key.text)} "
-                f"{key.at.astimezone(tz=tz_game).time()} "
-                f"{key.player.user.name_mention}</li>"
-            )
-        text += "</ol>"
-    return text
+        team_pages = paginate_team_keys(team, keys, budget)
+        for i, html in enumerate(team_pages, 1):
+            page_title = f"{title}. {team.name}"
+            if len(team_pages) > 1:
+                page_title += f" ({i}/{len(team_pages)})"
+            pages.append(KeysPage(title=page_title, html=html))
+    return pages
+
+
+def paginate_team_keys(team: dto.Team, keys: list[dto.KeyTime], budget: int) -> list[str]:
+    pages: list[str] = []
+    parts: list[str] = []
+    size = 0
+    team_caption = f"{hd.quote(team.name)}:<br/>"
+    close = "</ol>"
+
+    def append(text: str):
+        nonlocal size
+        parts.append(text)
+        size += len(text)
+
+    def close_page():
+        nonlocal size
+        append(close)
+        pages.append("".join(parts))
+        parts.clear()
+        size = 0
+
+    for level_number, items in iter_levels(keys):
+        caption = f"Уровень №{level_number + 1}"
+        for i, item in enumerate(items):
+            if i == 0:
+                opening = f"{close}<br/>{caption}<br/><ol>"
+                if parts and size + len(opening) + len(item) + len(close) > budget:
+                    close_page()
+                if parts:
+                    append(opening)
+                else:
+                    append(f"{team_caption}{caption}<br/><ol>")
+            elif size + len(item) + len(close) > budget:
+                close_page()
+                append(f"{team_caption}{caption} (продолжение)<br/><ol>")
+            append(item)
+    if parts:
+        close_page()
+    return pages
+
+
+def iter_levels(keys: list[dto.KeyTime]) -> typing.Iterator[tuple[int, list[str]]]:
+    """keys are sorted by level, so group neighbours"""
+    for level_number, level_keys in groupby(keys, key=lambda k: k.level_number):
+        yield level_number, [render_key(key) for key in level_keys]
+
+
+def render_key(key: dto.KeyTime) -> str:
+    return (
+        f"<li>{to_emoji(key).value}{hd.quote(key.text)} "
+        f"{key.at.astimezone(tz=tz_game).time()} "
+        f"{hd.quote(key.player.user.name_mention)}</li>"
+    )
+
+
+def render_header() -> str:
+    return f"Лог ключей на {datetime.now(tz=tz_game).strftime(DATETIME_FORMAT)}:<br/>"
+
+
+async def publish_log_keys(
+    telegraph: Telegraph, title: str, log_keys: dict[dto.Team, list[dto.KeyTime]]
+) -> str:
+    """
+    Маленький лог публикуется одной страницей.
+    Большой - страницами по командам (создаются параллельно) и страницей-оглавлением.
+    :return: url страницы, которую надо показать
+    """
+    text = render_log_keys(log_keys)
+    if len(text) <= TELEGRAPH_PAGE_BUDGET:
+        page = await telegraph.create_page(title=title, html_content=text)
+        return page["url"]
+    pages = render_log_keys_pages(log_keys, title)
+    semaphore = asyncio.Semaphore(TELEGRAPH_CONCURRENCY)
+
+    async def create(page: KeysPage) -> dict:
+        async with semaphore:
+            return await telegraph.create_page(title=page.title, html_content=page.html)
+
+    created = await asyncio.gather(*(create(page) for page in pages))
+    index = [render_header(), "<ul>"]
+    for page, created_page in zip(pages, created):
+        index.append(f'<li><a href="{created_page["url"]}">{hd.quote(page.title)}</a></li>')
+    index.append("</ul>")
+    index_page = await telegraph.create_page(title=title, html_content="".join(index))
+    return index_page["url"]
 
 
 def to_emoji(key: dto.KeyTime) -> KeyEmoji:
@@ -0,0 +1,51 @@
+import logging
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+from aiogram.utils.markdown import html_decoration as hd
+
+from shvatka.views.game import LevelUp
+from tgbot.utils.debounce import Debouncer
+from tgbot.views.utils import split_lines
+
+logger = logging.getLogger(__name__)
+
+
+def render_level_up(level_up: LevelUp) -> str:
+    return (
+        f"Команда {hd.quote(level_up.team.name)} перешла "
+        f"на уровень {level_up.new_level.number_in_game} "
+        f"({level_up.new_level.name_id})"
+    )
+
+
+def render_level_up_digest(level_ups: list[LevelUp]) -> list[str]:
+    """:return: тексты сообщений, каждый не длиннее лимита telegram"""
+    if len(level_ups) == 1:
+        return [render_level_up(level_ups[0])]
+    lines = [f"Переходы на уровни ({len(level_ups)}):"]
+    lines.extend(
+        f"{hd.quote(level_up.team.name)} → {level_up.new_level.number_in_game} "
+        f"({level_up.new_level.name_id})"
+        for level_up in level_ups
+    )
+    return split_lines(lines)
+
+
+class LevelUpDigest(Debouncer[int, tuple[Bot, LevelUp]]):
+    """
+    Копит переходы команд на уровни и раз в window секунд отправляет
+    каждому оргу одно сводное сообщение вместо отдельного на каждый переход
+    """
+
+    def add(self, bot: Bot, level_up: LevelUp) -> None:
+        for org in level_up.orgs_list:
+            self.push(org.player.user.tg_id, (bot, level_up))
+
+    async def flush_items(self, chat_id: int, items: list[tuple[Bot, LevelUp]]) -> None:
+        bot = items[-1][0]
+        for text in render_level_up_digest([level_up for _, level_up in items]):
+            try:
+                await bot.send_message(chat_id=chat_id, text=text)
+            except TelegramAPIError as e:
+                logger.error("can't send level up digest to %s", chat_id, exc_info=e)
@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from openpyxl import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.cell import WriteOnlyCell, Cell
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 
 from shvatka.models import dto
 from shvatka.utils.datetime_utils import tz_game
@@ -19,7 +21,6 @@ class CellAddress:
         return dict(row=self.row + plus_rows, column=self.column + plus_columns)
 
 
-FIRST_TEAM_NAME = CellAddress(1, 3)
 GAME_NAME = CellAddress(1, 1)
 
 
@@ -51,29 +52,51 @@ def to_array_results(game_stat: dto.GameStat) -> list[TeamLevelsTimes]:
 def export_results_internal(game: dto.FullGame, data: list[TeamLevelsTimes], file: typing.Any):
     if not (game.is_complete() or game.is_finished()):
         raise GameNotFinished
-    wb = Workbook()
-    ws = wb.active
-    ws.cell(**GAME_NAME.shift()).value = game.name
-    for i, team_level_times in enumerate(data):
-        cell = ws.cell(**FIRST_TEAM_NAME.shift(i, 0))
-        cell.value = team_level_times.team.name
-
-        for j, level_time in enumerate(team_level_times.levels_times, 1):
-            if i == 0:
-                ws.cell(**FIRST_TEAM_NAME.shift(-1, j)).value = level_time.level
-
-            cell = ws.cell(**FIRST_TEAM_NAME.shift(i, j))
-            cell.value = level_time.time
-            cell.number_format = DATETIME_EXCEL_FORMAT
-
-    resize_columns(ws)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    widths: dict[int, int] = {}
+    rows = [list(row) for row in iter_rows(ws, game, data, widths)]
+    # в write-only режиме ширины колонок пишутся в файл до первой строки
+    for column, width in widths.items():
+        ws.column_dimensions[get_column_letter(column)].width = width
+    for row in rows:
+        ws.append(row)
     wb.save(file)
 
 
-def resize_columns(worksheet: Worksheet):
-    for col in worksheet.columns:
-        new_len = max([2, *[len(str(cell.value or "")) for cell in col]])
-        worksheet.column_dimensions[col[0].column_letter].width = new_len
+def iter_rows(
+    ws: WriteOnlyWorksheet,
+    game: dto.FullGame,
+    data: list[TeamLevelsTimes],
+    widths: dict[int, int],
+) -> typing.Iterator[typing.Iterator[typing.Any]]:
+    """строки таблицы результатов, попутно считает ширины колонок"""
+
+    def measured(values: list[typing.Any]) -> typing.Iterator[typing.Any]:
+        for column, value in enumerate(values, GAME_NAME.column):
+            if isinstance(value, Cell):
+                value_len = len(str(value.value or ""))
+            else:
+                value_len = len(str(value or ""))
+            widths[column] = max(widths.get(column, 2), value_len)
+            yield value
+
+    yield measured([game.name])
+    if data:
+        yield measured([None, *(lt.level for lt in data[0].levels_times)])
+    for team_level_times in data:
+        yield measured(
+            [
+                team_level_times.team.name,
+                *(time_cell(ws, lt.time) for lt in team_level_times.levels_times),
+            ]
+        )
+
+
+def time_cell(ws: WriteOnlyWorksheet, value: datetime) -> Cell:
+    cell = WriteOnlyCell(ws, value=value)
+    cell.number_format = DATETIME_EXCEL_FORMAT
+    return cell
 
 
 def trim_tz(dt: datetime) -> datetime:
@@ -13,7 +13,7 @@ from shvatka.models import dto
 from shvatka.utils.datetime_utils import DATE_FORMAT
 from tgbot.config.models.bot import BotConfig
 from tgbot.views.hint_sender import HintSender
-from tgbot.views.keys import render_log_keys
+from tgbot.views.keys import publish_log_keys
 from tgbot.views.results.level_times import export_results
 
 
@@ -69,14 +69,14 @@ class GamePublisher:
         return msg.message_id
 
     async def publish_keys(self) -> int:
-        text = render_log_keys(self.keys)
-        page = await self.telegraph.create_page(
+        url = await publish_log_keys(
+            telegraph=self.telegraph,
             title=f"Лог ключей игры {self.game.name}",
-            html_content=text,
+            log_keys=self.keys,
         )
         msg = await self.bot.send_message(
             chat_id=self.channel_id,
-            text=hd.link("Лог ключей игры", page["url"]),
+            text=hd.link("Лог ключей игры", url),
         )
         return msg.message_id
 
@@ -1,4 +1,5 @@
 from contextlib import suppress
+from typing import Iterable
 
 from aiogram import Bot
 from aiogram.exceptions import AiogramError
@@ -9,6 +10,35 @@ from shvatka.models.enums.hint_type import HintType
 from shvatka.views.texts import HINTS_EMOJI
 
 
+MAX_MESSAGE_LENGTH = 4096
+
+
+def split_lines(lines: Iterable[str], limit: int = MAX_MESSAGE_LENGTH) -> list[str]:
+    """
+    Склеивает строки через перенос в тексты не длиннее limit (ограничение telegram).
+    Строка длиннее limit режется на куски
+    """
+    chunks: list[str] = []
+    current = ""
+    for line in lines:
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        if not current:
+            current = line
+        elif len(current) + 1 + len(line) <= limit:
+            current += "\n" + line
+        else:
+            chunks.append(current)
+            current = line
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 async def total_remove_msg(
     bot: Bot, chat_id: int = None, msg_id: int = None, inline_msg_id: int = None
 ):
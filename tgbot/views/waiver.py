@@ -3,6 +3,7 @@ from typing import Iterable
 from aiogram.utils.text_decorations import html_decoration as hd
 
 from infrastructure.db.dao.holder import HolderDao
+from shvatka.interfaces.dal.waiver import WaiverVoteGetter
 from shvatka.models import dto
 from shvatka.models.enums.played import Played
 from shvatka.services.waiver import get_vote_to_voted
@@ -36,25 +37,25 @@ def render_players(users: Iterable[dto.VotedPlayer]) -> str:
     )
 
 
-async def get_waiver_poll_text(team: dto.Team, game: dto.Game, dao: HolderDao):
-    return f"Сбор вейверов на игру:\n{hd.bold(hd.quote(game.name))}\n\n{await get_list_pool(team, dao)}"
+async def get_waiver_poll_text(team: dto.Team, game: dto.Game, dao: WaiverVoteGetter):
+    return f"Сбор вейверов на игру:\n{hd.bold(hd.quote(game.name))}\n\n{await get_list_pool(team, game, dao)}"
 
 
-async def get_waiver_final_text(team: dto.Team, game: dto.Game, dao: HolderDao):
+async def get_waiver_final_text(team: dto.Team, game: dto.Game, dao: WaiverVoteGetter):
     return (
         f"Сбор вейверов на игру {hd.bold(hd.quote(game.name))} окончен. \n"
         f"Итоговый список:\n\n"
-        f"{await get_list_pool(team, dao)}"
+        f"{await get_list_pool(team, game, dao)}"
     )
 
 
-async def get_list_pool(team: dto.Team, dao: HolderDao) -> str:
-    votes = await get_vote_to_voted(team, dao.waiver_vote_getter)
+async def get_list_pool(team: dto.Team, game: dto.Game, dao: WaiverVoteGetter) -> str:
+    votes = await get_vote_to_voted(game, team, dao)
     return render_votes(votes)
 
 
 async def start_approve_waivers(game: dto.Game, team: dto.Team, dao: HolderDao):
-    votes = await get_vote_to_voted(team=team, dao=dao.waiver_vote_getter)
+    votes = await get_vote_to_voted(game=game, team=team, dao=dao.waiver_vote_getter)
     return dict(
         text=f"Играющие в {hd.quote(game.name)} схватчики команды {hd.bold(hd.quote(team.name))}:",
         reply_markup=kb.get_kb_manage_waivers(
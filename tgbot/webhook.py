@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import secrets
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import setup_application
+from aiohttp import web
+
+from tgbot.config.models.bot import WebhookConfig
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+TELEGRAM_MAX_CONNECTIONS = 100
+
+
+class WebhookUpdatesHandler:
+    """
+    Принимает апдейты и сразу отвечает telegram, обработка идёт в фоне.
+    Одновременно обрабатывается не больше max_concurrency апдейтов,
+    остальные ждут в очереди до max_queue, а переполнение отдаёт 503:
+    telegram повторит доставку позже, а не будет висеть на открытом соединении.
+    RedisEventIsolation диспетчера изолирует апдейты одного пользователя в чате,
+    а не всего чата, поэтому ключи разных игроков команды могут проверяться
+    одновременно на разных репликах - для вебхука локи проверки ключей в redis
+    """
+
+    def __init__(self, dp: Dispatcher, bot: Bot, config: WebhookConfig):
+        self.dp = dp
+        self.bot = bot
+        self.config = config
+        self.semaphore = asyncio.Semaphore(config.max_concurrency)
+        self.tasks: set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def is_saturated(self) -> bool:
+        return self.in_flight >= self.config.max_concurrency + self.config.max_queue
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if not check_secret(request, self.config):
+            return web.Response(status=401)
+        if self.is_saturated:
+            logger.warning("webhook saturated, %s updates in flight", self.in_flight)
+            return web.Response(status=503, headers={"Retry-After": "1"})
+        update = await request.json()
+        task = asyncio.create_task(self.process(update))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return web.Response()
+
+    async def process(self, update: dict[str, Any]) -> None:
+        async with self.semaphore:
+            try:
+                await self.dp.feed_raw_update(self.bot, update)
+            except Exception as e:
+                logger.exception("can't process update %s", update.get("update_id"), exc_info=e)
+
+    async def health(self, _: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "status": "saturated" if self.is_saturated else "ok",
+                "in_flight": self.in_flight,
+                "max_concurrency": self.config.max_concurrency,
+                "max_queue": self.config.max_queue,
+            },
+            status=503 if self.is_saturated else 200,
+        )
+
+    async def close(self, _: web.Application) -> None:
+        """дожидаемся уже принятых апдейтов - telegram их повторно не пришлёт"""
+        if self.tasks:
+            await asyncio.wait(self.tasks)
+
+
+def check_secret(request: web.Request, config: WebhookConfig) -> bool:
+    if not config.secret:
+        return True
+    return secrets.compare_digest(request.headers.get(SECRET_HEADER, ""), config.secret)
+
+
+def create_webhook_app(dp: Dispatcher, bot: Bot, config: WebhookConfig) -> web.Application:
+    app = web.Application()
+    handler = WebhookUpdatesHandler(dp=dp, bot=bot, config=config)
+    app.router.add_post(config.path, handler.handle)
+    app.router.add_get(config.health_path, handler.health)
+    app.on_shutdown.append(handler.close)
+    setup_application(app, dp, bot=bot)
+    return app
+
+
+async def set_webhook(bot: Bot, config: WebhookConfig) -> None:
+    # все реплики ставят один и тот же url, поэтому вызов идемпотентен,
+    # а при остановке вебхук не снимаем - остальные реплики продолжают работать
+    await bot.set_webhook(
+        url=config.full_url,
+        secret_token=config.secret,
+        max_connections=min(config.max_concurrency, TELEGRAM_MAX_CONNECTIONS),
+    )
+
+
+async def serve(app: web.Application, config: WebhookConfig) -> None:
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host=config.host, port=config.port)
+    await site.start()
+    logger.info("webhook listening on %s:%s%s", config.host, config.port, config.path)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+async def run_webhook(dp: Dispatcher, bot: Bot, config: WebhookConfig) -> None:
+    await set_webhook(bot, config)
+    await serve(create_webhook_app(dp, bot, config), config)
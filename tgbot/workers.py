@@ -0,0 +1,181 @@
+"""
+Режим нескольких процессов: супервизор принимает апдейты (polling или webhook)
+и раскладывает их по воркерам консистентным хэшированием id чата.
+Апдейты одного чата всегда попадают в один и тот же воркер,
+поэтому его память (кэши опросов) остаётся тёплой,
+а обработка разных команд идёт на разных ядрах.
+Локи проверки ключей при этом в redis: лок игры (финиш последних команд)
+общий для команд, которые обрабатываются разными воркерами.
+"""
+import asyncio
+import logging
+import multiprocessing
+import queue
+from contextlib import suppress
+from multiprocessing.context import SpawnProcess
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiohttp import web
+
+from common.config.parser.logging_config import setup_logging
+from tgbot.config.models.main import TgBotConfig
+from tgbot.config.parser.main import load_config
+from tgbot.main_factory import bot_environment, create_bot, get_paths
+from tgbot.utils.sharding import HashRing, get_chat_id
+from tgbot.webhook import check_secret, set_webhook, serve
+
+logger = logging.getLogger(__name__)
+
+WORKER_QUEUE_SIZE = 1000
+WORKER_CONCURRENCY = 100
+POLLING_TIMEOUT = 30
+SUPERVISE_INTERVAL = 5
+
+
+class ShardedIntake:
+    def __init__(self, queues: list[multiprocessing.Queue]):
+        self.queues = queues
+        self.ring = HashRing(len(queues))
+
+    def get_queue(self, update: dict[str, Any]) -> multiprocessing.Queue:
+        return self.queues[self.ring.get_node(get_chat_id(update))]
+
+    def put_nowait(self, update: dict[str, Any]) -> bool:
+        try:
+            self.get_queue(update).put_nowait(update)
+        except queue.Full:
+            return False
+        return True
+
+    async def put(self, update: dict[str, Any]) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.get_queue(update).put, update)
+
+
+class Supervisor:
+    def __init__(self, config: TgBotConfig):
+        self.config = config
+        self.context = multiprocessing.get_context("spawn")
+        self.queues = [
+            self.context.Queue(maxsize=WORKER_QUEUE_SIZE) for _ in range(config.bot.workers)
+        ]
+        self.processes: list[SpawnProcess | None] = [None] * config.bot.workers
+        self.intake = ShardedIntake(self.queues)
+
+    def start_worker(self, index: int) -> None:
+        process = self.context.Process(
+            target=run_worker, args=(index, self.queues[index]), name=f"bot-worker-{index}"
+        )
+        process.start()
+        self.processes[index] = process
+
+    async def supervise(self) -> None:
+        """упавший воркер перезапускается, его очередь за это время не теряется"""
+        while True:
+            for index, process in enumerate(self.processes):
+                if process is None or not process.is_alive():
+                    if process is not None:
+                        logger.error("worker %s exited with %s", index, process.exitcode)
+                    self.start_worker(index)
+            await asyncio.sleep(SUPERVISE_INTERVAL)
+
+    def stop(self) -> None:
+        for q in self.queues:
+            with suppress(queue.Full):
+                q.put(None, timeout=SUPERVISE_INTERVAL)
+        for process in self.processes:
+            if process is not None:
+                process.join(timeout=30)
+
+    async def poll(self, bot: Bot) -> None:
+        offset = None
+        while True:
+            try:
+                updates = await bot.get_updates(offset=offset, timeout=POLLING_TIMEOUT)
+            except Exception as e:
+                logger.exception("can't get updates", exc_info=e)
+                await asyncio.sleep(1)
+                continue
+            for update in updates:
+                # очередь воркера полна - ждём, telegram придержит остальное
+                await self.intake.put(update.dict(by_alias=True, exclude_none=True))
+                offset = update.update_id + 1
+
+    async def handle_webhook(self, request: web.Request) -> web.Response:
+        assert self.config.bot.webhook
+        if not check_secret(request, self.config.bot.webhook):
+            return web.Response(status=401)
+        if not self.intake.put_nowait(await request.json()):
+            return web.Response(status=503, headers={"Retry-After": "1"})
+        return web.Response()
+
+    async def health(self, _: web.Request) -> web.Response:
+        alive = [process is not None and process.is_alive() for process in self.processes]
+        return web.json_response(
+            {"status": "ok" if all(alive) else "degraded", "workers": alive},
+            status=200 if all(alive) else 503,
+        )
+
+
+async def run_supervisor(config: TgBotConfig) -> None:
+    supervisor = Supervisor(config)
+    supervise = asyncio.create_task(supervisor.supervise())
+    bot = create_bot(config)
+    logger.info("started supervisor with %s workers", config.bot.workers)
+    try:
+        if webhook := config.bot.webhook:
+            app = web.Application()
+            app.router.add_post(webhook.path, supervisor.handle_webhook)
+            app.router.add_get(webhook.health_path, supervisor.health)
+            await set_webhook(bot, webhook)
+            await serve(app, webhook)
+        else:
+            await bot.delete_webhook()
+            await supervisor.poll(bot)
+    finally:
+        supervise.cancel()
+        await bot.session.close()
+        supervisor.stop()
+        logger.info("stopped supervisor")
+
+
+def run_worker(index: int, updates: multiprocessing.Queue) -> None:
+    paths = get_paths()
+    setup_logging(paths)
+    config = load_config(paths)
+    asyncio.run(_run_worker(index, updates, config))
+
+
+async def _run_worker(index: int, updates: multiprocessing.Queue, config: TgBotConfig) -> None:
+    # задачи планировщика и живого шпиона выполняет воркер-лидер
+    async with bot_environment(config) as (dp, bot):
+        await dp.emit_startup(bot=bot, dispatcher=dp, **dp.workflow_data)
+        logger.info("worker %s started", index)
+        try:
+            await consume(dp, bot, updates)
+        finally:
+            await dp.emit_shutdown(bot=bot, dispatcher=dp, **dp.workflow_data)
+            logger.info("worker %s stopped", index)
+
+
+async def consume(dp: Dispatcher, bot: Bot, updates: multiprocessing.Queue) -> None:
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(WORKER_CONCURRENCY)
+    tasks: set[asyncio.Task] = set()
+
+    async def process(update: dict[str, Any]) -> None:
+        try:
+            await dp.feed_raw_update(bot, update)
+        except Exception as e:
+            logger.exception("can't process update %s", update.get("update_id"), exc_info=e)
+        finally:
+            semaphore.release()
+
+    while (update := await loop.run_in_executor(None, updates.get)) is not None:
+        await semaphore.acquire()
+        task = asyncio.create_task(process(update))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.wait(tasks)